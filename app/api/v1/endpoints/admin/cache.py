@@ -5,10 +5,6 @@ from typing import Dict, Any
 
 from app.core.validators import validate_video_id
 from app.core.cache_redis import (
-    delete_cached_key,
-    get_cached_value,
-    get_cached_timestamp,
-    has_cached_key,
     clear_cache,
     get_cache_stats,
 )
@@ -52,7 +48,10 @@ async def clear_all_stream_cache(
     _verified: None = Depends(verify_admin_key),
 ) -> CacheClearResponse:
     """Limpia todo el cache de streams."""
+    from app.services.stream_service import StreamService
+    
     await clear_cache("music:stream")
+    await StreamService().invalidate_local_caches()
     return CacheClearResponse(status="cleared", pattern="music:stream")
 
 
@@ -77,26 +76,19 @@ async def get_stream_cache_info(
             videoId=video_id,
             cached={
                 "metadata": False,
-                "metadata_timestamp": 0,
                 "metadata_value": None,
                 "stream_url": False,
-                "url_timestamp": 0,
                 "url_value": None
             }
         )
     
-    metadata_key = f"music:stream:metadata:{video_id}"
-    stream_url_key = f"music:stream:url:{video_id}"
+    from app.services.stream_service import StreamService
+    service = StreamService()
     
     try:
-        metadata_exists = await has_cached_key(metadata_key)
-        url_exists = await has_cached_key(stream_url_key)
-        
-        metadata_timestamp = await get_cached_timestamp(metadata_key) if metadata_exists else 0
-        url_timestamp = await get_cached_timestamp(stream_url_key) if url_exists else 0
-        
-        metadata_cached = await get_cached_value(metadata_key) if metadata_exists else None
-        url_cached = await get_cached_value(stream_url_key) if url_exists else None
+        entry = await service.get_cached_stream_entry(video_id)
+        metadata_cached = entry.get("meta")
+        url_cached = entry.get("url")
         
         # Safe truncate for display
         url_display = None
@@ -106,12 +98,11 @@ async def get_stream_cache_info(
         return CacheInfoResponse(
             videoId=video_id,
             cached={
-                "metadata": metadata_exists,
-                "metadata_timestamp": metadata_timestamp,
+                "metadata": metadata_cached is not None,
                 "metadata_value": metadata_cached,
-                "stream_url": url_exists,
-                "url_timestamp": url_timestamp,
-                "url_value": url_display
+                "stream_url": url_cached is not None,
+                "url_value": url_display,
+                "url_expires_at": int(entry.get("url_exp", 0)),
             }
         )
     except Exception as e:
@@ -131,17 +122,16 @@ async def delete_stream_cache(
     _verified: None = Depends(verify_admin_key),
 ) -> CacheDeleteResponse:
     """Elimina el cache para un video."""
-    metadata_key = f"music:stream:metadata:{video_id}"
-    stream_url_key = f"music:stream:url:{video_id}"
+    from app.services.stream_service import StreamService
     
-    deleted_metadata = await delete_cached_key(metadata_key)
-    deleted_url = await delete_cached_key(stream_url_key)
+    # Metadata and stream URL share one hash, so they are deleted together
+    deleted = await StreamService().delete_cached_stream(video_id)
     
     return CacheDeleteResponse(
         videoId=video_id,
         deleted={
-            "metadata": deleted_metadata > 0,
-            "stream_url": deleted_url > 0
+            "metadata": deleted,
+            "stream_url": deleted
         }
     )
 
@@ -161,19 +151,10 @@ async def get_stream_status(
     from app.services.stream_service import StreamService
     service = StreamService()
     
-    # 1. Check cache info
-    stream_url_key = f"music:stream:url:{video_id}"
-    exists = await has_cached_key(stream_url_key)
-    timestamp = await get_cached_timestamp(stream_url_key) if exists else 0
-    
-    # 2. Check metadata
-    metadata_key = f"music:stream:metadata:{video_id}"
-    meta_exists = await has_cached_key(metadata_key)
+    ttl_seconds = await service.get_cache_ttl(video_id)
     
     return StreamCacheStatusResponse(
         videoId=video_id,
-        is_cached=exists,
-        cached_at=timestamp,
-        has_metadata=meta_exists,
-        ttl_seconds=await service.get_stream_ttl(video_id)
+        cached=ttl_seconds > 0,
+        expiresIn=ttl_seconds
     )
@@ -1,6 +1,7 @@
 """Playlist endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
-from typing import Optional, Dict, Any
+from fastapi.responses import JSONResponse
+from typing import Optional, Dict, Any, Union
 from ytmusicapi import YTMusic
 
 from app.core.ytmusic_client import get_ytmusic
@@ -71,9 +72,13 @@ async def get_playlist(
         le=50,
         description="Número de URLs a obtener en paralelo (0 = none, -1 = todas)"
     ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos de cada track separados por coma (ej. videoId,title,artists,duration)"
+    ),
     service: PlaylistService = Depends(get_playlist_service),
     stream_service: StreamService = Depends(get_stream_service)
-) -> Dict[str, Any]:
+) -> Union[Dict[str, Any], JSONResponse]:
     """
     Obtiene información completa de una playlist pública con paginación estandarizada.
     
@@ -81,6 +86,7 @@ async def get_playlist(
     - `page`: Número de página (1 = primera página)
     - `page_size`: Items por página (default 10, máximo 50)
     - `prefetch_count`: Cuántos tracks enriquecer con stream URLs (default: 10, -1 = todos)
+    - `fields`: Devuelve solo estos campos por track (reduce el tamaño de la respuesta)
     
     Si `include_stream_urls=true` y `prefetch_count > 0`, los primeros N tracks incluyen:
     - `stream_url`: URL directa de audio (mejor calidad)
@@ -92,7 +98,8 @@ async def get_playlist(
         suggestions_limit=suggestions_limit,
         start_index=start_index,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        fields=frozenset(f.strip() for f in fields.split(",") if f.strip()) if fields else None
     )
 
     # Enrich tracks with stream URLs
@@ -115,4 +122,12 @@ async def get_playlist(
             playlist_data['stream_urls_prefetched'] = tracks_with_url
             playlist_data['stream_urls_total'] = len(enriched_tracks)
 
+    if fields:
+        # response_model would fill every dropped track field back in as
+        # null/[]; serialize through the same model but only the keys present
+        content = PlaylistResponse.model_validate(playlist_data).model_dump(
+            mode="json", by_alias=True, exclude_unset=True
+        )
+        return JSONResponse(content=content)
+
     return playlist_data
@@ -19,6 +19,7 @@ router = APIRouter()
 _recent_requests: Dict[str, tuple] = {}
 _request_lock = asyncio.Lock()
 _REQUEST_TTL = 5  # Cache en memoria por 5 segundos para evitar llamadas duplicadas
+_BACKGROUND_PREFETCH = 3  # Siguientes tracks sin stream URL que se calientan en segundo plano
 
 
 async def _cleanup_old_requests():
@@ -147,11 +148,13 @@ async def get_watch_playlist(
     )
 
     # Enrich tracks with stream URLs
+    tracks = playlist_data.get('items') or []
+    upcoming_tracks = tracks
     if include_stream_urls and prefetch_count != 0:
-        tracks = playlist_data.get('items') or []
         if tracks:
             tracks_to_enrich = tracks if prefetch_count == -1 else tracks[:prefetch_count]
             tracks_remaining = [] if prefetch_count == -1 else tracks[prefetch_count:]
+            upcoming_tracks = tracks_remaining
 
             if tracks_to_enrich:
                 enriched_tracks = await stream_service.enrich_items_with_streams(
@@ -167,6 +170,13 @@ async def get_watch_playlist(
                 playlist_data['stream_urls_prefetched'] = tracks_with_url
                 playlist_data['stream_urls_total'] = len(enriched_tracks)
 
+    # Las siguientes canciones casi seguro se reproducen después: calentar su
+    # stream URL sin hacer esperar la respuesta
+    stream_service.prefetch_stream_urls([
+        vid for track in upcoming_tracks[:_BACKGROUND_PREFETCH]
+        if (vid := track.get('videoId'))
+    ])
+
     # Guardar en cache en memoria para deduplicación
     async with _request_lock:
         _recent_requests[request_key] = (current_time, playlist_data)
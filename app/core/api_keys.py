@@ -1,10 +1,11 @@
 """API Keys management system with Redis backend."""
 import secrets
-import json
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
+import orjson
+
 from app.core.config import get_settings
 settings = get_settings()
 from app.core.cache_redis import get_redis_client
@@ -129,7 +130,7 @@ class APIKeyManager:
             for key in keys:
                 data = await client.get(key)
                 if data:
-                    api_key_obj = APIKey.from_dict(json.loads(data))
+                    api_key_obj = APIKey.from_dict(orjson.loads(data))
                     if api_key_obj.api_key == api_key:
                         return api_key_obj
             
@@ -145,7 +146,7 @@ class APIKeyManager:
             data = await client.get(f"{API_KEYS_PREFIX}{key_id}")
             
             if data:
-                return APIKey.from_dict(json.loads(data))
+                return APIKey.from_dict(orjson.loads(data))
             return None
         except Exception as e:
             logger.error(f"Error getting API key by ID: {e}")
@@ -163,7 +164,7 @@ class APIKeyManager:
             for key in keys:
                 data = await client.get(key)
                 if data:
-                    api_keys.append(APIKey.from_dict(json.loads(data)))
+                    api_keys.append(APIKey.from_dict(orjson.loads(data)))
             
             return sorted(api_keys, key=lambda k: k.created_at, reverse=True)
         except Exception as e:
@@ -230,7 +231,7 @@ class APIKeyManager:
             client = await get_redis_client()
             await client.set(
                 f"{API_KEYS_PREFIX}{api_key.key_id}",
-                json.dumps(api_key.to_dict()),
+                orjson.dumps(api_key.to_dict()),
             )
         except Exception as e:
             logger.error(f"Error saving API key: {e}")
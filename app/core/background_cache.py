@@ -6,8 +6,7 @@ Background tasks for cache management.
 """
 import asyncio
 import logging
-import time
-from typing import List, Set
+from typing import Any, Dict, List, Set
 from datetime import datetime, timedelta
 
 from app.services.stream_service import StreamService
@@ -15,16 +14,21 @@ from app.services.explore_service import ExploreService
 from app.services.search_service import SearchService
 from app.services.browse_service import BrowseService
 from app.services.playlist_service import PlaylistService
+from app.core.config import get_settings
 from app.core.cache_redis import (
     get_cached_value,
-    get_cached_timestamp,
     has_cached_key,
     get_cache_stats,
     get_active_streams,
     set_cached_value,
+    set_cached_values,
 )
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Concurrent get_playlist calls while warming hot playlists
+HOT_PLAYLIST_CONCURRENCY = 4
 
 
 class CacheManager:
@@ -55,6 +59,7 @@ class CacheManager:
             "last_full_refresh": None,
             "endpoint_warming": 0,
             "genre_warming": 0,
+            "playlist_warming": 0,
             "items_warmed_total": 0,
             "genres_processed": [],
         }
@@ -81,6 +86,7 @@ class CacheManager:
         while self._running:
             try:
                 logger.info("🔥 Starting periodic cache warm-up...")
+                await self._warm_hot_playlists()
                 await self._warm_cache()
                 await self._warm_endpoint_cache()
                 await self._warm_genres_cache()
@@ -92,6 +98,39 @@ class CacheManager:
                 logger.error(f"Error in periodic warm-up: {e}")
                 await asyncio.sleep(300) # Reintentar en 5 min si falla
 
+    async def _warm_hot_playlists(self):
+        """Pre-cachea las playlists configuradas en HOT_PLAYLIST_IDS."""
+        playlist_ids = [p.strip() for p in settings.HOT_PLAYLIST_IDS.split(",") if p.strip()]
+        if not playlist_ids:
+            return
+        
+        logger.info(f"Warming {len(playlist_ids)} hot playlists...")
+        try:
+            from app.core.browser_client import get_ytmusic
+            playlist_svc = PlaylistService(get_ytmusic())
+        except Exception as e:
+            logger.warning(f"YTMusic not available. Skipping hot playlists: {e}")
+            return
+        
+        semaphore = asyncio.Semaphore(HOT_PLAYLIST_CONCURRENCY)
+        
+        async def warm_playlist(playlist_id: str) -> None:
+            # Default arguments, so the entry matches a plain GET /playlists/{id}
+            async with semaphore:
+                await playlist_svc.get_playlist(playlist_id)
+        
+        results = await asyncio.gather(
+            *(warm_playlist(p_id) for p_id in playlist_ids),
+            return_exceptions=True
+        )
+        warmed = sum(1 for r in results if not isinstance(r, Exception))
+        for p_id, r in zip(playlist_ids, results):
+            if isinstance(r, Exception):
+                logger.debug(f"Error warming playlist {p_id}: {r}")
+        
+        self.metrics["playlist_warming"] = warmed
+        logger.info(f"Hot playlists warmed: {warmed}/{len(playlist_ids)}")
+
     async def _warm_genres_cache(self):
         """Pre-cachea contenido de diversos géneros musicales."""
         logger.info("Warming genres cache...")
@@ -112,26 +151,29 @@ class CacheManager:
             import random
             selected_genres = random.sample(genre_list, min(len(genre_list), 5))
             
-            all_genre_songs = []
             self.metrics["genres_processed"] = [g.get("title") for g in selected_genres]
+            playlist_svc = PlaylistService(ytmusic)
             
-            for genre in selected_genres:
+            async def fetch_genre_songs(genre: Dict[str, Any]) -> List[Dict[str, Any]]:
                 params = genre.get("params")
-                title = genre.get("title")
-                
-                if params:
-                    try:
-                        playlists = await explore_svc.get_mood_playlists(params, page_size=2)
-                        items = playlists.get("items", [])
-                        if items:
-                            # Tomar la primera playlist de cada género
-                            p_id = items[0].get("playlistId") or items[0].get("browseId")
-                            if p_id:
-                                playlist_svc = PlaylistService(ytmusic)
-                                p_data = await playlist_svc.get_playlist(p_id, page_size=5)
-                                all_genre_songs.extend(p_data.get("items", []))
-                    except Exception as ge:
-                        logger.debug(f"Error warming genre {title}: {ge}")
+                if not params:
+                    return []
+                try:
+                    playlists = await explore_svc.get_mood_playlists(params, page_size=2)
+                    items = playlists.get("items", [])
+                    if items:
+                        # Tomar la primera playlist de cada género
+                        p_id = items[0].get("playlistId") or items[0].get("browseId")
+                        if p_id:
+                            p_data = await playlist_svc.get_playlist(p_id, page_size=5)
+                            return p_data.get("items", [])
+                except Exception as ge:
+                    logger.debug(f"Error warming genre {genre.get('title')}: {ge}")
+                return []
+            
+            # Los géneros son independientes: consultarlos en paralelo
+            genre_songs = await asyncio.gather(*(fetch_genre_songs(g) for g in selected_genres))
+            all_genre_songs = [song for songs in genre_songs for song in songs]
             
             if all_genre_songs:
                 video_ids = list(set([s.get("videoId") for s in all_genre_songs if s.get("videoId")]))[:30]
@@ -265,16 +307,21 @@ class CacheManager:
         
         # Cache search suggestions for common queries
         common_queries = ["rock", "pop", "cumbia", "salsa", "reggaeton", "latin", "trap"]
+        suggestion_entries = []
         for q in common_queries:
             try:
                 cache_key = f"music:endpoint:search:suggestions:{q}"
                 if not await has_cached_key(cache_key):
                     suggestions = await search_svc.get_search_suggestions(q)
-                    await set_cached_value(cache_key, {"suggestions": suggestions}, ttl=600)
-                    endpoints_cached += 1
+                    suggestion_entries.append((cache_key, {"suggestions": suggestions}, 600))
             except Exception as e:
                 logger.debug(f"Failed to cache search suggestions for {q}: {e}")
         
+        # Write all suggestions in one pipelined round trip
+        if suggestion_entries:
+            await set_cached_values(suggestion_entries)
+            endpoints_cached += len(suggestion_entries)
+        
         self.metrics["endpoint_warming"] = endpoints_cached
         logger.info(f"Endpoint cache warming complete. Cached: {endpoints_cached} endpoints")
     
@@ -321,13 +368,9 @@ class CacheManager:
                     continue
                 
                 try:
-                    cache_key = f"music:stream:url:{vid}"
+                    ttl_remaining = await self.stream_service.get_cache_ttl(vid)
                     
-                    if await has_cached_key(cache_key):
-                        timestamp = await get_cached_timestamp(cache_key)
-                        elapsed = time.time() - timestamp
-                        ttl_remaining = self.stream_service.STREAM_URL_TTL - elapsed
-                        
+                    if ttl_remaining > 0:
                         # Refresh if less than 1 hour remaining
                         if ttl_remaining < self._refresh_threshold:
                             logger.info(f"Refreshing {vid} (ttl remaining: {int(ttl_remaining/60)}min)")
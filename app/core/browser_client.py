@@ -6,9 +6,11 @@ import random
 import time
 import contextvars
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
 
+import requests
 from fastapi import HTTPException
+from requests.adapters import HTTPAdapter
 from ytmusicapi import YTMusic
 from app.core.config import get_settings
 
@@ -35,8 +37,8 @@ class BrowserAccount:
         self.success_count = 0
         self.rate_limited_until = 0.0
         self.total_requests = 0
-        # Semaphore to limit concurrent requests per account
-        self.semaphore = asyncio.Semaphore(1) # Reduced to 1 for maximum stability
+        # Semaphore to limit concurrent requests per account (1 by default for maximum stability)
+        self.semaphore = asyncio.Semaphore(settings.YTMUSIC_ACCOUNT_CONCURRENCY)
     
     def is_available(self) -> bool:
         """Check if this account can be used."""
@@ -187,10 +189,33 @@ def get_browser_manager() -> BrowserClientManager:
     return _browser_manager
 
 
+class _TimeoutSession(requests.Session):
+    """Session applying a default timeout to requests that don't set one."""
+
+    # Same default timeout ytmusicapi applies to the sessions it creates itself
+    DEFAULT_TIMEOUT = 30
+
+    def request(self, method: Any, url: Any, *args: Any, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
+        return super().request(method, url, *args, **kwargs)
+
+
+def _create_session() -> requests.Session:
+    """Create the HTTP session for a YTMusic client.
+    
+    ytmusicapi is synchronous and runs on the ytmusic thread pool, so the
+    keep-alive pool is sized to that pool instead of requests' default of 10;
+    otherwise extra threads open (and then discard) fresh TLS connections.
+    """
+    session = _TimeoutSession()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=settings.YTMUSIC_THREADS))
+    return session
+
+
 def _create_client(account: BrowserAccount) -> Optional[YTMusic]:
     """Create a YTMusic client from a browser account."""
     try:
-        client = YTMusic(str(account.path))
+        client = YTMusic(str(account.path), requests_session=_create_session())
         account.clear_errors()
         logger.info(f"Created YTMusic client for account: {account.name}")
         return client
@@ -227,8 +252,9 @@ def get_ytmusic() -> YTMusic:
     # Store current account in context for error reporting
     current_account_var.set(account)
     
-    cache_key = account.name
-    if cache_key not in _client_cache:
+    # Clients are built (browser.json parsed) once per account and reused
+    client = _client_cache.get(account.name)
+    if client is None:
         client = _create_client(account)
         if client is None:
             raise HTTPException(
@@ -239,9 +265,9 @@ def get_ytmusic() -> YTMusic:
                     "message": f"No se pudo crear cliente para cuenta {account.name}",
                 },
             )
-        _client_cache[cache_key] = client
+        _client_cache[account.name] = client
     
-    return _client_cache[cache_key]
+    return client
 
 
 def get_ytmusic_with_account(account_name: str) -> YTMusic:
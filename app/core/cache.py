@@ -4,13 +4,13 @@ from app.core.cache_redis import (
     get_cache_key,
     get_cached_value,
     set_cached_value,
-    get_cached_timestamp,
     get_cached_ttl,
     has_cached_key,
     delete_cached_key,
     clear_cache,
     get_cache_stats,
     cache_result,
+    cache_primer,
     settings,
 )
 
@@ -19,12 +19,12 @@ __all__ = [
     "get_cache_key",
     "get_cached_value",
     "set_cached_value",
-    "get_cached_timestamp",
     "get_cached_ttl",
     "has_cached_key",
     "delete_cached_key",
     "clear_cache",
     "get_cache_stats",
     "cache_result",
+    "cache_primer",
     "settings",
 ]
\ No newline at end of file
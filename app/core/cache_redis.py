@@ -1,20 +1,46 @@
 """Redis-based caching utilities for API responses."""
 import redis.asyncio as redis
+import asyncio
 import hashlib
-import json
+import inspect
 import logging
 import time
-from typing import Any, Callable, Dict, List, Optional
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from functools import wraps
+
+import orjson
 from app.core.config import get_settings
+from app.core.exceptions import ResourceNotFoundError
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
 # Global Redis connection pool
-_redis_pool: Optional[redis.ConnectionPool] = None
+_redis_pool: Optional[redis.BlockingConnectionPool] = None
 _redis_client: Optional[redis.Redis] = None
 
+# In-flight cache_result computations by cache key (single-flight on misses)
+_inflight: Dict[str, asyncio.Task] = {}
+
+# Marker key for cached "not found" results (negative caching)
+_NOT_FOUND_MARKER = "__not_found__"
+
+# Cross-worker single-flight: how long a compute lock lives and how often peers poll
+_LOCK_TTL = 30
+_LOCK_POLL_INTERVAL = 0.1
+
+# Delete the lock only if it still holds the caller's token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# orjson only accepts str dict keys by default; ytmusicapi payloads may not
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
 
 async def get_redis_client() -> redis.Redis:
     """Get or create Redis client."""
@@ -26,13 +52,16 @@ async def get_redis_client() -> redis.Redis:
         
         logger.info(f"Connecting to Redis at {redis_host}:{redis_port}")
         
-        _redis_pool = redis.ConnectionPool(
+        # Blocking pool: bursts wait for a free connection instead of failing;
+        # replies are parsed by hiredis when it is installed
+        _redis_pool = redis.BlockingConnectionPool(
             host=redis_host,
             port=redis_port,
             db=settings.REDIS_DB or 0,
             password=settings.REDIS_PASSWORD or None,
             decode_responses=True,
-            max_connections=200,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=5,
             socket_keepalive=True,
             socket_connect_timeout=5,
         )
@@ -57,14 +86,21 @@ async def close_redis():
     _redis_pool = None
 
 
+def _cache_key_default(value: Any) -> Any:
+    """Serialize values orjson does not handle natively, keeping sets order-independent."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
 def get_cache_key(*args, **kwargs) -> str:
     """Generate cache key from function arguments."""
     key_data = {
         "args": args,
         "kwargs": sorted(kwargs.items())
     }
-    key_str = json.dumps(key_data, sort_keys=True, default=str)
-    return hashlib.md5(key_str.encode()).hexdigest()
+    key_bytes = orjson.dumps(key_data, default=_cache_key_default, option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS)
+    return hashlib.md5(key_bytes).hexdigest()
 
 
 async def get_cached_value(key: str) -> Optional[Any]:
@@ -77,7 +113,7 @@ async def get_cached_value(key: str) -> Optional[Any]:
         value = await client.get(key)
         if value:
             logger.debug(f"Cache HIT: {key}")
-            return json.loads(value)
+            return orjson.loads(value)
         logger.debug(f"Cache MISS: {key}")
     except Exception as e:
         logger.warning(f"Error getting cached value for {key}: {e}")
@@ -88,44 +124,114 @@ async def set_cached_value(key: str, value: Any, ttl: int = 3600) -> None:
     """
     Set a cached value in Redis with TTL.
     
-    Also stores a timestamp key for TTL checking.
+    Expiry is left to Redis: a missing key is an expired one.
     """
-    if not settings.CACHE_ENABLED:
+    await set_cached_values([(key, value, ttl)])
+
+
+async def set_cached_values(entries: list[tuple[str, Any, int]]) -> None:
+    """
+    Set several cached values in one pipelined round trip.
+    
+    Args:
+        entries: List of (key, value, ttl) tuples
+    """
+    if not settings.CACHE_ENABLED or not entries:
         return
     
     try:
         client = await get_redis_client()
         
-        # Store the value with TTL
-        await client.set(key, json.dumps(value), ex=ttl)
-        
-        # Store timestamp for this key (same TTL)
-        # This allows us to check when the value was cached
-        timestamp_key = f"{key}:timestamp"
-        current_time = time.time()
-        await client.set(timestamp_key, str(current_time), ex=ttl)
+        pipe = client.pipeline(transaction=False)
+        for key, value, ttl in entries:
+            pipe.set(key, orjson.dumps(value, option=_ORJSON_OPTIONS), ex=ttl)
+        await pipe.execute()
         
-        logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
+        for key, _, ttl in entries:
+            logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
     except Exception as e:
-        logger.warning(f"Error setting cached value for {key}: {e}")
+        logger.warning(f"Error setting cached values for {[key for key, _, _ in entries]}: {e}")
 
 
-async def get_cached_timestamp(key: str) -> float:
+async def get_cached_value_with_ttl(key: str) -> tuple[Optional[Any], int]:
     """
-    Get the timestamp when a cached value was set.
+    Get a cached value and its remaining TTL in one pipelined round trip.
     
     Returns:
-        Unix timestamp when the value was cached, or 0 if not found.
+        Tuple of (value or None, seconds until Redis expires the key; <= 0 if unknown).
     """
+    if not settings.CACHE_ENABLED:
+        return None, 0
+    
     try:
         client = await get_redis_client()
-        timestamp_key = f"{key}:timestamp"
-        timestamp = await client.get(timestamp_key)
-        if timestamp:
-            return float(timestamp)
+        pipe = client.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.ttl(key)
+        value, remaining = await pipe.execute()
+        if value:
+            logger.debug(f"Cache HIT: {key}")
+            return orjson.loads(value), remaining
+        logger.debug(f"Cache MISS: {key}")
     except Exception as e:
-        logger.warning(f"Error getting timestamp for {key}: {e}")
-    return 0
+        logger.warning(f"Error getting cached value for {key}: {e}")
+    return None, 0
+
+
+async def get_cached_hash_fields(keys: list[str], fields: list[str]) -> list[dict[str, Any]]:
+    """
+    Read the same fields from several cached hashes in one pipelined round trip.
+    
+    Args:
+        keys: Hash keys to read
+        fields: Field names to fetch from each hash
+        
+    Returns:
+        One dict per key, in order, mapping field -> value (missing fields omitted).
+    """
+    if not settings.CACHE_ENABLED or not keys:
+        return [{} for _ in keys]
+    
+    try:
+        client = await get_redis_client()
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.hmget(key, fields)
+        rows = await pipe.execute()
+        
+        return [
+            {field: orjson.loads(raw) for field, raw in zip(fields, row) if raw is not None}
+            for row in rows
+        ]
+    except Exception as e:
+        logger.warning(f"Error getting cached hash fields for {len(keys)} keys: {e}")
+        return [{} for _ in keys]
+
+
+async def set_cached_hash_fields(key: str, fields: dict[str, Any], ttl: int) -> None:
+    """
+    Set fields on a cached hash and reset its TTL in one pipelined round trip.
+    
+    Args:
+        key: Hash key
+        fields: Mapping of field -> value (serialized with orjson)
+        ttl: Expiry of the whole hash in seconds
+    """
+    if not settings.CACHE_ENABLED or not fields:
+        return
+    
+    try:
+        client = await get_redis_client()
+        pipe = client.pipeline(transaction=False)
+        pipe.hset(key, mapping={
+            field: orjson.dumps(value, option=_ORJSON_OPTIONS) for field, value in fields.items()
+        })
+        pipe.expire(key, ttl)
+        await pipe.execute()
+        
+        logger.debug(f"Cache HSET: {key} {list(fields)} (TTL: {ttl}s)")
+    except Exception as e:
+        logger.warning(f"Error setting cached hash fields for {key}: {e}")
 
 
 async def get_cached_ttl(key: str) -> int:
@@ -177,40 +283,16 @@ async def get_cached_values_batch(keys: list[str]) -> dict[str, Optional[Any]]:
     
     try:
         client = await get_redis_client()
-        
-        # Get timestamp keys for TTL checking
-        timestamp_keys = [f"{key}:timestamp" for key in keys]
-        
-        # Single MGET for all values and timestamps
         values = await client.mget(keys)
-        timestamps = await client.mget(timestamp_keys)
         
         result = {}
-        current_time = time.time()
-        
-        for i, key in enumerate(keys):
-            value = values[i]
-            timestamp_str = timestamps[i]
-            
+        for key, value in zip(keys, values):
             if value is None:
                 result[key] = None
                 continue
-            
-            # Check if expired
-            if timestamp_str:
-                try:
-                    timestamp = float(timestamp_str)
-                    # Default TTL for stream URLs is 5 hours (18000s)
-                    ttl = 18000
-                    if (current_time - timestamp) >= ttl:
-                        result[key] = None
-                        continue
-                except (ValueError, TypeError):
-                    pass
-            
             try:
-                result[key] = json.loads(value)
-            except (json.JSONDecodeError, TypeError):
+                result[key] = orjson.loads(value)
+            except (orjson.JSONDecodeError, TypeError):
                 result[key] = value
         
         return result
@@ -219,69 +301,89 @@ async def get_cached_values_batch(keys: list[str]) -> dict[str, Optional[Any]]:
         return {key: None for key in keys}
 
 
-async def get_cached_values_batch_with_ttl(keys: list[str], ttl: int = 18000) -> dict[str, Optional[Any]]:
+async def delete_cached_key(key: str) -> bool:
+    """Delete a key from cache; True if it existed."""
+    try:
+        client = await get_redis_client()
+        return await client.delete(key) > 0
+    except Exception as e:
+        logger.warning(f"Error deleting cache key {key}: {e}")
+    return False
+
+
+async def get_cache_generation(key: str) -> Optional[int]:
+    """Get an invalidation counter (0 if never bumped); None if Redis is unavailable."""
+    try:
+        client = await get_redis_client()
+        value = await client.get(key)
+        return int(value) if value is not None else 0
+    except Exception as e:
+        logger.warning(f"Error getting cache generation {key}: {e}")
+    return None
+
+
+async def bump_cache_generation(key: str) -> None:
+    """Increment an invalidation counter so every worker drops its local copies."""
+    try:
+        client = await get_redis_client()
+        await client.incr(key)
+    except Exception as e:
+        logger.warning(f"Error bumping cache generation {key}: {e}")
+
+
+async def acquire_cache_lock(key: str, ttl: int = _LOCK_TTL) -> Optional[str]:
     """
-    Get multiple cached values with custom TTL.
+    Try to take the cross-worker compute lock for a cache key (SET NX).
     
-    Args:
-        keys: List of cache keys to fetch
-        ttl: TTL in seconds (default 5 hours for stream URLs)
-        
     Returns:
-        Dict mapping key to cached value
+        A token identifying this holder (pass it to release_cache_lock), or
+        None if another worker holds the lock. Fails open: returns a token
+        when Redis is unavailable so the caller still computes.
     """
-    if not settings.CACHE_ENABLED or not keys:
-        return {}
+    token = uuid.uuid4().hex
+    try:
+        client = await get_redis_client()
+        if not await client.set(f"{key}:lock", token, nx=True, ex=ttl):
+            return None
+    except Exception as e:
+        logger.warning(f"Error acquiring cache lock for {key}: {e}")
+    return token
+
+
+async def release_cache_lock(key: str, token: str) -> None:
+    """
+    Release the compute lock taken with acquire_cache_lock.
     
+    Compare-and-delete: if the lock expired and another worker took it, that
+    worker's lock is left alone.
+    """
     try:
         client = await get_redis_client()
-        
-        timestamp_keys = [f"{key}:timestamp" for key in keys]
-        
-        values = await client.mget(keys)
-        timestamps = await client.mget(timestamp_keys)
-        
-        result = {}
-        current_time = time.time()
-        
-        for i, key in enumerate(keys):
-            value = values[i]
-            timestamp_str = timestamps[i]
-            
-            if value is None:
-                result[key] = None
-                continue
-            
-            if timestamp_str:
-                try:
-                    timestamp = float(timestamp_str)
-                    if (current_time - timestamp) >= ttl:
-                        result[key] = None
-                        continue
-                except (ValueError, TypeError):
-                    pass
-            
-            try:
-                result[key] = json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                result[key] = value
-        
-        return result
+        await client.eval(_RELEASE_LOCK_SCRIPT, 1, f"{key}:lock", token)
     except Exception as e:
-        logger.warning(f"Error getting cached values batch with TTL: {e}")
-        return {key: None for key in keys}
+        logger.warning(f"Error releasing cache lock for {key}: {e}")
 
 
-async def delete_cached_key(key: str) -> bool:
-    """Delete a key from cache."""
+async def _wait_for_peer(key: str) -> Optional[Any]:
+    """
+    Wait for another worker holding the compute lock to store the value.
+    
+    Returns:
+        The cached value, or None if the lock went away (or expired) without one.
+    """
+    deadline = time.monotonic() + _LOCK_TTL
     try:
         client = await get_redis_client()
-        # Delete both the key and its timestamp
-        await client.delete(key, f"{key}:timestamp")
-        return True
+        while time.monotonic() < deadline:
+            await asyncio.sleep(_LOCK_POLL_INTERVAL)
+            cached = await get_cached_value(key)
+            if cached is not None:
+                return cached
+            if not await client.exists(f"{key}:lock"):
+                break
     except Exception as e:
-        logger.warning(f"Error deleting cache key {key}: {e}")
-    return False
+        logger.warning(f"Error waiting for cache lock on {key}: {e}")
+    return None
 
 # ==========================================
 # Dynamic Stream Tracking for Background Refresh
@@ -374,40 +476,195 @@ async def get_cache_stats() -> dict:
 
 
 # Decorator for caching async functions
-def cache_result(ttl: Optional[int] = None):
+def cache_result(
+    ttl: Optional[int] = None,
+    stale_ttl: Optional[int] = None,
+    not_found_ttl: Optional[int] = None,
+    key_normalizers: Optional[Dict[str, Callable[[Any], Any]]] = None,
+):
     """
     Decorator to cache async function results in Redis.
     
+    Concurrent misses for the same key share a single underlying call
+    instead of each hitting YouTube Music. ``cache_primer(wrapped)`` returns
+    ``prime(value, *args, **kwargs)``, which seeds the entry for a given call.
+    
     Args:
         ttl: Time to live in seconds (defaults to settings.CACHE_TTL)
+        stale_ttl: Optional extra window after ttl during which the stale
+            value is still served while a background refresh runs
+            (stale-while-revalidate).
+        not_found_ttl: If set, ResourceNotFoundError is cached for this many
+            seconds and re-raised on hits without calling the function.
+        key_normalizers: Optional mapping of argument name to a function
+            applied to that argument before building the key, so equivalent
+            spellings (e.g. "VLPL..." and "PL...") share one entry.
     """
     def decorator(func: Callable):
+        signature = inspect.signature(func)
+        # Services are built per request; keep the bound instance out of the key
+        parameters = list(signature.parameters)
+        is_method = bool(parameters) and parameters[0] == "self"
+        # Plain parameters (no *args/**kwargs/positional-only) can be mapped by
+        # name directly, skipping Signature.bind on every call
+        simple_signature = all(
+            p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+            for p in signature.parameters.values()
+        )
+        positional_names = [
+            name for name, p in signature.parameters.items()
+            if p.kind is p.POSITIONAL_OR_KEYWORD
+        ]
+        defaults = {
+            name: p.default for name, p in signature.parameters.items()
+            if p.default is not p.empty
+        }
+        
+        def bind_arguments(args: tuple, kwargs: dict) -> dict:
+            if simple_signature and len(args) <= len(positional_names):
+                positional = dict(zip(positional_names, args))
+                arguments = {**defaults, **positional, **kwargs}
+                if len(arguments) == len(parameters) and positional.keys().isdisjoint(kwargs):
+                    return arguments
+            # Unusual signature or incomplete call: let bind map (or reject) it
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return dict(bound.arguments)
+        
+        def make_key(args: tuple, kwargs: dict) -> str:
+            # Positional, keyword and defaulted calls share one key
+            arguments = bind_arguments(args, kwargs)
+            if is_method:
+                arguments.pop("self")
+            if key_normalizers:
+                for name, normalize in key_normalizers.items():
+                    arguments[name] = normalize(arguments[name])
+            return f"music:{func.__name__}:{get_cache_key(**arguments)}"
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
             if not settings.CACHE_ENABLED:
                 return await func(*args, **kwargs)
             
-            # Generate cache key
-            cache_key = f"music:{func.__name__}:{get_cache_key(*args, **kwargs)}"
+            cache_key = make_key(args, kwargs)
             cache_ttl = ttl or settings.CACHE_TTL
+            store_ttl = cache_ttl + (stale_ttl or 0)
             
             # Check Redis cache
-            cached = await get_cached_value(cache_key)
-            if cached is not None:
-                return cached
+            if stale_ttl:
+                cached, remaining = await get_cached_value_with_ttl(cache_key)
+                if cached is not None:
+                    _raise_if_not_found_marker(cached)
+                    # Stored for ttl + stale_ttl, so the last stale_ttl seconds are stale
+                    if remaining <= stale_ttl:
+                        # Past the fresh window: serve stale, refresh in the background
+                        _get_or_start_inflight(
+                            func, args, kwargs, cache_key, store_ttl, not_found_ttl
+                        )
+                    return cached
+            else:
+                cached = await get_cached_value(cache_key)
+                if cached is not None:
+                    _raise_if_not_found_marker(cached)
+                    return cached
             
-            # Execute function and cache result
-            try:
-                result = await func(*args, **kwargs)
-            except Exception:
-                # Don't cache errors
-                raise
-            
-            # Store in Redis
-            await set_cached_value(cache_key, result, cache_ttl)
+            task = _get_or_start_inflight(
+                func, args, kwargs, cache_key, store_ttl, not_found_ttl
+            )
             
-            return result
+            # Shield so one cancelled caller does not cancel the shared call
+            return await asyncio.shield(task)
         
+        async def prime(value: Any, *args, **kwargs) -> None:
+            """Store value as the cached result of calling func(*args, **kwargs)."""
+            cache_ttl = ttl or settings.CACHE_TTL
+            await set_cached_value(make_key(args, kwargs), value, cache_ttl + (stale_ttl or 0))
+        
+        setattr(wrapper, "prime", prime)
         return wrapper
     return decorator
 
+
+def cache_primer(func: Callable) -> Callable[..., Awaitable[None]]:
+    """
+    Return the ``prime(value, *args, **kwargs)`` of a cache_result-wrapped function.
+    
+    Raises:
+        TypeError: If func is not wrapped by cache_result.
+    """
+    prime = getattr(func, "prime", None)
+    if prime is None:
+        raise TypeError(f"{getattr(func, '__name__', func)!r} is not wrapped by cache_result")
+    return prime
+
+
+def _get_or_start_inflight(
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    cache_key: str,
+    cache_ttl: int,
+    not_found_ttl: Optional[int] = None,
+) -> asyncio.Task:
+    """Return the running computation for cache_key, starting one if needed."""
+    task = _inflight.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _compute_and_cache(func, args, kwargs, cache_key, cache_ttl, not_found_ttl)
+        )
+        _inflight[cache_key] = task
+        task.add_done_callback(lambda t: _finish_inflight(cache_key, t))
+    return task
+
+
+def _finish_inflight(cache_key: str, task: asyncio.Task) -> None:
+    """Drop a finished computation, logging failures nobody awaited (background refreshes)."""
+    _inflight.pop(cache_key, None)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"Cache computation failed for {cache_key}: {task.exception()}")
+
+
+async def _compute_and_cache(
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    cache_key: str,
+    cache_ttl: int,
+    not_found_ttl: Optional[int] = None,
+) -> Any:
+    """
+    Run a cache_result-wrapped function and store its result.
+    
+    Only one worker computes a given key at a time; the others wait for the
+    value it stores. Errors are not cached, except ResourceNotFoundError
+    when not_found_ttl is set.
+    """
+    token = await acquire_cache_lock(cache_key)
+    if token is None:
+        cached = await _wait_for_peer(cache_key)
+        if cached is not None:
+            _raise_if_not_found_marker(cached)
+            return cached
+        # The peer failed or timed out: compute anyway, but the lock is not ours
+    
+    try:
+        try:
+            result = await func(*args, **kwargs)
+        except ResourceNotFoundError as e:
+            if not_found_ttl:
+                marker = {_NOT_FOUND_MARKER: {"message": e.message, "details": e.details}}
+                await set_cached_value(cache_key, marker, not_found_ttl)
+            raise
+        await set_cached_value(cache_key, result, cache_ttl)
+        return result
+    finally:
+        # Released after the value is stored so waiting peers find it
+        if token is not None:
+            await release_cache_lock(cache_key, token)
+
+
+def _raise_if_not_found_marker(cached: Any) -> None:
+    """Re-raise a cached ResourceNotFoundError stored by negative caching."""
+    if isinstance(cached, dict) and _NOT_FOUND_MARKER in cached:
+        error = cached[_NOT_FOUND_MARKER]
+        raise ResourceNotFoundError(message=error["message"], details=error["details"])
@@ -1,4 +1,5 @@
 """Circuit breaker for YouTube API rate limiting."""
+import re
 import time
 from typing import Optional, Dict, Any
 from enum import Enum
@@ -6,6 +7,12 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
+# Error messages that mean YouTube is rate limiting us
+_RATE_LIMIT_ERROR_RE = re.compile(
+    r"rate[- ]limit|too many requests|429|resource_exhausted",
+    re.IGNORECASE,
+)
+
 
 class CircuitState(Enum):
     """Circuit breaker states."""
@@ -71,17 +78,8 @@ class CircuitBreaker:
         self.last_failure_time = time.time()
         
         # Check if error message indicates rate limiting
-        is_rate_limit = any(keyword in error_message.lower() for keyword in [
-            'rate-limit',
-            'rate limit',
-            'rate-limited',
-            'too many requests',
-            '429',
-            'resource_exhausted'
-        ])
-        
         # Only open circuit on actual rate limiting, not on auth errors (400)
-        if is_rate_limit:
+        if _RATE_LIMIT_ERROR_RE.search(error_message):
             self.state = CircuitState.OPEN
             self.opened_at = time.time()
             self.failure_count = 0  # Reset for next cycle
@@ -31,11 +31,14 @@ class Settings(BaseSettings):
     CACHE_BACKEND: str = "memory"
     CACHE_TTL: int = 300
     CACHE_MAX_SIZE: int = 1000
+    # Comma-separated playlist IDs cached on startup and on each warm-up cycle
+    HOT_PLAYLIST_IDS: str = ""
     
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: Optional[str] = None
+    REDIS_MAX_CONNECTIONS: int = 200
     
     HTTP_TIMEOUT: int = 30
     HTTP_MAX_CONNECTIONS: int = 100
@@ -43,6 +46,13 @@ class Settings(BaseSettings):
     
     ENABLE_COMPRESSION: bool = True
     MAX_WORKERS: int = 10
+    YTMUSIC_THREADS: int = 8
+    # Concurrent ytmusicapi calls per browser account (its client's session pools
+    # YTMUSIC_THREADS connections, so raising this does not need more clients)
+    YTMUSIC_ACCOUNT_CONCURRENCY: int = 1
+    # Worker processes for yt-dlp extraction (0 = run in the yt-dlp thread pool)
+    YTDLP_PROCESSES: int = 0
+    YTDLP_THREADS: int = 16
     
     CORS_ORIGINS: str = "*"
     CORS_ALLOW_CREDENTIALS: bool = True
@@ -2,7 +2,7 @@
 
 Injects fresh stream URLs into cached metadata responses.
 Stream URLs are never embedded in endpoint/metadata cache — only injected at runtime
-from the dedicated stream URL cache (music:stream:url:{video_id}).
+from the dedicated stream cache (music:stream:{video_id}).
 
 This guarantees clients always receive valid, non-expired stream URLs.
 """
@@ -10,7 +10,6 @@ import asyncio
 import logging
 from typing import Any, Dict, List, Optional, Set
 
-from app.core.cache_redis import get_cached_value
 from app.services.stream_service import StreamService
 
 logger = logging.getLogger(__name__)
@@ -67,7 +66,7 @@ async def enrich_with_fresh_streams(
 
     Flow:
     1. Extract all videoIds from the response
-    2. Batch MGET from stream cache (music:stream:url:{video_id})
+    2. Batch read from stream cache (music:stream:{video_id}), one round trip
     3. For uncached videoIds, fetch fresh URLs via stream service (parallel)
     4. Inject streamUrl into each item
     5. Return enriched response (original data is NOT modified in cache)
@@ -83,16 +82,9 @@ async def enrich_with_fresh_streams(
         return data
 
     # 2. Batch check stream cache
-    cached_urls = {}
-    uncached_ids = []
-
-    for vid in video_ids:
-        cache_key = f"music:stream:url:{vid}"
-        cached_url = await get_cached_value(cache_key)
-        if cached_url:
-            cached_urls[vid] = cached_url
-        else:
-            uncached_ids.append(vid)
+    video_ids = list(video_ids)
+    cached_urls = await stream_service.get_cached_stream_urls(video_ids)
+    uncached_ids = [vid for vid in video_ids if vid not in cached_urls]
 
     # 3. Fetch uncached in parallel (with concurrency limit)
     if uncached_ids:
@@ -139,8 +131,7 @@ async def get_fresh_stream_url(video_id: str, stream_service: Optional[StreamSer
 
     try:
         # Try cache first
-        cache_key = f"music:stream:url:{video_id}"
-        cached_url = await get_cached_value(cache_key)
+        cached_url = (await stream_service.get_cached_stream_urls([video_id])).get(video_id)
         if cached_url:
             return cached_url
 
@@ -1,7 +1,6 @@
 """Main FastAPI application."""
 # Standard library
 import time
-import json
 from pathlib import Path
 from contextlib import asynccontextmanager
 
@@ -36,6 +35,7 @@ from app.core.exception_handlers import (
 )
 from app.api.v1.router import api_router
 from app.core.background_cache import cache_manager
+from app.services.stream_service import close_ydl_cache
 from app.core.ytmusic_client import is_authenticated
 
 # Setup logging first
@@ -107,6 +107,8 @@ async def lifespan(app: FastAPI):
     
     # Detener gestor de cache
     await cache_manager.stop()
+    # Cerrar instancias de yt-dlp reutilizadas
+    close_ydl_cache()
     logger.info(f"Shutting down {settings.PROJECT_NAME}")
 
 
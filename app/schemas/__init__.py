@@ -158,11 +158,6 @@ __all__ = [
     "PlaylistResponse",
     "PlaylistCreateRequest",
     "PlaylistEditRequest",
-    # Podcast
-    "PodcastChannelResponse",
-    "PodcastEpisodeResponse",
-    "PodcastResponse",
-    "PodcastEpisode",
     # Watch
     "WatchPlaylistResponse",
     "WatchTrack",
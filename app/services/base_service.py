@@ -1,8 +1,15 @@
 """Base service class with common functionality."""
+import asyncio
+import inspect
 import logging
-from typing import Any, Optional
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Any, Callable, Optional
 from ytmusicapi import YTMusic
 
+from app.core.config import get_settings
 from app.core.logging_config import get_logger
 from app.core.exceptions import (
     YTMusicServiceException,
@@ -13,6 +20,63 @@ from app.core.exceptions import (
 )
 
 
+# Error classification patterns for _handle_ytmusic_error
+_AUTH_ERROR_RE = re.compile(r"Expecting value|JSONDecodeError|line 1 column 1|Invalid JSON")
+_RATE_LIMIT_ERROR_RE = re.compile(
+    r"rate limit|429|too many requests|resource_exhausted|rate-limit|rate limited|quota exceeded",
+    re.IGNORECASE,
+)
+_NOT_FOUND_ERROR_RE = re.compile(
+    r"not found|no encontrado|does not exist|unable to find",
+    re.IGNORECASE,
+)
+
+# Shared pool for blocking ytmusicapi calls (created lazily, one per process)
+_ytmusic_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_ytmusic_executor() -> ThreadPoolExecutor:
+    """Get or create the thread pool used for blocking ytmusicapi calls."""
+    global _ytmusic_executor
+    if _ytmusic_executor is None:
+        _ytmusic_executor = ThreadPoolExecutor(
+            max_workers=get_settings().YTMUSIC_THREADS,
+            thread_name_prefix="ytm",
+        )
+    return _ytmusic_executor
+
+
+def ytm_safe(operation: str) -> Callable:
+    """
+    Decorator that translates unexpected errors of a service method.
+    
+    YTMusicServiceException subclasses propagate unchanged; anything else is
+    passed through BaseService._handle_ytmusic_error.
+    
+    Args:
+        operation: Operation description, formatted with the call arguments
+            by name (e.g. "obtener playlist {playlist_id}").
+    
+    Returns:
+        The decorator.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            except YTMusicServiceException:
+                raise
+            except Exception as e:
+                # Only pay for argument binding on the error path
+                bound = signature.bind(self, *args, **kwargs)
+                bound.apply_defaults()
+                raise self._handle_ytmusic_error(e, operation.format(**bound.arguments))
+        return wrapper
+    return decorator
+
 class BaseService:
     """
     Base class for all YouTube Music services.
@@ -47,21 +111,38 @@ class BaseService:
         """Get the logger instance."""
         return self._logger
     
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the shared ytmusic thread pool.
+        
+        Args:
+            func: Blocking function to execute.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+        
+        Returns:
+            Whatever func returns.
+        """
+        if kwargs:
+            func = partial(func, *args, **kwargs)
+            args = ()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_ytmusic_executor(), func, *args)
+
     async def _call_ytmusic(self, func, *args, **kwargs) -> Any:
         """
         Execute a YTMusic call using the account-specific semaphore.
         This prevents overloading a single account and improves stability.
         """
-        import asyncio
         from app.core.browser_client import current_account_var
         
         account = current_account_var.get()
         if account:
             async with account.semaphore:
-                return await asyncio.to_thread(func, *args, **kwargs)
+                return await self._run(func, *args, **kwargs)
         else:
             # Fallback if no account in context (should not happen with get_ytmusic)
-            return await asyncio.to_thread(func, *args, **kwargs)
+            return await self._run(func, *args, **kwargs)
 
     def _handle_ytmusic_error(
         self, 
@@ -82,12 +163,13 @@ class BaseService:
         Returns:
             An appropriate YTMusicServiceException subclass.
         """
+        # str() rather than args[0]: some exceptions format status codes into __str__
         error_msg = str(error)
         error_type = type(error).__name__
         
         # Log the full error internally for debugging
         self._logger.error(
-            f"YTMusic error during '{operation}': {error_type} - {error_msg}"
+            "YTMusic error during '%s': %s - %s", operation, error_type, error_msg
         )
         
         # Track errors in the current browser account
@@ -95,9 +177,7 @@ class BaseService:
         account = current_account_var.get()
         
         # Authentication errors - usually means OAuth credentials are invalid or expired
-        if any(pattern in error_msg for pattern in [
-            "Expecting value", "JSONDecodeError", "line 1 column 1", "Invalid JSON"
-        ]) or "JSONDecodeError" in error_type:
+        if _AUTH_ERROR_RE.search(error_msg) or "JSONDecodeError" in error_type:
             if account: account.mark_error()
             return AuthenticationError(
                 message="Error de autenticación con YouTube Music. Verifica las credenciales.",
@@ -105,10 +185,7 @@ class BaseService:
             )
         
         # Rate limiting errors
-        if any(pattern in error_msg.lower() for pattern in [
-            "rate limit", "429", "too many requests", "resource_exhausted",
-            "rate-limit", "rate limited", "quota exceeded"
-        ]):
+        if _RATE_LIMIT_ERROR_RE.search(error_msg):
             if account: account.rate_limited_until = time.time() + 300 # 5 min penalty
             return RateLimitError(
                 message="Límite de peticiones excedido. Intenta más tarde.",
@@ -117,9 +194,7 @@ class BaseService:
         
         # Resource not found errors
         # Patterns: not found messages, does not exist
-        if any(pattern in error_msg.lower() for pattern in [
-            "not found", "no encontrado", "does not exist", "unable to find"
-        ]):
+        if _NOT_FOUND_ERROR_RE.search(error_msg):
             return ResourceNotFoundError(
                 message=f"Recurso no encontrado en {operation}.",
                 details={"operation": operation}
@@ -140,5 +215,10 @@ class BaseService:
             operation: Name of the operation.
             **kwargs: Additional parameters to log.
         """
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
         params = ", ".join(f"{k}={v}" for k, v in kwargs.items() if v is not None)
-        self._logger.debug(f"Starting {operation}" + (f" ({params})" if params else ""))
+        if params:
+            self._logger.debug("Starting %s (%s)", operation, params)
+        else:
+            self._logger.debug("Starting %s", operation)
@@ -2,13 +2,17 @@
 from typing import Optional, List, Dict, Any
 from ytmusicapi import YTMusic
 import asyncio
+import re
 
-from app.services.base_service import BaseService
+from app.services.base_service import BaseService, ytm_safe
 from app.services.pagination_service import PaginationService
 from app.services.response_service import ResponseService
 from app.core.cache import cache_result
 from app.core.exceptions import ResourceNotFoundError, YTMusicServiceException
 
+# Rate-limit errors of get_artist_albums (logged before trying the fallback)
+_RATE_LIMIT_ERROR_RE = re.compile(r'429|rate limit|quota|too many requests', re.IGNORECASE)
+
 
 class BrowseService(BaseService):
     """Service for browsing music content."""
@@ -23,6 +27,7 @@ class BrowseService(BaseService):
         super().__init__(ytmusic)
     
     @cache_result(ttl=86400)
+    @ytm_safe("obtener home")
     async def get_home(
         self,
         limit: int = 20,
@@ -44,25 +49,22 @@ class BrowseService(BaseService):
         """
         self._log_operation("get_home", page=page, page_size=page_size, limit=limit)
 
-        try:
-            result = await self._call_ytmusic(self.ytmusic.get_home, limit=limit)
-            content = result if result is not None else []
-            self.logger.info(f"Retrieved home page: {len(content)} sections")
-
-            # Paginate content
-            paginated = PaginationService.paginate(
-                content,
-                page=page,
-                page_size=page_size,
-                max_page_size=max_page_size
-            )
+        result = await self._call_ytmusic(self.ytmusic.get_home, limit=limit)
+        content = result if result is not None else []
+        self.logger.info("Retrieved home page: %s sections", len(content))
 
-            return paginated
+        # Paginate content
+        paginated = PaginationService.paginate(
+            content,
+            page=page,
+            page_size=page_size,
+            max_page_size=max_page_size
+        )
 
-        except Exception as e:
-            raise self._handle_ytmusic_error(e, "obtener home")
+        return paginated
     
     @cache_result(ttl=86400)
+    @ytm_safe("obtener artista {channel_id}")
     async def get_artist(self, channel_id: str) -> Dict[str, Any]:
         """
         Get artist information.
@@ -75,20 +77,14 @@ class BrowseService(BaseService):
         """
         self._log_operation("get_artist", channel_id=channel_id)
         
-        try:
-            result = await self._call_ytmusic(self.ytmusic.get_artist, channel_id)
-            if result is None:
-                raise ResourceNotFoundError(
-                    message="Artista no encontrado.",
-                    details={"resource_type": "artist", "channel_id": channel_id}
-                )
-            self.logger.info(f"Retrieved artist: {channel_id}")
-            return result
-        except YTMusicServiceException:
-            # Re-raise custom exceptions directly
-            raise
-        except Exception as e:
-            raise self._handle_ytmusic_error(e, f"obtener artista {channel_id}")
+        result = await self._call_ytmusic(self.ytmusic.get_artist, channel_id)
+        if result is None:
+            raise ResourceNotFoundError(
+                message="Artista no encontrado.",
+                details={"resource_type": "artist", "channel_id": channel_id}
+            )
+        self.logger.info("Retrieved artist: %s", channel_id)
+        return result
     
     @cache_result(ttl=86400)
     async def get_artist_albums(
@@ -108,9 +104,6 @@ class BrowseService(BaseService):
         """
         self._log_operation("get_artist_albums", channel_id=channel_id)
         
-        # Rate limit error handling
-        rate_limit_keywords = ['429', 'rate limit', 'quota', 'too many requests']
-        
         async def fetch_albums():
             return await self._call_ytmusic(self.ytmusic.get_artist_albums, channel_id, params)
         
@@ -119,15 +112,13 @@ class BrowseService(BaseService):
             try:
                 return await fetch_albums()
             except Exception as e:
-                error_msg = str(e).lower()
-                is_rate_limit = any(kw in error_msg for kw in rate_limit_keywords)
-                if is_rate_limit:
-                    self.logger.warning(f"Rate limit hit for artist {channel_id}: {e}")
+                if _RATE_LIMIT_ERROR_RE.search(str(e)):
+                    self.logger.warning("Rate limit hit for artist %s: %s", channel_id, e)
                 
                 # Second try: get artist info to get the albums browse_id
-                self.logger.debug(f"get_artist_albums failed, trying fallback with get_artist for {channel_id}")
+                self.logger.debug("get_artist_albums failed, trying fallback with get_artist for %s", channel_id)
                 try:
-                    artist_data = await asyncio.to_thread(self.ytmusic.get_artist, channel_id)
+                    artist_data = await self._run(self.ytmusic.get_artist, channel_id)
                     if artist_data:
                         # Try to get albums using the albums browse_id from artist response
                         albums_browse_id = artist_data.get("albums", {}).get("browseId")
@@ -135,10 +126,10 @@ class BrowseService(BaseService):
                             # Use get_album_browse_id logic - call get_albums via browse endpoint
                             # Fallback: just return the artist data's albums section
                             albums_section = artist_data.get("albums", {})
-                            self.logger.info(f"Retrieved albums via get_artist fallback for {channel_id}")
+                            self.logger.info("Retrieved albums via get_artist fallback for %s", channel_id)
                             return albums_section
                 except Exception as fallback_error:
-                    self.logger.warning(f"Fallback also failed for {channel_id}: {fallback_error}")
+                    self.logger.warning("Fallback also failed for %s: %s", channel_id, fallback_error)
                 
                 # If we get here, both failed - re-raise the original exception
                 raise
@@ -152,12 +143,12 @@ class BrowseService(BaseService):
                 try:
                     result = await fetch_with_fallback()
                     albums = result if result is not None else {}
-                    self.logger.info(f"Retrieved albums for artist: {channel_id} (attempt {attempt + 1})")
+                    self.logger.info("Retrieved albums for artist: %s (attempt %s)", channel_id, attempt + 1)
                     return albums
                 except Exception as e:
                     last_error = e
                     if attempt < max_retries - 1:
-                        self.logger.warning(f"Attempt {attempt + 1} failed for {channel_id}: {e}, retrying...")
+                        self.logger.warning("Attempt %s failed for %s: %s, retrying...", attempt + 1, channel_id, e)
                         await asyncio.sleep(0.5 * (attempt + 1))  # Exponential backoff
             
             # All retries exhausted
@@ -196,7 +187,7 @@ class BrowseService(BaseService):
                 )
 
             # Debug: log the keys in the result to understand structure
-            self.logger.debug(f"Album result keys: {list(result.keys()) if isinstance(result, dict) else 'not a dict'}")
+            self.logger.debug("Album result keys: %s", list(result.keys()) if isinstance(result, dict) else 'not a dict')
 
             # Extract tracks - handle different possible keys
             # ytmusicapi returns tracks in 'tracks' key
@@ -204,7 +195,7 @@ class BrowseService(BaseService):
             
             # If still empty, log warning - might be ytmusicapi returning empty tracks
             if not raw_tracks:
-                self.logger.warning(f"No tracks found for album {album_id}. Result keys: {list(result.keys())}")
+                self.logger.warning("No tracks found for album %s. Result keys: %s", album_id, list(result.keys()))
                 raw_tracks = []
 
             # Standardize tracks - only standardize items that have videoId
@@ -219,7 +210,7 @@ class BrowseService(BaseService):
                             ResponseService.standardize_song_object(track, include_stream_url=True)
                         )
                     except (ValueError, AttributeError, TypeError) as e:
-                        self.logger.warning(f"Failed to standardize track: {e}")
+                        self.logger.warning("Failed to standardize track: %s", e)
                         continue
                 else:
                     # Keep tracks without videoId as-is (might be unavailable)
@@ -242,7 +233,7 @@ class BrowseService(BaseService):
                 "num_tracks": len(raw_tracks)
             }
 
-            self.logger.info(f"Retrieved album: {album_id} with {len(raw_tracks)} tracks")
+            self.logger.info("Retrieved album: %s with %s tracks", album_id, len(raw_tracks))
             return paginated
 
         except YTMusicServiceException:
@@ -264,26 +255,27 @@ class BrowseService(BaseService):
         self._log_operation("get_album_browse_id", album_id=album_id)
         
         try:
-            result = await asyncio.to_thread(self.ytmusic.get_album_browse_id, album_id)
-            self.logger.debug(f"Retrieved browse ID for album {album_id}: {result}")
+            result = await self._run(self.ytmusic.get_album_browse_id, album_id)
+            self.logger.debug("Retrieved browse ID for album %s: %s", album_id, result)
             
             # Fallback: try to get browse_id from get_album if ytmusicapi returns None
             if result is None:
-                self.logger.debug(f"get_album_browse_id returned None, trying get_album fallback for {album_id}")
-                album_data = await asyncio.to_thread(self.ytmusic.get_album, album_id)
+                self.logger.debug("get_album_browse_id returned None, trying get_album fallback for %s", album_id)
+                album_data = await self._run(self.ytmusic.get_album, album_id)
                 if album_data:
                     # Extract browse_id from audioPlaylistId if available
                     audio_playlist_id = album_data.get("audioPlaylistId")
                     if audio_playlist_id:
                         # audioPlaylistId is in format "OLAK5uy_xxxxx", we need the browse ID
                         result = audio_playlist_id
-                        self.logger.debug(f"Extracted browse ID from album: {result}")
+                        self.logger.debug("Extracted browse ID from album: %s", result)
             
             return result
         except Exception as e:
             raise self._handle_ytmusic_error(e, f"obtener browse ID de álbum {album_id}")
     
     @cache_result(ttl=86400)
+    @ytm_safe("obtener canción {video_id}")
     async def get_song(self, video_id: str, signature_timestamp: Optional[int] = None) -> Dict[str, Any]:
         """
         Get song metadata.
@@ -297,20 +289,14 @@ class BrowseService(BaseService):
         """
         self._log_operation("get_song", video_id=video_id)
         
-        try:
-            result = await self._call_ytmusic(self.ytmusic.get_song, video_id, signature_timestamp)
-            if result is None:
-                raise ResourceNotFoundError(
-                    message="Canción no encontrada.",
-                    details={"resource_type": "song", "video_id": video_id}
-                )
-            self.logger.info(f"Retrieved song: {video_id}")
-            return result
-        except YTMusicServiceException:
-            # Re-raise custom exceptions directly
-            raise
-        except Exception as e:
-            raise self._handle_ytmusic_error(e, f"obtener canción {video_id}")
+        result = await self._call_ytmusic(self.ytmusic.get_song, video_id, signature_timestamp)
+        if result is None:
+            raise ResourceNotFoundError(
+                message="Canción no encontrada.",
+                details={"resource_type": "song", "video_id": video_id}
+            )
+        self.logger.info("Retrieved song: %s", video_id)
+        return result
     
     @staticmethod
     def _flatten_song_related_sections(sections: Any) -> List[Dict[str, Any]]:
@@ -330,6 +316,7 @@ class BrowseService(BaseService):
         return flat
 
     @cache_result(ttl=3600)
+    @ytm_safe("obtener canciones relacionadas de {video_id}")
     async def get_song_related(
         self,
         video_id: str,
@@ -345,41 +332,36 @@ class BrowseService(BaseService):
         """
         self._log_operation("get_song_related", video_id=video_id, page=page, page_size=page_size)
 
-        try:
-            watch = await self._call_ytmusic(self.ytmusic.get_watch_playlist, video_id)
-            if not watch:
-                raise ResourceNotFoundError(
-                    message="No se pudo obtener la playlist de reproducción para canciones relacionadas.",
-                    details={"resource_type": "song", "video_id": video_id},
-                )
-            related_browse_id = watch.get("related")
-            if not related_browse_id:
-                self.logger.info(f"Watch playlist sin pestaña 'related' para video_id={video_id}")
-                return PaginationService.paginate(
-                    [],
-                    page=page,
-                    page_size=page_size,
-                    max_page_size=max_page_size,
-                )
-
-            sections = await self._call_ytmusic(self.ytmusic.get_song_related, related_browse_id)
-            related_songs = self._flatten_song_related_sections(sections)
-            self.logger.info(f"Related songs flattened: {len(related_songs)} for video_id={video_id}")
-
-            standardized_songs = [
-                ResponseService.standardize_song_object(song, include_stream_url=True)
-                for song in related_songs
-            ]
+        watch = await self._call_ytmusic(self.ytmusic.get_watch_playlist, video_id)
+        if not watch:
+            raise ResourceNotFoundError(
+                message="No se pudo obtener la playlist de reproducción para canciones relacionadas.",
+                details={"resource_type": "song", "video_id": video_id},
+            )
+        related_browse_id = watch.get("related")
+        if not related_browse_id:
+            self.logger.info("Watch playlist sin pestaña 'related' para video_id=%s", video_id)
             return PaginationService.paginate(
-                standardized_songs,
+                [],
                 page=page,
                 page_size=page_size,
                 max_page_size=max_page_size,
             )
-        except YTMusicServiceException:
-            raise
-        except Exception as e:
-            raise self._handle_ytmusic_error(e, f"obtener canciones relacionadas de {video_id}")
+
+        sections = await self._call_ytmusic(self.ytmusic.get_song_related, related_browse_id)
+        related_songs = self._flatten_song_related_sections(sections)
+        self.logger.info("Related songs flattened: %s for video_id=%s", len(related_songs), video_id)
+
+        standardized_songs = [
+            ResponseService.standardize_song_object(song, include_stream_url=True)
+            for song in related_songs
+        ]
+        return PaginationService.paginate(
+            standardized_songs,
+            page=page,
+            page_size=page_size,
+            max_page_size=max_page_size,
+        )
     
     @cache_result(ttl=86400)
     async def get_lyrics_by_video_id(self, video_id: str) -> Dict[str, Any]:
@@ -400,25 +382,26 @@ class BrowseService(BaseService):
             
             # Check if watch playlist has lyrics
             if not watch_playlist:
-                self.logger.info(f"No watch playlist for video: {video_id}")
+                self.logger.info("No watch playlist for video: %s", video_id)
                 return {"lyrics": None, "source": None, "error": "No lyrics available"}
             
             # Get the lyrics browse ID from the watch playlist
             lyrics_browse_id = watch_playlist.get('lyrics')
             if not lyrics_browse_id:
-                self.logger.info(f"No lyrics browse ID for video: {video_id}")
+                self.logger.info("No lyrics browse ID for video: %s", video_id)
                 return {"lyrics": None, "source": None, "error": "No lyrics available"}
             
             # Now get the actual lyrics
             result = await self._call_ytmusic(self.ytmusic.get_lyrics, lyrics_browse_id)
             lyrics = result if result is not None else {}
-            self.logger.info(f"Retrieved lyrics for video: {video_id}")
+            self.logger.info("Retrieved lyrics for video: %s", video_id)
             return lyrics
         except Exception as e:
-            self.logger.warning(f"Could not get lyrics for {video_id}: {e}")
+            self.logger.warning("Could not get lyrics for %s: %s", video_id, e)
             return {"lyrics": None, "source": None, "error": str(e)}
     
     @cache_result(ttl=86400)
+    @ytm_safe("obtener letras {browse_id}")
     async def get_lyrics(self, browse_id: str) -> Dict[str, Any]:
         """
         Get song lyrics.
@@ -431,10 +414,7 @@ class BrowseService(BaseService):
         """
         self._log_operation("get_lyrics", browse_id=browse_id)
         
-        try:
-            result = await self._call_ytmusic(self.ytmusic.get_lyrics, browse_id)
-            lyrics = result if result is not None else {}
-            self.logger.info(f"Retrieved lyrics for: {browse_id}")
-            return lyrics
-        except Exception as e:
-            raise self._handle_ytmusic_error(e, f"obtener letras {browse_id}")
+        result = await self._call_ytmusic(self.ytmusic.get_lyrics, browse_id)
+        lyrics = result if result is not None else {}
+        self.logger.info("Retrieved lyrics for: %s", browse_id)
+        return lyrics
@@ -1,14 +1,36 @@
 """Service for exploring YouTube Music content."""
+import re
+import time
 from typing import Optional, List, Dict, Any
 from ytmusicapi import YTMusic
-import asyncio
 
-from app.services.base_service import BaseService
+from app.services.base_service import BaseService, ytm_safe
 from app.services.pagination_service import PaginationService
 from app.services.response_service import ResponseService
 from app.core.cache import cache_result
 from app.core.exceptions import ResourceNotFoundError, ExternalServiceError
 
+# Home section titles that hold the moods/genres grid
+_MOOD_SECTION_RE = re.compile(r'mood|genre', re.IGNORECASE)
+# Errors meaning the mood/genre params do not exist
+_NOT_FOUND_ERROR_RE = re.compile(r'404|not found|no encontrado|does not exist', re.IGNORECASE)
+
+# TTL of the get_home_with_moods cache entry
+_HOME_MOODS_TTL = 3600
+
+# params -> title from the home moods section. ExploreService is built per
+# request, so the index lives at module level; it is replaced whenever
+# get_home_with_moods recomputes and dropped once that cache entry expires.
+_moods_index: Dict[str, str] = {}
+_moods_index_expires_at = 0.0
+
+
+def _get_moods_index() -> Dict[str, str]:
+    """Get the flat moods index, or an empty dict once it has expired."""
+    if time.monotonic() >= _moods_index_expires_at:
+        return {}
+    return _moods_index
+
 
 class ExploreService(BaseService):
     """Service for exploring music content."""
@@ -17,6 +39,9 @@ class ExploreService(BaseService):
         "ggMPOg1uX3hRRFdlaEhHU09k": "Cumbia",
     }
     
+    # Search queries used by get_mood_playlists_alternative, tried in order
+    _ALTERNATIVE_QUERY_TEMPLATES = ("{} playlist", "{} music", "best {} songs")
+    
     def __init__(self, ytmusic: YTMusic):
         """
         Initialize the explore service.
@@ -27,6 +52,7 @@ class ExploreService(BaseService):
         super().__init__(ytmusic)
     
     @cache_result(ttl=86400)
+    @ytm_safe("obtener categorías de moods")
     async def get_mood_categories(self) -> Dict[str, Any]:
         """
         Get mood categories.
@@ -36,13 +62,10 @@ class ExploreService(BaseService):
         """
         self._log_operation("get_mood_categories")
         
-        try:
-            result = await self._call_ytmusic(self.ytmusic.get_mood_categories)
-            categories = result if result is not None else {}
-            self.logger.info(f"Retrieved {len(categories)} mood categories")
-            return categories
-        except Exception as e:
-            raise self._handle_ytmusic_error(e, "obtener categorías de moods")
+        result = await self._call_ytmusic(self.ytmusic.get_mood_categories)
+        categories = result if result is not None else {}
+        self.logger.info("Retrieved %d mood categories", len(categories))
+        return categories
     
     @cache_result(ttl=3600)
     async def get_mood_playlists(
@@ -71,7 +94,7 @@ class ExploreService(BaseService):
             
             # Validate result is a list - ytmusicapi might return unexpected types
             if not isinstance(result, list):
-                self.logger.warning(f"get_mood_playlists returned {type(result).__name__}, expected list: {result}")
+                self.logger.warning("get_mood_playlists returned %s, expected list: %s", type(result).__name__, result)
                 playlists = []
             else:
                 playlists = result
@@ -82,7 +105,7 @@ class ExploreService(BaseService):
             for playlist in playlists:
                 # Skip non-dict items - ytmusicapi might return strings or other types
                 if not isinstance(playlist, dict):
-                    self.logger.warning(f"Skipping non-dict playlist item: {type(playlist).__name__}: {playlist}")
+                    self.logger.warning("Skipping non-dict playlist item: %s: %s", type(playlist).__name__, playlist)
                     continue
                 if playlist.get("playlistId") or playlist.get("browseId"):
                     standardized_playlists.append({
@@ -104,7 +127,7 @@ class ExploreService(BaseService):
                 max_page_size=max_page_size
             )
 
-            self.logger.info(f"Retrieved mood playlists for params: {params}")
+            self.logger.info("Retrieved mood playlists for params: %s", params)
             return paginated
 
         except (KeyError, TypeError, AttributeError) as e:
@@ -112,8 +135,9 @@ class ExploreService(BaseService):
             # Check for the specific 'str' object error
             if "'str' object" in error_msg and "has no attribute 'get'" in error_msg:
                 self.logger.error(
-                    f"get_mood_playlists received string instead of dict (params={params}). "
-                    f"YouTube Music puede estar retornando datos inválidos."
+                    "get_mood_playlists received string instead of dict (params=%s). "
+                    "YouTube Music puede estar retornando datos inválidos.",
+                    params
                 )
                 raise ExternalServiceError(
                     message="YouTube Music retornó datos inválidos para esta categoría.",
@@ -125,19 +149,14 @@ class ExploreService(BaseService):
                     details={"params": params, "hint": "Intenta actualizar ytmusicapi o usar otro método."}
                 )
             self.logger.error(
-                f"get_mood_playlists error (params={params}): {error_msg}"
+                "get_mood_playlists error (params=%s): %s", params, error_msg
             )
             raise ExternalServiceError(
                 message="Error al interpretar la respuesta de YouTube Music para este mood.",
                 details={"params": params}
             )
         except Exception as e:
-            error_msg = str(e).lower()
-            is_not_found = any(kw in error_msg for kw in [
-                '404', 'not found', 'no encontrado', 'does not exist',
-                'requested entity was not found'
-            ])
-            if is_not_found:
+            if _NOT_FOUND_ERROR_RE.search(str(e)):
                 raise ResourceNotFoundError(
                     message=f"Categoría no encontrada para los parámetros proporcionados.",
                     details={"params": params, "resource_type": "mood_category"}
@@ -169,6 +188,23 @@ class ExploreService(BaseService):
                     return result
         return None
     
+    def _index_moods(self, moods: List[Any]) -> None:
+        """
+        Replace the shared params -> title index with one built from a moods list.
+        
+        Args:
+            moods: Mood/genre items as returned in get_home_with_moods.
+        """
+        global _moods_index, _moods_index_expires_at
+        index: Dict[str, str] = {}
+        for mood in moods:
+            if isinstance(mood, dict) and mood.get('params'):
+                title = mood.get('title') or mood.get('name')
+                if title:
+                    index.setdefault(mood['params'], title)
+        _moods_index = index
+        _moods_index_expires_at = time.monotonic() + _HOME_MOODS_TTL
+    
     async def get_genre_name_from_params(self, params: str) -> Optional[str]:
         """
         Get genre name from params by searching in categories.
@@ -195,12 +231,23 @@ class ExploreService(BaseService):
             if genre_name:
                 return genre_name
             
+            moods_index = _get_moods_index()
+            if params in moods_index:
+                return moods_index[params]
+            
             home_data = await self.get_home_with_moods()
+            # get_home_with_moods may be served from cache without running its body
+            if not _get_moods_index() and isinstance(home_data, dict):
+                self._index_moods(home_data.get('moods') or [])
+            moods_index = _get_moods_index()
+            if params in moods_index:
+                return moods_index[params]
+            
             genre_name = self._find_genre_in_structure(home_data, params)
             if genre_name:
                 return genre_name
         except Exception as e:
-            self.logger.warning(f"Error searching for genre: {e}")
+            self.logger.warning("Error searching for genre: %s", e)
         
         return None
     
@@ -225,39 +272,38 @@ class ExploreService(BaseService):
         from app.services.search_service import SearchService
         search_service = SearchService(self.ytmusic)
         
-        queries = [
-            f"{genre_name} playlist",
-            f"{genre_name} music",
-            f"best {genre_name} songs"
-        ]
+        queries = [template.format(genre_name) for template in self._ALTERNATIVE_QUERY_TEMPLATES]
+        per_query_limit = limit // len(queries) + 1
         
-        all_results = []
+        seen_ids = set()
+        unique_results = []
         for query in queries:
             try:
                 results = await search_service.search(
                     query=query,
                     filter="playlists",
-                    limit=limit // len(queries) + 1
+                    limit=per_query_limit
                 )
-                if results:
-                    all_results.extend(results)
-                    if len(all_results) >= limit:
-                        break
             except Exception:
                 continue
-        
-        seen_ids = set()
-        unique_results = []
-        for item in all_results:
-            playlist_id = item.get('playlistId') or item.get('browseId')
-            if playlist_id and playlist_id not in seen_ids:
-                seen_ids.add(playlist_id)
-                unique_results.append(item)
+            # search() returns a paginated dict; keep accepting plain lists too
+            if isinstance(results, dict):
+                results = results.get('items') or []
+            for item in results or []:
+                if not isinstance(item, dict):
+                    continue
+                playlist_id = item.get('playlistId') or item.get('browseId')
+                if playlist_id and playlist_id not in seen_ids:
+                    seen_ids.add(playlist_id)
+                    unique_results.append(item)
+                    if len(unique_results) >= limit:
+                        break
+            # Only issue the next query while still short of unique results
             if len(unique_results) >= limit:
                 break
         
-        self.logger.info(f"Alternative search found {len(unique_results)} playlists for '{genre_name}'")
-        return unique_results[:limit]
+        self.logger.info("Alternative search found %d playlists for '%s'", len(unique_results), genre_name)
+        return unique_results
     
     @cache_result(ttl=1800)
     async def get_charts(
@@ -286,7 +332,7 @@ class ExploreService(BaseService):
             charts = result if result is not None else {}
 
             # Debug: log the keys to understand structure
-            self.logger.debug(f"Charts result keys: {list(charts.keys())}")
+            self.logger.debug("Charts result keys: %s", list(charts.keys()))
 
             # Extract items based on ytmusicapi schema:
             # - videos: Daily Top Music Videos (has playlistId, not videoId) -> use as trending
@@ -312,7 +358,7 @@ class ExploreService(BaseService):
                             ResponseService.standardize_song_object(item, include_stream_url=True)
                         )
                     except (ValueError, AttributeError, TypeError) as e:
-                        self.logger.warning(f"Failed to standardize chart item: {e}")
+                        self.logger.warning("Failed to standardize chart item: %s", e)
                         continue
                 elif item.get("playlistId"):
                     # It's a playlist (Daily Top Videos) - keep as trending item
@@ -351,7 +397,7 @@ class ExploreService(BaseService):
         except Exception as e:
             raise self._handle_ytmusic_error(e, f"obtener charts (país: {country or 'global'})")
     
-    @cache_result(ttl=3600)
+    @cache_result(ttl=_HOME_MOODS_TTL)
     async def get_home_with_moods(self) -> Dict[str, Any]:
         """
         Get home page with moods extracted.
@@ -371,8 +417,8 @@ class ExploreService(BaseService):
         moods = []
         
         for item in home:
-            title = item.get('title', '').lower()
-            if 'mood' in title or 'genre' in title:
+            title = item.get('title')
+            if title and _MOOD_SECTION_RE.search(title):
                 moods = item.get('contents', [])
                 break
         
@@ -386,7 +432,8 @@ class ExploreService(BaseService):
             except Exception:
                 pass
         
-        self.logger.info(f"Retrieved home with {len(moods)} moods")
+        self._index_moods(moods)
+        self.logger.info("Retrieved home with %d moods", len(moods))
         return {
             "home": home,
             "moods": moods
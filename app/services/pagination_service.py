@@ -1,7 +1,6 @@
 """Pagination service for standardized list responses."""
 from typing import List, Dict, Any, Optional
 from math import ceil
-from datetime import datetime
 
 
 class PaginationService:
@@ -1,13 +1,30 @@
 """Service for playlists."""
-from typing import Optional, Dict, Any, List
-from ytmusicapi import YTMusic
 import asyncio
+import sys
+from typing import Dict, Any, FrozenSet, List, Optional, Set
+from ytmusicapi import YTMusic
 
-from app.services.base_service import BaseService
+from app.services.base_service import BaseService, ytm_safe
 from app.services.pagination_service import PaginationService
 from app.services.response_service import ResponseService
-from app.core.cache import cache_result
-from app.core.exceptions import ResourceNotFoundError, YTMusicServiceException
+from app.core.cache import cache_result, cache_primer
+from app.core.exceptions import ResourceNotFoundError
+
+# Strong references to running next-page prefetches so they are not GC'd early
+_prefetch_tasks: Set[asyncio.Task] = set()
+
+
+def normalize_playlist_id(playlist_id: str) -> str:
+    """
+    Normalize playlist ID - remove VL prefix if present.
+    
+    Args:
+        playlist_id: Raw playlist ID.
+    
+    Returns:
+        Normalized, interned playlist ID.
+    """
+    return sys.intern(playlist_id.removeprefix('VL'))
 
 
 class PlaylistService(BaseService):
@@ -32,11 +49,15 @@ class PlaylistService(BaseService):
         Returns:
             Normalized playlist ID.
         """
-        if playlist_id.startswith('VL'):
-            return playlist_id[2:]
-        return playlist_id
+        return normalize_playlist_id(playlist_id)
     
-    @cache_result(ttl=86400)
+    @cache_result(
+        ttl=86400,
+        stale_ttl=43200,
+        not_found_ttl=60,
+        key_normalizers={"playlist_id": normalize_playlist_id}
+    )
+    @ytm_safe("obtener playlist {playlist_id}")
     async def get_playlist(
         self,
         playlist_id: str,
@@ -45,7 +66,8 @@ class PlaylistService(BaseService):
         suggestions_limit: int = 0,
         start_index: int = 0,
         page: int = 1,
-        page_size: int = 10
+        page_size: int = 10,
+        fields: Optional[FrozenSet[str]] = None
     ) -> Dict[str, Any]:
         """
         Get playlist information with standardized pagination.
@@ -58,6 +80,8 @@ class PlaylistService(BaseService):
             start_index: Starting index for pagination (0-based).
             page: Current page number (default: 1)
             page_size: Number of items per page (default: 10)
+            fields: Optional set of track keys to keep; other keys are dropped
+                before the response is cached.
 
         Returns:
             Playlist with standardized pagination metadata.
@@ -65,67 +89,120 @@ class PlaylistService(BaseService):
         normalized_id = self._normalize_playlist_id(playlist_id)
         self._log_operation("get_playlist", playlist_id=normalized_id, limit=limit, start_index=start_index, page=page)
 
-        # Validate pagination params
+        # The page is derived from limit and start_index; keep the page/page_size
+        # arguments as passed, since they are part of the cache key
+        requested_page, requested_page_size = page, page_size
         page_size, page, start_index = PaginationService.validate_pagination_params(
             limit=limit,
             start_index=start_index
         )
 
-        try:
-            result = await asyncio.to_thread(
-                self.ytmusic.get_playlist,
-                normalized_id,
-                limit=limit,
-                related=related,
-                suggestions_limit=suggestions_limit
+        # Track continuations are chained (each token comes from the previous
+        # page), so ytmusicapi has to walk them serially; they can't be fanned out.
+        result = await self._run(
+            self.ytmusic.get_playlist,
+            normalized_id,
+            limit=limit,
+            related=related,
+            suggestions_limit=suggestions_limit
+        )
+        if result is None:
+            raise ResourceNotFoundError(
+                message="Playlist no encontrada.",
+                details={"resource_type": "playlist", "playlist_id": playlist_id}
             )
-            if result is None:
-                raise ResourceNotFoundError(
-                    message="Playlist no encontrada.",
-                    details={"resource_type": "playlist", "playlist_id": playlist_id}
-                )
-
-            # Extract and standardize tracks
-            tracks = result.get('tracks', [])
+
+        # Extract and standardize tracks
+        tracks = result.get('tracks', [])
+        standardized_tracks = [
+            ResponseService.standardize_song_object(track, include_stream_url=True)
+            for track in tracks
+        ]
+        if fields:
             standardized_tracks = [
-                ResponseService.standardize_song_object(track, include_stream_url=True)
-                for track in tracks
+                {key: track[key] for key in fields if key in track}
+                for track in standardized_tracks
             ]
 
-            # Apply standardized pagination
-            paginated = PaginationService.paginate(
-                standardized_tracks,
-                page=page,
-                page_size=page_size
-            )
+        response = self._build_playlist_response(result, standardized_tracks, page, page_size)
+
+        # The next page is a slice of the same upstream result; seed its cache
+        # entry now instead of re-fetching the whole playlist when it is requested.
+        if response['pagination']['has_next']:
+            task = asyncio.create_task(self._prefetch_next_page(
+                response=self._build_playlist_response(result, standardized_tracks, page + 1, page_size),
+                playlist_id=playlist_id,
+                limit=limit,
+                related=related,
+                suggestions_limit=suggestions_limit,
+                start_index=page * page_size,
+                page=requested_page,
+                page_size=requested_page_size,
+                fields=fields
+            ))
+            _prefetch_tasks.add(task)
+            task.add_done_callback(_prefetch_tasks.discard)
 
-            # Build response with playlist metadata
-            response = {
-                "playlistId": result.get('id'),
-                "title": result.get('title', ''),
-                "description": result.get('description', ''),
-                "author": {
-                    "name": result.get('author', {}).get('name', '') if isinstance(result.get('author'), dict) else result.get('author', ''),
-                    "id": result.get('author', {}).get('id') if isinstance(result.get('author'), dict) else None
-                },
-                "trackCount": result.get('trackCount'),
-                "duration": result.get('duration'),
-                "durationSeconds": result.get('duration_seconds'),
-                "thumbnails": result.get('thumbnails', []),
-                "thumbnail": result.get('thumbnails', [{}])[0].get('url') if result.get('thumbnails') else '',
-                "views": result.get('views'),
-                "year": result.get('year'),
-                "privacy": result.get('privacy'),
-                "tracks": paginated['items'],
-                "items": paginated['items'],  # Keep for backward compatibility if needed
-                "pagination": paginated['pagination']
-            }
-
-            track_count = len(paginated['items'])
-            self.logger.info(f"Retrieved playlist {playlist_id}: {track_count} tracks (page={page}, page_size={page_size})")
-            return response
-
-        except YTMusicServiceException:
-            raise
+        track_count = len(response['items'])
+        self.logger.info("Retrieved playlist %s: %s tracks (page=%s, page_size=%s)", playlist_id, track_count, page, page_size)
+        return response
+
+    def _build_playlist_response(
+        self,
+        result: Dict[str, Any],
+        tracks: List[Dict[str, Any]],
+        page: int,
+        page_size: int
+    ) -> Dict[str, Any]:
+        """
+        Build one page of the playlist response.
+
+        Args:
+            result: Raw playlist from ytmusicapi.
+            tracks: Standardized tracks of the whole playlist.
+            page: Page number to build.
+            page_size: Number of items per page.
+
+        Returns:
+            Playlist metadata with the requested page of tracks.
+        """
+        paginated = PaginationService.paginate(
+            tracks,
+            page=page,
+            page_size=page_size
+        )
+
+        author = result.get('author')
+        return {
+            "playlistId": result.get('id'),
+            "title": result.get('title', ''),
+            "description": result.get('description', ''),
+            "author": {
+                "name": author.get('name', '') if isinstance(author, dict) else result.get('author', ''),
+                "id": author.get('id') if isinstance(author, dict) else None
+            },
+            "trackCount": result.get('trackCount'),
+            "duration": result.get('duration'),
+            "durationSeconds": result.get('duration_seconds'),
+            "thumbnails": result.get('thumbnails', []),
+            "thumbnail": result.get('thumbnails', [{}])[0].get('url') if result.get('thumbnails') else '',
+            "views": result.get('views'),
+            "year": result.get('year'),
+            "privacy": result.get('privacy'),
+            "tracks": paginated['items'],
+            "items": paginated['items'],  # Keep for backward compatibility if needed
+            "pagination": paginated['pagination']
+        }
+
+    async def _prefetch_next_page(self, response: Dict[str, Any], **call_kwargs: Any) -> None:
+        """
+        Store an already built page in the get_playlist cache.
+
+        Args:
+            response: Page response to cache.
+            **call_kwargs: get_playlist arguments that request this page.
+        """
+        try:
+            await cache_primer(PlaylistService.get_playlist)(response, self, **call_kwargs)
         except Exception as e:
-            raise self._handle_ytmusic_error(e, f"obtener playlist {playlist_id}")
+            self.logger.debug("Could not prefetch playlist page at %s: %s", call_kwargs.get('start_index'), e)
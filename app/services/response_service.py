@@ -1,5 +1,5 @@
 """Service for standardizing API responses."""
-from typing import Any, Dict, Optional, List, Union
+from typing import Any, Dict, Optional, List
 import datetime
 
 
@@ -1,8 +1,6 @@
 """Service for searching YouTube Music content."""
 from typing import Optional, List, Dict, Any, Union
 from ytmusicapi import YTMusic
-from math import ceil
-import asyncio
 
 from app.services.base_service import BaseService
 from app.services.pagination_service import PaginationService
@@ -11,11 +9,25 @@ from app.core.cache import cache_result
 from app.core.circuit_breaker import youtube_search_circuit
 from app.core.exceptions import (
     CircuitBreakerError,
-    ResourceNotFoundError,
-    ExternalServiceError,
 )
 
 
+def normalize_suggestion_query(query: str) -> str:
+    """
+    Normalize a partial query for suggestion caching.
+    
+    Suggestions do not depend on case or spacing, so "Taylor  Swif" and
+    "taylor swif" share one cache entry.
+    
+    Args:
+        query: Raw partial query.
+    
+    Returns:
+        Lowercased query with collapsed whitespace.
+    """
+    return " ".join(query.split()).lower()
+
+
 class SearchService(BaseService):
     """Service for searching music content."""
     
@@ -124,7 +136,7 @@ class SearchService(BaseService):
                         std_item = ResponseService.standardize_song_object(item, include_stream_url=True)
                         standardized_results.append(std_item)
                     except Exception as e:
-                        self.logger.warning(f"Standardization failed: {e}")
+                        self.logger.warning("Standardization failed: %s", e)
                         standardized_results.append(item)
                 else:
                     # Artists, albums, etc.
@@ -137,7 +149,7 @@ class SearchService(BaseService):
                 page_size=validated_limit
             )
 
-            self.logger.info(f"Search completed for '{query}': {len(paginated['items'])} results")
+            self.logger.info("Search completed for '%s': %s results", query, len(paginated['items']))
             return paginated
 
         except CircuitBreakerError:
@@ -147,7 +159,7 @@ class SearchService(BaseService):
             youtube_search_circuit.record_failure(str(e))
             raise self._handle_ytmusic_error(e, f"búsqueda '{query}'")
     
-    @cache_result(ttl=3600)
+    @cache_result(ttl=3600, key_normalizers={"query": normalize_suggestion_query})
     async def get_search_suggestions(
         self, query: str, detailed_runs: bool = False
     ) -> Union[List[str], List[Dict[str, Any]]]:
@@ -176,7 +188,7 @@ class SearchService(BaseService):
             youtube_search_circuit.record_success()
 
             self.logger.debug(
-                f"Got {len(suggestions)} suggestions for '{query}' (detailed={detailed_runs})"
+                "Got %s suggestions for '%s' (detailed=%s)", len(suggestions), query, detailed_runs
             )
             return suggestions
         except CircuitBreakerError:
@@ -1,19 +1,28 @@
 """Service for streaming audio with Redis caching."""
 import time
 import random
+import itertools
 import re
-from typing import Optional, Dict, Any, List
+import logging
+import os
+import multiprocessing
+import multiprocessing.util
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Set, Tuple, Coroutine, cast
 import asyncio
+import orjson
 import yt_dlp
 
 from app.services.base_service import BaseService
 from app.core.config import get_settings
 from app.core.cache_redis import (
-    get_cached_value,
-    set_cached_value,
-    get_cached_timestamp,
-    has_cached_key,
-    get_cached_values_batch_with_ttl,
+    bump_cache_generation,
+    delete_cached_key,
+    get_cache_generation,
+    get_cached_hash_fields,
+    set_cached_hash_fields,
 )
 from app.core.circuit_breaker import youtube_stream_circuit
 from app.core.exceptions import (
@@ -23,6 +32,209 @@ from app.core.exceptions import (
     ValidationError,
 )
 
+if TYPE_CHECKING:
+    from yt_dlp import _Params
+
+logger = logging.getLogger(__name__)
+
+# yt-dlp error classification (one compiled scan instead of a keyword loop).
+# Rate limits are not retried here: get_stream_url fails fast and lets the
+# circuit breaker back off
+_RECOVERABLE_ERROR_RE = re.compile(
+    r"timeout|connection|network|temporary failure|unable to extract",
+    re.IGNORECASE,
+)
+# Upper bound for one retry sleep, whatever the attempt
+_MAX_RETRY_DELAY = 30.0
+_RATE_LIMIT_ERROR_RE = re.compile(
+    r"rate[- ]limit|too many requests|429|resource_exhausted",
+    re.IGNORECASE,
+)
+# Errors that will not go away on retry (bad ID, private, removed, geo-blocked)
+_UNAVAILABLE_ERROR_RE = re.compile(
+    r"video unavailable|private video|has been removed|members[- ]only|"
+    r"available in your country|incomplete youtube id",
+    re.IGNORECASE,
+)
+
+# Fields of the yt-dlp info dict (and of each format) that get_stream_url reads
+_INFO_KEYS = ("title", "artist", "uploader", "duration", "url")
+_FORMAT_LIST_KEYS = ("requested_formats", "formats", "adaptive_formats")
+_FORMAT_KEYS = ("url", "acodec", "vcodec", "format_id", "ext")
+
+# Fields of the per-video stream hash (music:stream:{video_id})
+_STREAM_CACHE_FIELDS = ["meta", "url", "url_exp", "fail_exp"]
+
+# Configuración de yt-dlp para OBTENER SOLO AUDIO (audio-only)
+# Usar formato específico para audio-only sin video.
+# Construida una sola vez: es igual para todas las extracciones
+_STREAM_YDL_OPTS: Dict[str, Any] = {
+    'quiet': True,
+    'no_warnings': True,
+    # FORMA CORRECTA de obtener solo audio: usar formato específico
+    # 'bestaudio[ext=m4a]' = mejor audio en m4a
+    # '/bestaudio' = fallback a cualquier bestaudio
+    # '/bestaudio/best' = fallback final
+    'format': 'bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio/best',
+    'nocheckcertificate': True,
+    'extractor_args': {
+        'youtube': {
+            'player_client': ['android'],  # Faster - android first
+        }
+    },
+    'http_headers': {
+        'User-Agent': 'com.google.android.youtube/19.02.39 (Linux; U; Android 13; en_US) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
+    },
+    'socket_timeout': 30,
+    'retries': 2,
+    'check_runtime': False,
+    'no_color': True,
+    'allow_unplayable_formats': True,
+}
+
+# Reusable YoutubeDL instances keyed by (thread id, options signature), least
+# recently used first; instances are not shared between threads because
+# YoutubeDL is not thread-safe. Each thread keeps at most _YDL_CACHE_PER_THREAD
+# and evicts only its own (another thread's may be mid-extraction)
+_YDL_CACHE: "OrderedDict[Tuple[int, bytes], Any]" = OrderedDict()
+_YDL_CACHE_PER_THREAD = 4
+_YDL_CACHE_LOCK = threading.Lock()
+
+# Worker processes for yt-dlp (created lazily; None when YTDLP_PROCESSES is 0)
+_ytdlp_process_pool: Optional[ProcessPoolExecutor] = None
+
+# Threads for yt-dlp when no process pool is configured (created lazily)
+_ytdlp_thread_pool: Optional[ThreadPoolExecutor] = None
+
+
+def get_ytdlp_thread_pool() -> ThreadPoolExecutor:
+    """Get or create the thread pool used for in-process yt-dlp extractions."""
+    global _ytdlp_thread_pool
+    if _ytdlp_thread_pool is None:
+        # Own pool: slow extractions must not starve the loop's default executor,
+        # which asyncio also uses for DNS lookups
+        _ytdlp_thread_pool = ThreadPoolExecutor(
+            max_workers=get_settings().YTDLP_THREADS,
+            thread_name_prefix="ytdlp",
+        )
+    return _ytdlp_thread_pool
+
+
+def get_ytdlp_process_pool() -> Optional[ProcessPoolExecutor]:
+    """Get the process pool for yt-dlp extractions, or None to use threads."""
+    global _ytdlp_process_pool
+    workers = get_settings().YTDLP_PROCESSES
+    if workers <= 0:
+        return None
+    if _ytdlp_process_pool is None:
+        # spawn: forking a process that runs an event loop and thread pools is unsafe
+        _ytdlp_process_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _ytdlp_process_pool
+
+
+def _is_audio_only(f: Dict[str, Any]) -> bool:
+    """Audio-only if the format has an audio codec and no video codec."""
+    acodec = f.get('acodec')
+    vcodec = f.get('vcodec')
+    has_audio = acodec is not None and acodec != 'none' and acodec != ''
+    has_video = vcodec is not None and vcodec != 'none' and vcodec != ''
+    return has_audio and not has_video
+
+
+def _close_ydl(ydl: Any) -> None:
+    """Exit a cached YoutubeDL, saving its cookies and closing its handlers."""
+    try:
+        ydl.__exit__(None, None, None)
+    except Exception as e:
+        logger.debug("Error closing YoutubeDL: %s", e)
+
+
+def _get_ydl(ydl_opts: Dict[str, Any]) -> Any:
+    """Get this thread's YoutubeDL for the given options, creating it on first use."""
+    thread_id = threading.get_ident()
+    key = (thread_id, orjson.dumps(ydl_opts, option=orjson.OPT_SORT_KEYS))
+    with _YDL_CACHE_LOCK:
+        ydl = _YDL_CACHE.get(key)
+        if ydl is not None:
+            _YDL_CACHE.move_to_end(key)
+            return ydl
+
+    # Entered once and kept open; building extractors on every call is the expensive part
+    ydl = yt_dlp.YoutubeDL(cast("_Params", ydl_opts)).__enter__()
+    with _YDL_CACHE_LOCK:
+        _YDL_CACHE[key] = ydl
+        own_keys = [k for k in _YDL_CACHE if k[0] == thread_id]
+        evicted = [_YDL_CACHE.pop(k) for k in own_keys[:-_YDL_CACHE_PER_THREAD]]
+    for old in evicted:
+        _close_ydl(old)
+    return ydl
+
+
+def close_ydl_cache() -> None:
+    """Close and forget every cached YoutubeDL (call at shutdown)."""
+    with _YDL_CACHE_LOCK:
+        instances = list(_YDL_CACHE.values())
+        _YDL_CACHE.clear()
+    for ydl in instances:
+        _close_ydl(ydl)
+
+
+# Runs at interpreter exit, and also in process-pool workers, which skip atexit
+multiprocessing.util.Finalize(None, close_ydl_cache, exitpriority=10)
+
+
+def _extract_stream_info(
+    video_url: str,
+    ydl_opts: Dict[str, Any],
+    max_retries: int,
+    base_delay: float,
+    attempt: int = 0
+) -> Dict[str, Any]:
+    """
+    Extract info with yt-dlp, retrying recoverable errors with backoff.
+    
+    Module-level so it can run in a worker process; only the fields
+    get_stream_url reads are returned to keep the result cheap to pickle.
+    """
+    try:
+        info = _get_ydl(ydl_opts).extract_info(video_url, download=False)
+    except Exception as e:
+        # Errores recuperables que merecen retry
+        error_message = str(e)
+        recoverable = (
+            _RECOVERABLE_ERROR_RE.search(error_message) is not None
+            and _RATE_LIMIT_ERROR_RE.search(error_message) is None
+        )
+        
+        if recoverable and attempt < max_retries:
+            delay = min(_MAX_RETRY_DELAY, base_delay * (2 ** attempt) * (1 + random.random() * 0.5))
+            logger.warning("Retry %s/%s for %s after %.1fs: %s", attempt + 1, max_retries, video_url, delay, e)
+            time.sleep(delay)
+            return _extract_stream_info(video_url, ydl_opts, max_retries, base_delay, attempt + 1)
+        
+        logger.error("yt-dlp extraction error: %s", e)
+        raise
+    
+    slim = {key: info[key] for key in _INFO_KEYS if key in info}
+    for list_key in _FORMAT_LIST_KEYS:
+        if info.get(list_key):
+            slim[list_key] = [
+                {key: f[key] for key in _FORMAT_KEYS if key in f}
+                for f in info[list_key]
+            ]
+    return slim
+
+
+def _extract_stream_info_in_process(*args: Any) -> Dict[str, Any]:
+    """Process-pool entry point; re-raises errors as RuntimeError so they always unpickle."""
+    try:
+        return _extract_stream_info(*args)
+    except Exception as e:
+        raise RuntimeError(f"{type(e).__name__}: {e}") from None
+
 
 class StreamService(BaseService):
     """Service for audio streaming with Redis caching."""
@@ -30,6 +242,11 @@ class StreamService(BaseService):
     # TTL para diferentes tipos de datos
     METADATA_TTL = 86400  # 24 horas - metadatos no cambian
     STREAM_URL_TTL = 18000  # 5 horas - optimizado para velocidad (YouTube URLs expiran ~6h)
+    FAILURE_TTL = 600  # 10 minutos - no reintentar videos no disponibles
+    ENRICH_CONCURRENCY = (os.cpu_count() or 1) * 2  # extracciones simultáneas por enriquecimiento
+    LOCAL_SYNC_INTERVAL = 1.0  # segundos entre lecturas del contador de invalidación compartido
+    # Contador en Redis que los borrados de admin incrementan (fuera del patrón music:stream*)
+    _LOCAL_GENERATION_KEY = "music:invalidate:stream"
 
     # Límite dinámico de concurrencia basado en cuentas
     _extraction_semaphore = None 
@@ -53,70 +270,203 @@ class StreamService(BaseService):
             return
         super().__init__()
         self.settings = get_settings()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._pending_writes: Set[asyncio.Task] = set()
+        self._prefetches: Set[asyncio.Task] = set()
+        # Hot entries served without a Redis round trip (per process, LRU bounded by
+        # CACHE_MAX_SIZE), stored with the monotonic deadline of their URL so a hit
+        # is one lookup + compare
+        self._local_entries: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._local_generation: Optional[int] = None
+        self._local_synced_at = 0.0
         self._initialized = True
     
-    def _get_metadata_cache_key(self, video_id: str) -> str:
-        """Generate cache key for metadata."""
-        return f"music:stream:metadata:{video_id}"
+    def _get_stream_cache_key(self, video_id: str) -> str:
+        """Generate cache key for the video's stream hash (metadata + stream URL)."""
+        return f"music:stream:{video_id}"
     
-    def _get_stream_url_cache_key(self, video_id: str) -> str:
-        """Generate cache key for stream URL."""
-        return f"music:stream:url:{video_id}"
+    @staticmethod
+    def _fresh_stream_url(entry: Dict[str, Any]) -> Optional[str]:
+        """Return the entry's stream URL if it has not expired yet."""
+        stream_url = entry.get('url')
+        if stream_url and entry.get('url_exp', 0) > time.time():
+            return stream_url
+        return None
     
-    async def _get_cached_metadata(self, video_id: str) -> Optional[Dict[str, Any]]:
-        """Get cached metadata if available and not expired (async)."""
-        if not self.settings.CACHE_ENABLED:
+    def _local_get(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """Get a video's entry from the in-process LRU, dropping it once its URL expired."""
+        cached = self._local_entries.get(video_id)
+        if cached is None:
+            return None
+        entry, deadline = cached
+        if deadline <= time.monotonic():
+            del self._local_entries[video_id]
             return None
+        self._local_entries.move_to_end(video_id)
+        return entry
+    
+    def _local_put(self, video_id: str, entry: Dict[str, Any]) -> None:
+        """Remember an entry with a fresh URL in the in-process LRU."""
+        if self._fresh_stream_url(entry) is None:
+            return
+        # url_exp is wall-clock (shared across workers through Redis); the local
+        # deadline is monotonic so clock jumps cannot resurrect or drop entries
+        deadline = time.monotonic() + (entry['url_exp'] - time.time())
+        self._local_entries[video_id] = (entry, deadline)
+        self._local_entries.move_to_end(video_id)
+        while len(self._local_entries) > self.settings.CACHE_MAX_SIZE:
+            self._local_entries.popitem(last=False)
+    
+    def clear_local_cache(self) -> None:
+        """Forget every entry held in this process (Redis is left untouched)."""
+        self._local_entries.clear()
+    
+    async def invalidate_local_caches(self) -> None:
+        """Make every worker drop its in-process entries, this one right away."""
+        self._local_entries.clear()
+        await bump_cache_generation(self._LOCAL_GENERATION_KEY)
+    
+    async def _sync_local_cache(self) -> None:
+        """Drop the in-process LRU if another worker invalidated stream entries.
+        
+        The shared counter is read at most once per LOCAL_SYNC_INTERVAL, which
+        bounds how long a worker keeps serving an entry deleted elsewhere.
+        """
+        now = time.monotonic()
+        if now - self._local_synced_at < self.LOCAL_SYNC_INTERVAL:
+            return
+        self._local_synced_at = now
+        generation = await get_cache_generation(self._LOCAL_GENERATION_KEY)
+        if generation is not None and generation != self._local_generation:
+            self._local_entries.clear()
+            self._local_generation = generation
+    
+    async def _read_stream_entries(self, video_ids: List[str]) -> List[Dict[str, Any]]:
+        """Read the stream hash of several videos from Redis in one round trip.
         
-        cache_key = self._get_metadata_cache_key(video_id)
+        Returns:
+            One dict per video with the cached 'meta', 'url' and 'url_exp' fields.
+        """
+        if not self.settings.CACHE_ENABLED:
+            return [{} for _ in video_ids]
+        
+        return await get_cached_hash_fields(
+            [self._get_stream_cache_key(vid) for vid in video_ids],
+            _STREAM_CACHE_FIELDS,
+        )
+    
+    async def _get_stream_entries(self, video_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get the stream entries of several videos, in-process LRU first, then Redis.
         
+        Returns:
+            One dict per video with the cached 'meta', 'url' and 'url_exp' fields.
+        """
+        if not self.settings.CACHE_ENABLED:
+            return [{} for _ in video_ids]
+        
+        await self._sync_local_cache()
+        entries = [self._local_get(vid) for vid in video_ids]
+        missing = [vid for vid, entry in zip(video_ids, entries) if entry is None]
+        fetched: Dict[str, Dict[str, Any]] = {}
+        if missing:
+            fetched = dict(zip(missing, await self._read_stream_entries(missing)))
+            for vid, entry in fetched.items():
+                self._local_put(vid, entry)
+        return [entry if entry is not None else fetched[vid] for vid, entry in zip(video_ids, entries)]
+    
+    async def get_cached_stream_entry(self, video_id: str) -> Dict[str, Any]:
+        """Get the raw cached stream hash of a video ('meta', 'url', 'url_exp') for inspection."""
+        (entry,) = await self._read_stream_entries([video_id])
+        return entry
+    
+    async def _get_cached_metadata(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """Get cached metadata if available (the hash expires after METADATA_TTL)."""
         try:
-            # Check if key exists
-            if not await has_cached_key(cache_key):
-                return None
-            
-            # Get timestamp
-            timestamp = await get_cached_timestamp(cache_key)
-            if timestamp > 0 and (time.time() - timestamp) < self.METADATA_TTL:
-                cached_data = await get_cached_value(cache_key)
-                if cached_data:
-                    self.logger.info(f"✅ Cache HIT for metadata: {video_id}")
-                    return cached_data
+            (entry,) = await self._get_stream_entries([video_id])
+            if entry.get('meta'):
+                self.logger.info("Cache HIT for metadata: %s", video_id)
+                return entry['meta']
         except Exception as e:
-            self.logger.warning(f"Error getting cached metadata: {e}")
+            self.logger.warning("Error getting cached metadata: %s", e)
         
         return None
     
     async def _get_cached_stream_url(self, video_id: str) -> Optional[str]:
-        """Get cached stream URL if available. Redis TTL handles expiry automatically."""
-        if not self.settings.CACHE_ENABLED:
-            return None
-        
-        cache_key = self._get_stream_url_cache_key(video_id)
-        
+        """Get cached stream URL if available and not expired."""
         try:
-            cached_url = await get_cached_value(cache_key)
+            (entry,) = await self._get_stream_entries([video_id])
+            cached_url = self._fresh_stream_url(entry)
             if cached_url:
-                self.logger.info(f"✅ Cache HIT for stream URL: {video_id}")
+                self.logger.info("Cache HIT for stream URL: %s", video_id)
                 return cached_url
             else:
-                self.logger.debug(f"Cache MISS for stream URL: {video_id}")
+                self.logger.debug("Cache MISS for stream URL: %s", video_id)
         except Exception as e:
-            self.logger.warning(f"Error getting cached stream URL: {e}")
+            self.logger.warning("Error getting cached stream URL: %s", e)
         
         return None
     
+    async def get_cached_stream_urls(self, video_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the cached, unexpired stream URLs of several videos in one round trip.
+        
+        Args:
+            video_ids: Video IDs to look up.
+            
+        Returns:
+            Dict mapping video ID -> stream URL for the videos that are cached.
+        """
+        entries = await self._get_stream_entries(video_ids)
+        return {
+            vid: url
+            for vid, url in zip(video_ids, map(self._fresh_stream_url, entries))
+            if url
+        }
+    
+    async def _try_full_cache(self, video_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Read cached metadata and stream URL with a single HMGET.
+        
+        Returns:
+            Tuple of (metadata or None, stream URL or None if missing/expired).
+        
+        Raises:
+            ExternalServiceError: If there is no fresh URL and the video failed
+                to extract as unavailable within the last FAILURE_TTL seconds.
+        """
+        (entry,) = await self._get_stream_entries([video_id])
+        stream_url = self._fresh_stream_url(entry)
+        if stream_url is None and entry.get('fail_exp', 0) > time.time():
+            raise ExternalServiceError(
+                message="No se pudo obtener el stream de audio. Verifica el ID del video.",
+                details={"video_id": video_id, "operation": "get_stream_url"}
+            )
+        return entry.get('meta') or None, stream_url
+    
+    async def _write_stream_entry(self, video_id: str, fields: Dict[str, Any]) -> None:
+        """Set fields on the video's stream hash; the hash lives as long as the metadata."""
+        cached = self._local_entries.get(video_id)
+        self._local_put(video_id, {**(cached[0] if cached else {}), **fields})
+        await set_cached_hash_fields(self._get_stream_cache_key(video_id), fields, self.METADATA_TTL)
+    
+    def _stream_url_fields(self, stream_url: str, ttl: Optional[int]) -> Dict[str, Any]:
+        """Build the 'url'/'url_exp' hash fields for a stream URL."""
+        effective_ttl = ttl if ttl is not None else self.STREAM_URL_TTL
+        
+        # No cache for more than 6 hours (YouTube URLs typically expire in 6-12 hours)
+        effective_ttl = min(effective_ttl, 6 * 3600)
+        return {'url': stream_url, 'url_exp': time.time() + effective_ttl}
+    
     async def _cache_metadata(self, video_id: str, metadata: Dict[str, Any]) -> None:
         """Cache metadata with long TTL (async)."""
         if not self.settings.CACHE_ENABLED:
             return
         
-        cache_key = self._get_metadata_cache_key(video_id)
         try:
-            await set_cached_value(cache_key, metadata, self.METADATA_TTL)
-            self.logger.debug(f"Cached metadata for: {video_id} (TTL: {self.METADATA_TTL}s)")
+            await self._write_stream_entry(video_id, {'meta': metadata})
+            self.logger.debug("Cached metadata for: %s (TTL: %ss)", video_id, self.METADATA_TTL)
         except Exception as e:
-            self.logger.warning(f"Error caching metadata: {e}")
+            self.logger.warning("Error caching metadata: %s", e)
     
     async def _cache_stream_url(self, video_id: str, stream_url: str, ttl: Optional[int] = None) -> None:
         """Cache stream URL with TTL (async).
@@ -129,17 +479,65 @@ class StreamService(BaseService):
         if not self.settings.CACHE_ENABLED:
             return
         
-        cache_key = self._get_stream_url_cache_key(video_id)
-        effective_ttl = ttl if ttl is not None else self.STREAM_URL_TTL
+        try:
+            fields = self._stream_url_fields(stream_url, ttl)
+            await self._write_stream_entry(video_id, fields)
+            self.logger.info("Cached stream URL for: %s (expires: %d)", video_id, fields['url_exp'])
+        except Exception as e:
+            self.logger.warning("Error caching stream URL: %s", e)
+
+    async def _cache_stream_result(
+        self,
+        video_id: str,
+        metadata: Dict[str, Any],
+        stream_url: str,
+        ttl: int
+    ) -> None:
+        """Cache metadata and stream URL together with one HSET.
         
-        # No cache for more than 6 hours (YouTube URLs typically expire in 6-12 hours)
-        effective_ttl = min(effective_ttl, 6 * 3600)
+        Args:
+            video_id: Video ID
+            metadata: Metadata to cache (METADATA_TTL)
+            stream_url: Stream URL to cache
+            ttl: Stream URL TTL in seconds (capped at 6 hours like _cache_stream_url)
+        """
+        if not self.settings.CACHE_ENABLED:
+            return
+        
+        try:
+            fields = {'meta': metadata, **self._stream_url_fields(stream_url, ttl)}
+            await self._write_stream_entry(video_id, fields)
+            self.logger.info("Cached stream result for: %s (expires: %d)", video_id, fields['url_exp'])
+        except Exception as e:
+            self.logger.warning("Error caching stream result: %s", e)
+    
+    async def _cache_stream_failure(self, video_id: str) -> None:
+        """Remember for FAILURE_TTL seconds that a video could not be extracted."""
+        if not self.settings.CACHE_ENABLED:
+            return
         
         try:
-            await set_cached_value(cache_key, stream_url, effective_ttl)
-            self.logger.info(f"💾 Cached stream URL for: {video_id} (TTL: {effective_ttl}s)")
+            await self._write_stream_entry(video_id, {'fail_exp': time.time() + self.FAILURE_TTL})
+            self.logger.info("Cached stream failure for: %s (TTL: %ss)", video_id, self.FAILURE_TTL)
         except Exception as e:
-            self.logger.warning(f"Error caching stream URL: {e}")
+            self.logger.warning("Error caching stream failure: %s", e)
+    
+    def _write_in_background(self, write: Coroutine[Any, Any, None]) -> None:
+        """Run a cache write without making the caller wait on Redis."""
+        task = asyncio.create_task(write)
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+    
+    async def delete_cached_stream(self, video_id: str) -> bool:
+        """
+        Delete the cached metadata and stream URL of a video.
+        
+        Returns:
+            True if an entry was deleted.
+        """
+        deleted = await delete_cached_key(self._get_stream_cache_key(video_id))
+        await self.invalidate_local_caches()
+        return deleted
 
     async def _get_extraction_semaphore(self):
         """Get or create semaphore based on available accounts."""
@@ -155,7 +553,7 @@ class StreamService(BaseService):
             limit = count * 5
             self._extraction_semaphore = asyncio.Semaphore(limit)
             self._last_account_count = count
-            self.logger.info(f"🔄 Concurrency limit adjusted to {limit} (based on {count} accounts)")
+            self.logger.info("Concurrency limit adjusted to %s (based on %s accounts)", limit, count)
             
         return self._extraction_semaphore
 
@@ -198,13 +596,10 @@ class StreamService(BaseService):
         
         # Try to get from cache first (unless bypass)
         if not bypass_cache:
-            cached_metadata = await self._get_cached_metadata(video_id)
-            cached_stream_url = await self._get_cached_stream_url(video_id)
-            
-            self.logger.info(f"🔍 Cache check for {video_id}: metadata={cached_metadata is not None}, url={cached_stream_url is not None}")
+            cached_metadata, cached_stream_url = await self._try_full_cache(video_id)
             
             if cached_metadata and cached_stream_url:
-                self.logger.info(f"🎯 Fully cached response for: {video_id}")
+                self.logger.debug("🎯 Fully cached response for: %s", video_id)
                 return {
                     "streamUrl": cached_stream_url,
                     "title": cached_metadata.get("title"),
@@ -214,66 +609,42 @@ class StreamService(BaseService):
                     "from_cache": True
                 }
             elif cached_stream_url:
-                self.logger.info(f"⚡ Stream URL cached for: {video_id}")
+                self.logger.debug("⚡ Stream URL cached for: %s", video_id)
                 return {"streamUrl": cached_stream_url, "from_cache": True}
         
-        self.logger.info(f"🔄 Fetching fresh stream URL for: {video_id} (bypass_cache={bypass_cache})")
+        self.logger.info("Fetching fresh stream URL for: %s (bypass_cache=%s)", video_id, bypass_cache)
+        
+        # Single-flight: concurrent misses for the same video share one extraction
+        task = self._inflight.get(video_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_stream_url(video_id))
+            self._inflight[video_id] = task
+            task.add_done_callback(lambda t: self._finish_inflight(video_id, t))
+        else:
+            self.logger.info("Joining in-flight extraction for: %s", video_id)
+        
+        # Shield so one cancelled caller does not cancel the shared extraction
+        return await asyncio.shield(task)
+    
+    def _finish_inflight(self, video_id: str, task: asyncio.Task) -> None:
+        """Drop a finished extraction, retrieving its error so it is never reported as unhandled."""
+        self._inflight.pop(video_id, None)
+        if not task.cancelled():
+            task.exception()
+    
+    async def _fetch_stream_url(self, video_id: str) -> Dict[str, Any]:
+        """
+        Extract a fresh stream URL with yt-dlp and cache it.
+        
+        Args:
+            video_id: Video ID.
         
+        Returns:
+            Dictionary with stream URL and metadata.
+        """
         try:
             video_url = f"https://www.youtube.com/watch?v={video_id}"
             
-            # Configuración de yt-dlp para OBTENER SOLO AUDIO (audio-only)
-            # Usar formato específico para audio-only sin video
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                # FORMA CORRECTA de obtener solo audio: usar formato específico
-                # 'bestaudio[ext=m4a]' = mejor audio en m4a
-                # '/bestaudio' = fallback a cualquier bestaudio
-                # '/bestaudio/best' = fallback final
-                'format': 'bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio/best',
-                'nocheckcertificate': True,
-                'extractor_args': {
-                    'youtube': {
-                        'player_client': ['android'],  # Faster - android first
-                    }
-                },
-                'http_headers': {
-                    'User-Agent': 'com.google.android.youtube/19.02.39 (Linux; U; Android 13; en_US) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
-                },
-                'socket_timeout': 30,
-                'retries': 2,
-                'check_runtime': False,
-                'no_color': True,
-                'allow_unplayable_formats': True,
-                # Optimize for speed
-                'no_warnings': True,
-                'quiet': True,
-            }
-            
-            def extract_info_with_retry(attempt: int = 0) -> Dict[str, Any]:
-                """Extract info with retry logic."""
-                try:
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        return ydl.extract_info(video_url, download=False)
-                except Exception as e:
-                    error_str = str(e).lower()
-                    
-                    # Errores recuperables que merecen retry
-                    recoverable = any(keyword in error_str for keyword in [
-                        'timeout', 'connection', 'network', 'temporary failure',
-                        'unable to extract', 'rate', '429'
-                    ])
-                    
-                    if recoverable and attempt < self.MAX_RETRIES:
-                        delay = self.BASE_DELAY * (2 ** attempt) + random.uniform(0, 1)
-                        self.logger.warning(f"Retry {attempt + 1}/{self.MAX_RETRIES} for {video_id} after {delay:.1f}s: {str(e)}")
-                        time.sleep(delay)
-                        return extract_info_with_retry(attempt + 1)
-                    
-                    self.logger.error(f"yt-dlp extraction error: {str(e)}")
-                    raise
-            
             # Use dynamic semaphore based on accounts
             semaphore = await self._get_extraction_semaphore()
             async with semaphore:
@@ -283,58 +654,48 @@ class StreamService(BaseService):
                 account = manager.get_best_account()
                 if account: account.total_requests += 1
                 
-                info = await asyncio.to_thread(extract_info_with_retry)
+                extract_args = (video_url, _STREAM_YDL_OPTS, self.MAX_RETRIES, self.BASE_DELAY)
+                process_pool = get_ytdlp_process_pool()
+                loop = asyncio.get_running_loop()
+                if process_pool is not None:
+                    # yt-dlp is CPU-bound (signature decipher, JS); processes avoid the GIL
+                    info = await loop.run_in_executor(
+                        process_pool, _extract_stream_info_in_process, *extract_args
+                    )
+                else:
+                    info = await loop.run_in_executor(
+                        get_ytdlp_thread_pool(), _extract_stream_info, *extract_args
+                    )
                 
                 if account: account.mark_success()
             
-            # Buscar formato de audio
-            audio_url = None
-            
-            self.logger.info(f"📋 Available formats: {len(info.get('formats', []))}, requested: {len(info.get('requested_formats', []))}")
-            
-            # Helper function to check if format is audio-only
-            def is_audio_only(f):
-                acodec = f.get('acodec')
-                vcodec = f.get('vcodec')
-                # Audio-only if: has audio codec AND no video codec
-                has_audio = acodec is not None and acodec != 'none' and acodec != ''
-                has_video = vcodec is not None and vcodec != 'none' and vcodec != ''
-                return has_audio and not has_video
-            
-            # PRIMERO: Buscar en requested_formats (mejores formatos)
-            requested_formats = info.get('requested_formats') or []
-            for f in requested_formats:
-                if is_audio_only(f):
-                    audio_url = f['url']
-                    self.logger.info(f"✅ Found audio in requested_formats: itag={f.get('format_id')}, ext={f.get('ext')}, acodec={f.get('acodec')}")
-                    break
-            
-            # SEGUNDO: Si no hay en requested_formats, buscar en formats
-            if not audio_url:
-                formats = info.get('formats') or []
-                for f in formats:
-                    if is_audio_only(f):
-                        audio_url = f['url']
-                        self.logger.info(f"✅ Found audio in formats: itag={f.get('format_id')}, ext={f.get('ext')}")
-                        break
-            
-            # TERCERO: Si no hay audio-only, buscar en adaptive formats
-            if not audio_url:
-                adaptive_formats = info.get('adaptive_formats') or []
-                for f in adaptive_formats:
-                    if is_audio_only(f):
-                        audio_url = f['url']
-                        self.logger.info(f"✅ Found audio in adaptive: itag={f.get('format_id')}, ext={f.get('ext')}")
-                        break
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Available formats: %s, requested: %s",
+                    len(info.get('formats') or ()), len(info.get('requested_formats') or ())
+                )
             
-            # Último recurso - usar URL directa si ninguna otra funciónó
-            if not audio_url:
-                if info.get('url'):
-                    audio_url = info['url']
-                    self.logger.warning(f"⚠️ No audio-only format found, using direct URL")
+            # Primer formato audio-only en orden de preferencia: requested_formats
+            # (mejores formatos), luego formats, luego adaptive_formats
+            candidates = itertools.chain.from_iterable(
+                info.get(list_key) or () for list_key in _FORMAT_LIST_KEYS
+            )
+            audio_format = next((f for f in candidates if _is_audio_only(f) and f.get('url')), None)
+            if audio_format is not None:
+                audio_url = audio_format['url']
+                self.logger.debug(
+                    "Found audio format: itag=%s, ext=%s, acodec=%s",
+                    audio_format.get('format_id'), audio_format.get('ext'), audio_format.get('acodec')
+                )
+            else:
+                # Último recurso - usar URL directa si ninguna otra funcionó
+                audio_url = info.get('url')
+                if audio_url:
+                    self.logger.warning("No audio-only format found, using direct URL")
             
             if not audio_url:
-                self.logger.warning(f"yt-dlp could not get stream for: {video_id}")
+                self.logger.warning("yt-dlp could not get stream for: %s", video_id)
+                self._write_in_background(self._cache_stream_failure(video_id))
                 raise ExternalServiceError(
                     message="No se pudo obtener el stream de audio. Verifica el ID del video.",
                     details={"video_id": video_id, "operation": "get_stream_url"}
@@ -355,7 +716,7 @@ class StreamService(BaseService):
                     url_expire = int(expire_match.group(1))
                     current_time = int(time.time())
                     calculated_ttl = max(0, url_expire - current_time)  # Ensure non-negative
-                    self.logger.info(f"🔗 YouTube URL expira en {calculated_ttl} segundos (expire={url_expire}, now={current_time})")
+                    self.logger.debug("YouTube URL expira en %s segundos (expire=%s, now=%s)", calculated_ttl, url_expire, current_time)
             
             # Extraer metadatos
             metadata = {
@@ -367,14 +728,16 @@ class StreamService(BaseService):
             
             # Cache both metadata and stream URL
             # Usar el TTL calculado de YouTube si está disponible (con margen de 15 min)
-            await self._cache_metadata(video_id, metadata)
             # Cache URL por máximo 5 horas (o lo que falte para que expire la URL de YouTube)
             cache_ttl = min(calculated_ttl - 900, self.STREAM_URL_TTL) if url_expire else self.STREAM_URL_TTL
             # Asegurar que el TTL no sea negativo
             cache_ttl = max(60, cache_ttl)
-            await self._cache_stream_url(video_id, audio_url, ttl=cache_ttl)
+            # Written in the background so the response does not wait on Redis
+            self._write_in_background(
+                self._cache_stream_result(video_id, metadata, audio_url, cache_ttl)
+            )
             
-            self.logger.info(f"✅ Retrieved stream URL for: {video_id}")
+            self.logger.info("Retrieved stream URL for: %s", video_id)
             return {**metadata, "streamUrl": audio_url, "from_cache": False}
         
         except (CircuitBreakerError, RateLimitError, ExternalServiceError, ValidationError):
@@ -382,15 +745,10 @@ class StreamService(BaseService):
         
         except Exception as e:
             error_message = str(e)
-            is_rate_limit = any(keyword in error_message.lower() for keyword in [
-                'rate-limit', 'rate limit', 'rate-limited', 'too many requests',
-                '429', 'resource_exhausted', 'session has been rate-limited'
-            ])
-            
-            if is_rate_limit:
+            if _RATE_LIMIT_ERROR_RE.search(error_message):
                 youtube_stream_circuit.record_failure(error_message)
                 status = youtube_stream_circuit.get_status()
-                self.logger.error(f"Rate limit hit for stream: {video_id}")
+                self.logger.error("Rate limit hit for stream: %s", video_id)
                 raise RateLimitError(
                     message="Límite de peticiones excedido. Intenta más tarde.",
                     details={
@@ -399,7 +757,9 @@ class StreamService(BaseService):
                     }
                 )
             
-            self.logger.error(f"Error getting stream for {video_id}: {error_message}")
+            self.logger.error("Error getting stream for %s: %s", video_id, error_message)
+            if _UNAVAILABLE_ERROR_RE.search(error_message):
+                self._write_in_background(self._cache_stream_failure(video_id))
             raise ExternalServiceError(
                 message="Error obteniendo stream de audio. Intenta más tarde.",
                 details={"operation": "get_stream_url", "video_id": video_id}
@@ -411,13 +771,11 @@ class StreamService(BaseService):
         video_id = item.get('videoId') or item.get('video_id')
         
         if thumbnails and isinstance(thumbnails, list):
-            # Sort by resolution (width * height)
-            sorted_thumbs = sorted(
+            # Highest resolution (width * height) in a single pass
+            best_thumb = max(
                 thumbnails,
-                key=lambda x: (x.get('width', 0) or 0) * (x.get('height', 0) or 0),
-                reverse=True
+                key=lambda x: (x.get('width') or 0) * (x.get('height') or 0)
             )
-            best_thumb = sorted_thumbs[0]
             
             if isinstance(best_thumb, dict) and best_thumb.get('url'):
                 return self._enhance_thumbnail_url(best_thumb['url'], video_id)
@@ -464,8 +822,7 @@ class StreamService(BaseService):
         if not video_id:
             video_id = item.get('videoId') or item.get('video_id')
         
-        enriched = item.copy()
-        enriched['thumbnail'] = self._get_best_thumbnail(item)
+        enriched = {**item, 'thumbnail': self._get_best_thumbnail(item)}
         
         if video_id:
             try:
@@ -494,86 +851,72 @@ class StreamService(BaseService):
         if not items:
             return []
         
-        self.logger.debug(f"Enriching {len(items)} items with streams")
+        self.logger.debug("Enriching %s items with streams", len(items))
+        
+        # Unique IDs, in order: repeated tracks need one lookup/extraction
+        video_ids = list(dict.fromkeys(
+            vid for item in items
+            if (vid := item.get('videoId') or item.get('video_id'))
+        )) if include_stream_urls else []
+        
+        # FASE 1: Batch check cache in ONE Redis round trip, started before the
+        # thumbnail pass so the round trip overlaps it
+        cache_lookup = None
+        if video_ids and not bypass_cache:
+            cache_lookup = asyncio.ensure_future(self.get_cached_stream_urls(video_ids))
         
         items_with_thumbnails = [
             {**item, 'thumbnail': self._get_best_thumbnail(item)}
             for item in items
         ]
         
-        if not include_stream_urls:
-            return items_with_thumbnails
-        
-        video_ids = [
-            item.get('videoId') or item.get('video_id')
-            for item in items_with_thumbnails
-            if item.get('videoId') or item.get('video_id')
-        ]
-        
         if not video_ids:
             return items_with_thumbnails
         
-        # Build cache keys
-        cache_keys = [self._get_stream_url_cache_key(vid) for vid in video_ids]
-        self.logger.info(f"Checking cache for {len(video_ids)} video IDs")
+        self.logger.info("Checking cache for %s video IDs", len(video_ids))
         
         # Si bypass_cache=True, saltamos la verificación de cache
-        if bypass_cache:
+        if cache_lookup is None:
             uncached_video_ids = video_ids
             cached_urls = {}
-            self.logger.info(f"bypass_cache=True: Fetching fresh URLs for {len(video_ids)} videos from YouTube")
+            self.logger.info("bypass_cache=True: Fetching fresh URLs for %s videos from YouTube", len(video_ids))
         else:
-            # FASE 1: Batch check cache with ONE Redis MGET call
-            cached_values = await get_cached_values_batch_with_ttl(cache_keys, self.STREAM_URL_TTL)
-            
-            cached_urls = {}
-            uncached_video_ids = []
+            cached_urls = await cache_lookup
+            uncached_video_ids = [vid for vid in video_ids if vid not in cached_urls]
             
-            for vid, cache_key in zip(video_ids, cache_keys):
-                cached_value = cached_values.get(cache_key)
-                if cached_value:
-                    cached_urls[vid] = cached_value
-                    self.logger.debug(f"Cache HIT: {vid}")
-                else:
-                    uncached_video_ids.append(vid)
-            
-            self.logger.info(f"Cache stats: {len(cached_urls)} cached, {len(uncached_video_ids)} need fetch")
+            self.logger.info("Cache stats: %s cached, %s need fetch", len(cached_urls), len(uncached_video_ids))
         
-        # FASE 2: Fetch uncached URLs in parallel (Optimized for FULL response)
+        # FASE 2: Fetch uncached URLs in parallel, at most ENRICH_CONCURRENCY at a
+        # time so one large page does not take every extraction slot
         if uncached_video_ids:
-            semaphore = await self._get_extraction_semaphore()
-            self.logger.info(f"🚀 Fetching {len(uncached_video_ids)} stream URLs in parallel (Concurrency: {self._last_account_count * 5})...")
+            semaphore = asyncio.Semaphore(self.ENRICH_CONCURRENCY)
+            self.logger.info("Fetching %s stream URLs in parallel (concurrency: %s)", len(uncached_video_ids), self.ENRICH_CONCURRENCY)
+            
+            async def fetch_guarded(vid: str) -> Tuple[str, Dict[str, Any]]:
+                async with semaphore:
+                    return vid, await self._safe_get_stream_url(vid)
             
-            # Use a longer timeout for large batches to ensure we get ALL urls
-            # but still safe for the client
             try:
-                stream_tasks = [self._safe_get_stream_url(vid) for vid in uncached_video_ids]
-                # wait for ALL tasks to complete or fail
-                stream_results = await asyncio.gather(*stream_tasks, return_exceptions=True)
-                
-                for i, result in enumerate(stream_results):
-                    vid = uncached_video_ids[i]
-                    if isinstance(result, dict):
-                        url = result.get('streamUrl') or result.get('stream_url')
-                        if url:
-                            cached_urls[vid] = url
+                for next_done in asyncio.as_completed([fetch_guarded(vid) for vid in uncached_video_ids]):
+                    vid, result = await next_done
+                    url = result.get('streamUrl') or result.get('stream_url')
+                    if url:
+                        cached_urls[vid] = url
             except Exception as e:
-                self.logger.error(f"Error during parallel enrichment: {e}")
+                self.logger.error("Error during parallel enrichment: %s", e)
         
         # FASE 3: Combine results
-        enriched_items = []
+        # items_with_thumbnails already holds fresh copies (thumbnail computed once
+        # in the first pass), so they are filled in place
         for item in items_with_thumbnails:
-            enriched_item = item.copy()
-            video_id = enriched_item.get('videoId') or enriched_item.get('video_id')
+            video_id = item.get('videoId') or item.get('video_id')
             
             if video_id and video_id in cached_urls:
-                enriched_item['stream_url'] = cached_urls[video_id]
-                self.logger.info(f"Adding stream_url to {video_id}: {cached_urls[video_id][:50]}...")
-            
-            enriched_items.append(enriched_item)
+                item['stream_url'] = cached_urls[video_id]
+                self.logger.debug("Adding stream_url to %s: %.50s...", video_id, cached_urls[video_id])
         
-        self.logger.info(f"Enriched {len(enriched_items)} items, {len(cached_urls)} with stream URLs")
-        return enriched_items
+        self.logger.info("Enriched %s items, %s with stream URLs", len(items_with_thumbnails), len(cached_urls))
+        return items_with_thumbnails
     
     async def _safe_get_stream_url(self, video_id: str) -> Dict[str, Any]:
         """Safely get stream URL, returning empty dict on error."""
@@ -582,6 +925,21 @@ class StreamService(BaseService):
         except Exception:
             return {}
     
+    def prefetch_stream_urls(self, video_ids: List[str]) -> None:
+        """
+        Warm the stream cache for videos likely to be played next.
+        
+        Fire-and-forget: extractions run in the background (errors are
+        swallowed) and share the in-flight extraction of a concurrent request.
+        
+        Args:
+            video_ids: Video IDs to prefetch.
+        """
+        for video_id in video_ids:
+            task = asyncio.create_task(self._safe_get_stream_url(video_id))
+            self._prefetches.add(task)
+            task.add_done_callback(self._prefetches.discard)
+    
     async def is_cached(self, video_id: str) -> bool:
         """
         Check if stream URL is cached for a video.
@@ -592,15 +950,9 @@ class StreamService(BaseService):
         Returns:
             True if cached, False otherwise.
         """
-        cache_key = self._get_stream_url_cache_key(video_id)
-        
         try:
-            if await has_cached_key(cache_key):
-                # Also check if not expired
-                timestamp = await get_cached_timestamp(cache_key)
-                if timestamp > 0:
-                    elapsed = time.time() - timestamp
-                    return elapsed < self.STREAM_URL_TTL
+            (entry,) = await self._get_stream_entries([video_id])
+            return self._fresh_stream_url(entry) is not None
         except Exception:
             pass
         
@@ -616,13 +968,10 @@ class StreamService(BaseService):
         Returns:
             Seconds remaining in cache, or 0 if not cached.
         """
-        cache_key = self._get_stream_url_cache_key(video_id)
-        
         try:
-            timestamp = await get_cached_timestamp(cache_key)
-            if timestamp > 0:
-                remaining = int(self.STREAM_URL_TTL - (time.time() - timestamp))
-                return max(0, remaining)
+            (entry,) = await self._get_stream_entries([video_id])
+            if entry.get('url'):
+                return max(0, int(entry.get('url_exp', 0) - time.time()))
         except Exception:
             pass
         
@@ -1,9 +1,8 @@
 """Service for watch playlists."""
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any
 from ytmusicapi import YTMusic
-import asyncio
 
-from app.services.base_service import BaseService
+from app.services.base_service import BaseService, ytm_safe
 from app.services.pagination_service import PaginationService
 from app.services.response_service import ResponseService
 from app.core.cache import cache_result
@@ -22,6 +21,7 @@ class WatchService(BaseService):
         super().__init__(ytmusic)
     
     @cache_result(ttl=3600)
+    @ytm_safe("obtener watch playlist (video_id: {video_id}, playlist_id: {playlist_id})")
     async def get_watch_playlist(
         self,
         video_id: Optional[str] = None,
@@ -56,63 +56,56 @@ class WatchService(BaseService):
             page=page
         )
 
-        try:
-            result = await asyncio.to_thread(
-                self.ytmusic.get_watch_playlist,
-                videoId=video_id,
-                playlistId=playlist_id,
-                limit=limit,
-                radio=radio,
-                shuffle=shuffle
-            )
+        result = await self._run(
+            self.ytmusic.get_watch_playlist,
+            videoId=video_id,
+            playlistId=playlist_id,
+            limit=limit,
+            radio=radio,
+            shuffle=shuffle
+        )
 
-            if result is None:
-                return {
-                    "items": [],
-                    "pagination": {
-                        "total_results": 0,
-                        "total_pages": 0,
-                        "page": page,
-                        "page_size": page_size,
-                        "start_index": 0,
-                        "end_index": 0,
-                        "has_next": False,
-                        "has_prev": False
-                    }
+        if result is None:
+            return {
+                "items": [],
+                "pagination": {
+                    "total_results": 0,
+                    "total_pages": 0,
+                    "page": page,
+                    "page_size": page_size,
+                    "start_index": 0,
+                    "end_index": 0,
+                    "has_next": False,
+                    "has_prev": False
                 }
+            }
 
-            # Extract and standardize tracks
-            tracks = result.get('tracks', [])
-            standardized_tracks = [
-                ResponseService.standardize_song_object(track, include_stream_url=False)
-                for track in tracks
-            ]
-
-            # Apply standardized pagination
-            paginated = PaginationService.paginate(
-                standardized_tracks,
-                page=page,
-                page_size=page_size
-            )
+        # Extract and standardize tracks
+        tracks = result.get('tracks', [])
+        standardized_tracks = [
+            ResponseService.standardize_song_object(track, include_stream_url=False)
+            for track in tracks
+        ]
 
-            # Build response with watch playlist metadata
-            response = {
-                "watch_playlist_metadata": {
-                    "title": result.get('title', ''),
-                    "playlist_id": result.get('playlistId', ''),
-                },
-                "items": paginated['items'],
-                "pagination": paginated['pagination']
-            }
+        # Apply standardized pagination
+        paginated = PaginationService.paginate(
+            standardized_tracks,
+            page=page,
+            page_size=page_size
+        )
 
-            self.logger.info(
-                f"Retrieved watch playlist: {len(paginated['items'])} tracks "
-                f"(video_id={video_id}, playlist_id={playlist_id}, page={page})"
-            )
-            return response
+        # Build response with watch playlist metadata
+        response = {
+            "watch_playlist_metadata": {
+                "title": result.get('title', ''),
+                "playlist_id": result.get('playlistId', ''),
+            },
+            "items": paginated['items'],
+            "pagination": paginated['pagination']
+        }
 
-        except Exception as e:
-            raise self._handle_ytmusic_error(
-                e, 
-                f"obtener watch playlist (video_id: {video_id}, playlist_id: {playlist_id})"
-            )
+        self.logger.info(
+            "Retrieved watch playlist: %d tracks (video_id=%s, playlist_id=%s, page=%s)",
+            len(paginated['items']), video_id, playlist_id, page
+        )
+        return response
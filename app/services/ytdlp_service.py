@@ -2,8 +2,9 @@
 import asyncio
 import yt_dlp
 import logging
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict
 from app.services.base_service import BaseService
+from app.services.stream_service import get_ytdlp_thread_pool
 from app.core.exceptions import ExternalServiceError
 
 logger = logging.getLogger(__name__)
@@ -36,8 +37,10 @@ class YtdlpService(BaseService):
                 with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                     return ydl.extract_info(url, download=False)
             
-            # Ejecutar en un hilo separado para no bloquear el loop de eventos de FastAPI
-            info = await asyncio.to_thread(_extract)
+            # Ejecutar en el pool de yt-dlp para no bloquear el loop de eventos de FastAPI
+            # ni ocupar el executor por defecto (DNS y otras llamadas bloqueantes)
+            loop = asyncio.get_running_loop()
+            info = await loop.run_in_executor(get_ytdlp_thread_pool(), _extract)
             
             if not info:
                 raise ExternalServiceError(
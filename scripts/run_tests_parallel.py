@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Run the whole test suite as several concurrent pytest processes.
+
+Test files are split into max(1, cpu_count - 2) shards (at most 16), balanced
+by file size, and each shard runs in its own serial pytest process (-n 0)
+against its own Redis DB, so one shard's cache flush cannot wipe another's
+keys. Use this or the default pytest-xdist run (pytest.ini), not both.
+Run from the repository root: python scripts/run_tests_parallel.py [pytest args]
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Redis has 16 DBs by default and every shard gets its own
+MAX_SHARDS = 16
+
+
+def make_shards(files: list[Path], count: int) -> list[list[Path]]:
+    """Greedily assign the largest files first to the lightest shard."""
+    shards: list[list[Path]] = [[] for _ in range(count)]
+    weights = [0] * count
+    for path in sorted(files, key=lambda p: p.stat().st_size, reverse=True):
+        i = weights.index(min(weights))
+        shards[i].append(path)
+        weights[i] += path.stat().st_size
+    return [shard for shard in shards if shard]
+
+
+async def run_shard(index: int, files: list[Path], extra_args: list[str]) -> int:
+    base_db = int(os.environ.get("REDIS_DB", "0"))
+    env = {**os.environ, "REDIS_DB": str(base_db + index - 1)}
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "pytest", "-q", "-n", "0", *extra_args,
+        *(str(p.relative_to(ROOT)) for p in files),
+        cwd=ROOT,
+        env=env,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    output, _ = await proc.communicate()
+    print(f"===== shard {index} ({len(files)} files) exit={proc.returncode} =====")
+    print(output.decode("utf-8", errors="replace"), flush=True)
+    return proc.returncode
+
+
+async def main(extra_args: list[str]) -> int:
+    files = sorted((ROOT / "tests").rglob("test_*.py"))
+    if not files:
+        print("No test files found")
+        return 1
+    count = min(MAX_SHARDS, max(1, (os.cpu_count() or 1) - 2))
+    shards = make_shards(files, min(count, len(files)))
+    codes = await asyncio.gather(
+        *(run_shard(i, shard, extra_args) for i, shard in enumerate(shards, 1))
+    )
+    failed = [i for i, code in enumerate(codes, 1) if code != 0]
+    if failed:
+        print(f"Failed shards: {', '.join(map(str, failed))}")
+        return 1
+    print(f"All {len(shards)} shards passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
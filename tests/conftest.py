@@ -1,16 +1,43 @@
 """Shared fixtures for YouTube Music Service tests."""
 import asyncio
+import copy
+import os
 import pytest
+from contextlib import contextmanager
+from functools import lru_cache
 from unittest.mock import AsyncMock, MagicMock, patch
-from typing import Dict, Any, List
-
-from fastapi.testclient import TestClient
-from httpx import AsyncClient, ASGITransport
+from typing import TYPE_CHECKING, Dict, Any, List
+
+# Under pytest-xdist every worker gets its own Redis DB (base REDIS_DB + worker
+# index), so one worker's flushdb in reset_cache cannot wipe keys a test on
+# another worker is using. Set before any app module reads the settings.
+_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+if _xdist_worker:
+    os.environ["REDIS_DB"] = str(
+        int(os.environ.get("REDIS_DB", "0")) + int(_xdist_worker.removeprefix("gw"))
+    )
 
-from app.main import app
 from app.core.config import Settings
+from app.core.ytmusic_client import get_ytmusic
 from app.core.cache import clear_cache
 
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from httpx import AsyncClient
+
+
+@lru_cache(maxsize=None)
+def _load_app() -> "FastAPI":
+    """Import the FastAPI app on first use.
+
+    Building it pulls in every router; unit-test runs that never request a
+    client fixture skip that cost.
+    """
+    from app.main import app
+
+    return app
+
 
 # ============================================================================
 # Event Loop
@@ -72,48 +99,106 @@ def mock_settings_with_cache(mock_settings: Settings) -> Settings:
 # YTMusic Mock Fixtures
 # ============================================================================
 
-@pytest.fixture
-def mock_ytmusic():
-    """Create mock YTMusic client."""
-    mock = MagicMock()
-    
+# Mocks below are built once per session and reset before each test: fixtures
+# hand out the shared instance after _reset_mock clears calls, return values
+# and side effects and re-applies the defaults
+
+def _reset_mock(mock: MagicMock, returns: Dict[str, Any]) -> MagicMock:
+    """Reset ``mock`` and set each ``returns`` entry as a method's return value."""
+    mock.reset_mock(return_value=True, side_effect=True)
+    for name, value in returns.items():
+        # Copy so a test mutating a default cannot change it for later tests
+        getattr(mock, name).return_value = copy.deepcopy(value)
+    return mock
+
+
+_YTMUSIC_RETURNS: Dict[str, Any] = {
     # Search methods
-    mock.search.return_value = []
-    mock.get_search_suggestions.return_value = []
-    mock.remove_search_suggestions.return_value = True
-    
+    "search": [],
+    "get_search_suggestions": [],
+    "remove_search_suggestions": True,
     # Browse methods
-    mock.get_home.return_value = []
-    mock.get_artist.return_value = {}
-    mock.get_artist_albums.return_value = {}
-    mock.get_album.return_value = {}
-    mock.get_album_browse_id.return_value = None
-    mock.get_song.return_value = {}
-    mock.get_song_related.return_value = []
-    mock.get_lyrics.return_value = {}
-    
+    "get_home": [],
+    "get_artist": {},
+    "get_artist_albums": {},
+    "get_album": {},
+    "get_album_browse_id": None,
+    "get_song": {},
+    "get_song_related": [],
+    "get_lyrics": {},
     # Explore methods
-    mock.get_mood_categories.return_value = {}
-    mock.get_mood_playlists.return_value = []
-    mock.get_charts.return_value = {}
-    
+    "get_mood_categories": {},
+    "get_mood_playlists": [],
+    "get_charts": {},
     # Playlist methods
-    mock.get_playlist.return_value = {}
-    
+    "get_playlist": {},
     # Watch methods
-    mock.get_watch_playlist.return_value = {}
-    
-    return mock
+    "get_watch_playlist": {},
+}
+
+
+@pytest.fixture(scope="session")
+def _ytmusic_mock() -> MagicMock:
+    """Session-wide YTMusic stand-in."""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_ytmusic(_ytmusic_mock):
+    """Create mock YTMusic client."""
+    return _reset_mock(_ytmusic_mock, _YTMUSIC_RETURNS)
 
 
 # ============================================================================
 # Sample Data Fixtures
 # ============================================================================
+# Built once per session and frozen, so a test that mutates one fails loudly
+# instead of leaking into later tests (see sample_playlist for a per-test,
+# mutable copy)
 
-@pytest.fixture
+def _read_only(self, *args, **kwargs):
+    raise TypeError("sample fixtures are shared across the session; copy before mutating")
+
+
+class _FrozenDict(dict):
+    """dict that rejects mutation; still passes isinstance(..., dict) checks."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+
+class _FrozenList(list):
+    """list that rejects mutation; still passes isinstance(..., list) checks."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(v, memo) for v in self]
+
+
+def _freeze(obj: Any) -> Any:
+    """Return a read-only copy of nested sample data."""
+    if isinstance(obj, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return _FrozenList(_freeze(x) for x in obj)
+    return obj
+
+
+@pytest.fixture(scope="session")
 def sample_song() -> Dict[str, Any]:
     """Sample song data for testing."""
-    return {
+    return _freeze({
         "videoId": "abc123xyz",
         "title": "Test Song",
         "artists": [{"name": "Test Artist", "id": "UC123"}],
@@ -125,13 +210,13 @@ def sample_song() -> Dict[str, Any]:
             {"url": "https://example.com/thumb2.jpg", "width": 480, "height": 360},
         ],
         "views": "1M",
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_artist() -> Dict[str, Any]:
     """Sample artist data for testing."""
-    return {
+    return _freeze({
         "description": "Test Artist Description",
         "name": "Test Artist",
         "channelId": "UC123456789",
@@ -142,13 +227,13 @@ def sample_artist() -> Dict[str, Any]:
         "subscribers": "500K",
         "top_releases": {},
         "related": [],
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_album() -> Dict[str, Any]:
     """Sample album data for testing."""
-    return {
+    return _freeze({
         "title": "Test Album",
         "description": "Test Album Description",
         "artists": [{"name": "Test Artist", "id": "UC123"}],
@@ -173,12 +258,12 @@ def sample_album() -> Dict[str, Any]:
             },
         ],
         "audioPlaylistId": "PL123",
-    }
+    })
 
 
-@pytest.fixture
-def sample_playlist() -> Dict[str, Any]:
-    """Sample playlist data for testing."""
+@pytest.fixture(scope="session")
+def _sample_playlist() -> Dict[str, Any]:
+    """Sample playlist data, built once per session."""
     return {
         "id": "PL123456789",
         "title": "Test Playlist",
@@ -203,9 +288,15 @@ def sample_playlist() -> Dict[str, Any]:
 
 
 @pytest.fixture
+def sample_playlist(_sample_playlist) -> Dict[str, Any]:
+    """Sample playlist data for testing (a copy: some tests replace its tracks)."""
+    return copy.deepcopy(_sample_playlist)
+
+
+@pytest.fixture(scope="session")
 def sample_search_results() -> List[Dict[str, Any]]:
     """Sample search results for testing."""
-    return [
+    return _freeze([
         {
             "videoId": "result1",
             "title": "Search Result 1",
@@ -226,23 +317,23 @@ def sample_search_results() -> List[Dict[str, Any]]:
             "artists": [{"name": "Artist 3"}],
             "resultType": "album",
         },
-    ]
+    ])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_suggestions() -> List[str]:
     """Sample search suggestions for testing."""
-    return [
+    return _freeze([
         "test query 1",
         "test query 2",
         "test query 3",
-    ]
+    ])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_home_content() -> List[Dict[str, Any]]:
     """Sample home content for testing."""
-    return [
+    return _freeze([
         {
             "title": "Listen Again",
             "contents": [
@@ -257,13 +348,13 @@ def sample_home_content() -> List[Dict[str, Any]]:
                 {"title": "Rock", "params": "abc123"},
             ],
         },
-    ]
+    ])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_mood_categories() -> Dict[str, List[Dict[str, Any]]]:
     """Sample mood categories for testing."""
-    return {
+    return _freeze({
         "For you": [
             {"title": "Your Mix", "params": "mix1"},
         ],
@@ -275,13 +366,13 @@ def sample_mood_categories() -> Dict[str, List[Dict[str, Any]]]:
             {"title": "Chill", "params": "chill1"},
             {"title": "Workout", "params": "workout1"},
         ],
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_charts() -> Dict[str, Any]:
     """Sample charts data for testing."""
-    return {
+    return _freeze({
         "top_songs": [
             {"videoId": "chart1", "title": "Top Song 1", "rank": 1},
             {"videoId": "chart2", "title": "Top Song 2", "rank": 2},
@@ -290,13 +381,13 @@ def sample_charts() -> Dict[str, Any]:
             {"videoId": "trend1", "title": "Trending 1"},
         ],
         "country": "US",
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_podcast() -> Dict[str, Any]:
     """Sample podcast data for testing."""
-    return {
+    return _freeze({
         "id": "podcast123",
         "title": "Test Podcast",
         "description": "A test podcast",
@@ -312,13 +403,13 @@ def sample_podcast() -> Dict[str, Any]:
                 "duration": "45:00",
             },
         ],
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_episode() -> Dict[str, Any]:
     """Sample episode data for testing."""
-    return {
+    return _freeze({
         "videoId": "episode1",
         "title": "Test Episode",
         "description": "A test episode",
@@ -328,98 +419,183 @@ def sample_episode() -> Dict[str, Any]:
         ],
         "published_at": "2024-01-15",
         "podcast": {"title": "Test Podcast", "id": "podcast123"},
-    }
+    })
 
 
 # ============================================================================
 # Test Client Fixtures
 # ============================================================================
 
+@pytest.fixture(scope="session")
+def _app_client() -> "TestClient":
+    """Start the app once per session; client fixtures only swap dependency overrides."""
+    from fastapi.testclient import TestClient
+
+    with TestClient(_load_app()) as client:
+        yield client
+
+
+_UNSET = object()
+
+
+@contextmanager
+def _override_ctx(overrides: Dict[Any, Any]):
+    """Install ``overrides`` on the app, then restore exactly the keys touched.
+
+    Overrides set by other fixtures in the same test are left alone, so
+    client fixtures compose in any order.
+    """
+    app = _load_app()
+    prior = {key: app.dependency_overrides.get(key, _UNSET) for key in overrides}
+    app.dependency_overrides.update(overrides)
+    try:
+        yield
+    finally:
+        for key, value in prior.items():
+            if value is _UNSET:
+                app.dependency_overrides.pop(key, None)
+            else:
+                app.dependency_overrides[key] = value
+
+
 @pytest.fixture
-def test_client(mock_ytmusic) -> TestClient:
+def test_client(_app_client, mock_ytmusic) -> "TestClient":
     """Create synchronous test client with mocked YTMusic."""
-    from app.core.ytmusic_client import get_ytmusic
-    
-    # Override the YTMusic dependency
-    app.dependency_overrides[get_ytmusic] = lambda: mock_ytmusic
-    
-    with TestClient(app) as client:
-        yield client
-    
-    # Clean up overrides
-    app.dependency_overrides.clear()
+    # Override the YTMusic dependency for this test only
+    with _override_ctx({get_ytmusic: lambda: mock_ytmusic}):
+        yield _app_client
+
+
+@pytest.fixture(scope="session")
+def _async_app_client(_app_client) -> "AsyncClient":
+    """One AsyncClient for the session.
+
+    ASGITransport calls the app in-process and holds no sockets or loop-bound
+    state, so the client can be shared by tests running on different loops.
+    It does not run the app lifespan; depending on ``_app_client`` does.
+    """
+    from httpx import AsyncClient, ASGITransport
+
+    return AsyncClient(transport=ASGITransport(app=_load_app()), base_url="http://test")
 
 
 @pytest.fixture
-async def async_client(mock_ytmusic):
+def async_client(_async_app_client, mock_ytmusic) -> "AsyncClient":
     """Create async test client with mocked YTMusic."""
-    from app.core.ytmusic_client import get_ytmusic
-    
-    # Override the YTMusic dependency
-    app.dependency_overrides[get_ytmusic] = lambda: mock_ytmusic
+    # Override the YTMusic dependency for this test only
+    with _override_ctx({get_ytmusic: lambda: mock_ytmusic}):
+        yield _async_app_client
     
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test"
-    ) as client:
-        yield client
-    
-    # Clean up overrides
-    app.dependency_overrides.clear()
+    # Drop anything the test left in the cookie jar
+    _async_app_client.cookies.clear()
 
 
 # ============================================================================
 # Cache Fixtures
 # ============================================================================
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 async def reset_cache():
-    """Reset cache before each test."""
+    """Reset cache before and after a test."""
     await clear_cache()
     yield
     await clear_cache()
 
 
+@pytest.fixture(autouse=True)
+def reset_cache_if_marked(request):
+    """Apply reset_cache only to tests marked ``uses_cache``.
+    
+    Most tests never reach Redis, so they skip the two flushes.
+    """
+    if request.node.get_closest_marker("uses_cache") is not None:
+        request.getfixturevalue("reset_cache")
+
+
+@pytest.fixture(autouse=True)
+def reset_ydl_cache():
+    """Drop reused YoutubeDL instances so each test sees its own yt-dlp mock."""
+    from app.services.stream_service import close_ydl_cache
+
+    close_ydl_cache()
+    yield
+    close_ydl_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_stream_local_cache():
+    """Empty StreamService's in-process LRU so cached entries do not leak between tests."""
+    from app.services.stream_service import StreamService
+
+    StreamService().clear_local_cache()
+    yield
+    StreamService().clear_local_cache()
+
+
 # ============================================================================
 # Service Fixtures
 # ============================================================================
 
+# The mocks are built once per session; each test resets and re-configures
+# them and patches them in only for its own duration, so nothing leaks into
+# tests that use the real yt_dlp module or circuit breaker.
+
+@pytest.fixture(scope="session")
+def _circuit_breaker_mock() -> MagicMock:
+    """Session-wide stand-in for ``youtube_stream_circuit``."""
+    return MagicMock()
+
+
 @pytest.fixture
-def mock_circuit_breaker():
+def mock_circuit_breaker(_circuit_breaker_mock):
     """Create mock circuit breaker."""
-    with patch("app.services.stream_service.youtube_stream_circuit") as mock:
-        mock.is_open.return_value = False
-        mock.get_status.return_value = {
-            "state": "closed",
-            "failure_count": 0,
-            "remaining_time_seconds": 0,
-            "is_blocked": False,
-        }
-        mock.record_success.return_value = None
-        mock.record_failure.return_value = None
+    from app.services import stream_service
+
+    mock = _circuit_breaker_mock
+    mock.reset_mock(return_value=True, side_effect=True)
+    mock.is_open.return_value = False
+    mock.get_status.return_value = {
+        "state": "closed",
+        "failure_count": 0,
+        "remaining_time_seconds": 0,
+        "is_blocked": False,
+    }
+    mock.record_success.return_value = None
+    mock.record_failure.return_value = None
+    with patch.object(stream_service, "youtube_stream_circuit", mock):
         yield mock
 
 
+@pytest.fixture(scope="session")
+def _yt_dlp_mock() -> MagicMock:
+    """Session-wide stand-in for the ``yt_dlp`` module."""
+    return MagicMock()
+
+
 @pytest.fixture
-def mock_yt_dlp():
+def mock_yt_dlp(_yt_dlp_mock):
     """Mock yt-dlp for stream tests."""
-    with patch("app.services.stream_service.yt_dlp") as mock:
-        mock_ydl = MagicMock()
-        mock_ydl.extract_info.return_value = {
-            "title": "Test Song",
-            "artist": "Test Artist",
-            "duration": 180,
-            "thumbnail": "https://example.com/thumb.jpg",
-            "adaptive_formats": [
-                {
-                    "acodec": "opus",
-                    "vcodec": "none",
-                    "url": "https://example.com/audio.m4a",
-                }
-            ],
-            "formats": [],
-        }
-        mock.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+    from app.services import stream_service
+
+    mock = _yt_dlp_mock
+    mock.reset_mock(return_value=True, side_effect=True)
+    mock_ydl = MagicMock()
+    mock_ydl.extract_info.return_value = {
+        "title": "Test Song",
+        "artist": "Test Artist",
+        "duration": 180,
+        "thumbnail": "https://example.com/thumb.jpg",
+        "adaptive_formats": [
+            {
+                "acodec": "opus",
+                "vcodec": "none",
+                "url": "https://example.com/audio.m4a",
+            }
+        ],
+        "formats": [],
+    }
+    mock.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+    with patch.object(stream_service, "yt_dlp", mock):
         yield mock
 
 
@@ -427,266 +603,214 @@ def mock_yt_dlp():
 # Helper Functions
 # ============================================================================
 
-def create_mock_ytmusic_with_search_results(results: List[Dict]) -> MagicMock:
+class _YtmSearchStub:
+    """YTMusic stand-in exposing only ``search``; far cheaper than a MagicMock."""
+
+    __slots__ = ("search",)
+
+    def __init__(self, search):
+        self.search = search
+
+
+def create_mock_ytmusic_with_search_results(results: List[Dict]) -> _YtmSearchStub:
     """Create a mock YTMusic client with specific search results."""
-    mock = MagicMock()
-    mock.search.return_value = results
-    return mock
+    return _YtmSearchStub(lambda *args, **kwargs: results)
 
 
-def create_mock_ytmusic_with_error(error: Exception) -> MagicMock:
+def create_mock_ytmusic_with_error(error: Exception) -> _YtmSearchStub:
     """Create a mock YTMusic client that raises an error."""
-    mock = MagicMock()
-    mock.search.side_effect = error
-    return mock
+    def search(*args, **kwargs):
+        raise error
+
+    return _YtmSearchStub(search)
 
 
 # ============================================================================
-# Service Mock Classes
+# Service Mocks
 # ============================================================================
+# AsyncMock(spec=...) rejects methods the real service does not have; tests
+# set ``<method>.return_value`` / ``<method>.side_effect`` as needed
 
-class MockBrowseService:
-    """Mock BrowseService for integration tests."""
-    
-    def __init__(self):
-        self._get_home_return = []
-        self._get_artist_return = {}
-        self._get_artist_albums_return = {}
-        self._get_album_return = {}
-        self._get_album_browse_id_return = None
-        self._get_song_return = {}
-        self._get_song_related_return = []
-        self._get_lyrics_return = {}
-        
-        self._get_home_side_effect = None
-        self._get_artist_side_effect = None
-        self._get_artist_albums_side_effect = None
-        self._get_album_side_effect = None
-        self._get_album_browse_id_side_effect = None
-        self._get_song_side_effect = None
-        self._get_song_related_side_effect = None
-        self._get_lyrics_side_effect = None
-    
-    async def get_home(self):
-        if self._get_home_side_effect:
-            raise self._get_home_side_effect
-        return self._get_home_return
-    
-    async def get_artist(self, channel_id: str):
-        if self._get_artist_side_effect:
-            raise self._get_artist_side_effect
-        return self._get_artist_return
-    
-    async def get_artist_albums(self, channel_id: str, params=None):
-        if self._get_artist_albums_side_effect:
-            raise self._get_artist_albums_side_effect
-        return self._get_artist_albums_return
-    
-    async def get_album(self, album_id: str):
-        if self._get_album_side_effect:
-            raise self._get_album_side_effect
-        return self._get_album_return
-    
-    async def get_album_browse_id(self, album_id: str):
-        if self._get_album_browse_id_side_effect:
-            raise self._get_album_browse_id_side_effect
-        return self._get_album_browse_id_return
-    
-    async def get_song(self, video_id: str, signature_timestamp=None):
-        if self._get_song_side_effect:
-            raise self._get_song_side_effect
-        return self._get_song_return
-    
-    async def get_song_related(self, video_id: str):
-        if self._get_song_related_side_effect:
-            raise self._get_song_related_side_effect
-        return self._get_song_related_return
-    
-    async def get_lyrics(self, browse_id: str):
-        if self._get_lyrics_side_effect:
-            raise self._get_lyrics_side_effect
-        return self._get_lyrics_return
+_BROWSE_RETURNS: Dict[str, Any] = {
+    "get_home": [],
+    "get_artist": {},
+    "get_artist_albums": {},
+    "get_album": {},
+    "get_album_browse_id": None,
+    "get_song": {},
+    "get_song_related": [],
+    "get_lyrics": {},
+}
+_SEARCH_RETURNS: Dict[str, Any] = {"search": [], "get_search_suggestions": []}
+_STREAM_RETURNS: Dict[str, Any] = {"get_stream_url": {}, "enrich_items_with_streams": []}
+_WATCH_RETURNS: Dict[str, Any] = {"get_watch_playlist": {"tracks": []}}
+_PLAYLIST_RETURNS: Dict[str, Any] = {"get_playlist": {"tracks": []}}
 
 
-class MockSearchService:
-    """Mock SearchService for integration tests."""
-    
-    def __init__(self):
-        self._search_return = []
-        self._get_search_suggestions_return = []
-        self._remove_search_suggestions_return = True
-        
-        self._search_side_effect = None
-        self._get_search_suggestions_side_effect = None
-        self._remove_search_suggestions_side_effect = None
-    
-    async def search(self, query, filter=None, scope=None, limit=20, ignore_spelling=False):
-        if self._search_side_effect:
-            raise self._search_side_effect
-        return self._search_return
-    
-    async def get_search_suggestions(self, query: str):
-        if self._get_search_suggestions_side_effect:
-            raise self._get_search_suggestions_side_effect
-        return self._get_search_suggestions_return
-    
-    async def remove_search_suggestions(self, query: str):
-        if self._remove_search_suggestions_side_effect:
-            raise self._remove_search_suggestions_side_effect
-        return self._remove_search_suggestions_return
+def create_mock_browse_service() -> AsyncMock:
+    """Create a mock BrowseService."""
+    from app.services.browse_service import BrowseService
 
+    return _reset_mock(AsyncMock(spec=BrowseService), _BROWSE_RETURNS)
 
-class MockStreamService:
-    """Mock StreamService for integration tests."""
-    
-    def __init__(self):
-        self._get_stream_url_return = {}
-        self._enrich_items_with_streams_return = []
-        
-        self._get_stream_url_side_effect = None
-        self._enrich_items_with_streams_side_effect = None
-    
-    async def get_stream_url(self, video_id: str, bypass_cache: bool = False):
-        if self._get_stream_url_side_effect:
-            raise self._get_stream_url_side_effect
-        return self._get_stream_url_return
-    
-    async def enrich_items_with_streams(self, items, include_stream_urls=True):
-        if self._enrich_items_with_streams_side_effect:
-            raise self._enrich_items_with_streams_side_effect
-        return self._enrich_items_with_streams_return
 
+def create_mock_search_service() -> AsyncMock:
+    """Create a mock SearchService."""
+    from app.services.search_service import SearchService
 
-class MockWatchService:
-    """Mock WatchService for integration tests."""
+    return _reset_mock(AsyncMock(spec=SearchService), _SEARCH_RETURNS)
 
-    def __init__(self):
-        self._get_watch_playlist_return = {"tracks": []}
-        self._get_watch_playlist_side_effect = None
 
-    async def get_watch_playlist(self, **kwargs):
-        if self._get_watch_playlist_side_effect:
-            raise self._get_watch_playlist_side_effect
-        return self._get_watch_playlist_return
+def create_mock_stream_service() -> AsyncMock:
+    """Create a mock StreamService."""
+    from app.services.stream_service import StreamService
 
+    return _reset_mock(AsyncMock(spec=StreamService), _STREAM_RETURNS)
 
-class MockPlaylistService:
-    """Mock PlaylistService for integration tests."""
 
-    def __init__(self):
-        self._get_playlist_return = {"tracks": []}
-        self._get_playlist_side_effect = None
+def create_mock_watch_service() -> AsyncMock:
+    """Create a mock WatchService."""
+    from app.services.watch_service import WatchService
 
-    async def get_playlist(self, *args, **kwargs):
-        if self._get_playlist_side_effect:
-            raise self._get_playlist_side_effect
-        return self._get_playlist_return
+    return _reset_mock(AsyncMock(spec=WatchService), _WATCH_RETURNS)
 
 
-class MockPodcastService:
-    """Mock PodcastService for integration tests."""
+def create_mock_playlist_service() -> AsyncMock:
+    """Create a mock PlaylistService."""
+    from app.services.playlist_service import PlaylistService
 
-    def __init__(self):
-        self._get_channel_return = {}
-        self._get_channel_episodes_return = {}
-        self._get_podcast_return = {}
-        self._get_episode_return = {}
-        self._get_episodes_playlist_return = {}
+    return _reset_mock(AsyncMock(spec=PlaylistService), _PLAYLIST_RETURNS)
 
-        self._get_channel_side_effect = None
-        self._get_channel_episodes_side_effect = None
-        self._get_podcast_side_effect = None
-        self._get_episode_side_effect = None
-        self._get_episodes_playlist_side_effect = None
 
-    async def get_channel(self, channel_id, limit=25):
-        if self._get_channel_side_effect:
-            raise self._get_channel_side_effect
-        return self._get_channel_return
+# ============================================================================
+# Mock Service Fixtures with Dependency Overrides
+# ============================================================================
 
-    async def get_channel_episodes(self, channel_id, limit=25, params=None):
-        if self._get_channel_episodes_side_effect:
-            raise self._get_channel_episodes_side_effect
-        return self._get_channel_episodes_return
+@pytest.fixture(scope="session")
+def _browse_service_mock() -> AsyncMock:
+    return create_mock_browse_service()
 
-    async def get_podcast(self, browse_id, limit=25):
-        if self._get_podcast_side_effect:
-            raise self._get_podcast_side_effect
-        return self._get_podcast_return
 
-    async def get_episode(self, browse_id):
-        if self._get_episode_side_effect:
-            raise self._get_episode_side_effect
-        return self._get_episode_return
+@pytest.fixture(scope="session")
+def _search_service_mock() -> AsyncMock:
+    return create_mock_search_service()
 
-    async def get_episodes_playlist(self, browse_id, limit=25):
-        if self._get_episodes_playlist_side_effect:
-            raise self._get_episodes_playlist_side_effect
-        return self._get_episodes_playlist_return
 
+@pytest.fixture(scope="session")
+def _stream_service_mock() -> AsyncMock:
+    return create_mock_stream_service()
 
-# ============================================================================
-# Mock Service Fixtures with Dependency Overrides
-# ============================================================================
 
 @pytest.fixture
-def mock_browse_service():
+def mock_browse_service(_browse_service_mock):
     """Create a mock BrowseService instance."""
-    return MockBrowseService()
+    return _reset_mock(_browse_service_mock, _BROWSE_RETURNS)
 
 
 @pytest.fixture
-def mock_search_service():
+def mock_search_service(_search_service_mock):
     """Create a mock SearchService instance."""
-    return MockSearchService()
+    return _reset_mock(_search_service_mock, _SEARCH_RETURNS)
 
 
 @pytest.fixture
-def mock_stream_service_instance():
+def mock_stream_service_instance(_stream_service_mock):
     """Create a mock StreamService instance."""
-    return MockStreamService()
+    return _reset_mock(_stream_service_mock, _STREAM_RETURNS)
+
+
+def _make_client(client, overrides: Dict[Any, Any], *mocks):
+    """Install ``overrides`` for one test and yield ``(client, *mocks)``.
+
+    ``client`` is the session TestClient or AsyncClient.
+    """
+    with _override_ctx(overrides):
+        yield (client, *mocks)
+    client.cookies.clear()
 
 
 @pytest.fixture
-def test_client_with_browse_mocks(mock_browse_service, mock_stream_service_instance):
+def test_client_with_browse_mocks(_app_client, mock_browse_service, mock_stream_service_instance):
     """Create test client with mocked browse and stream services."""
-    from app.api.v1.endpoints import browse
-    from app.api.v1.endpoints.browse import get_browse_service, get_stream_service
-    
-    app.dependency_overrides[get_browse_service] = lambda: mock_browse_service
-    app.dependency_overrides[get_stream_service] = lambda: mock_stream_service_instance
-    
-    with TestClient(app) as client:
-        yield client, mock_browse_service, mock_stream_service_instance
-    
-    app.dependency_overrides.clear()
+    from app.api.v1.endpoints.music.browse import (
+        get_browse_service,
+        get_stream_service as _browse_get_stream,
+    )
+
+    yield from _make_client(
+        _app_client,
+        {
+            get_browse_service: lambda: mock_browse_service,
+            _browse_get_stream: lambda: mock_stream_service_instance,
+        },
+        mock_browse_service,
+        mock_stream_service_instance,
+    )
 
 
 @pytest.fixture
-def test_client_with_search_mocks(mock_search_service, mock_stream_service_instance):
+def test_client_with_search_mocks(_app_client, mock_search_service, mock_stream_service_instance):
     """Create test client with mocked search and stream services."""
-    from app.api.v1.endpoints.search import get_search_service, get_stream_service
-    
-    app.dependency_overrides[get_search_service] = lambda: mock_search_service
-    app.dependency_overrides[get_stream_service] = lambda: mock_stream_service_instance
-    
-    with TestClient(app) as client:
-        yield client, mock_search_service, mock_stream_service_instance
-    
-    app.dependency_overrides.clear()
+    from app.api.v1.endpoints.music.search import (
+        get_search_service,
+        get_stream_service as _search_get_stream,
+    )
+
+    yield from _make_client(
+        _app_client,
+        {
+            get_search_service: lambda: mock_search_service,
+            _search_get_stream: lambda: mock_stream_service_instance,
+        },
+        mock_search_service,
+        mock_stream_service_instance,
+    )
 
 
 @pytest.fixture
-def test_client_with_stream_mocks(mock_stream_service_instance):
+def test_client_with_stream_mocks(_app_client, mock_stream_service_instance):
     """Create test client with mocked stream service."""
-    from app.api.v1.endpoints.stream import get_stream_service
-    
-    app.dependency_overrides[get_stream_service] = lambda: mock_stream_service_instance
-    
-    with TestClient(app) as client:
-        yield client, mock_stream_service_instance
-    
-    app.dependency_overrides.clear()
+    from app.api.v1.endpoints.music.stream import get_stream_service as _stream_get_stream
+
+    yield from _make_client(
+        _app_client,
+        {_stream_get_stream: lambda: mock_stream_service_instance},
+        mock_stream_service_instance,
+    )
+
+
+# Async variants: requests are coroutines on the test's loop, with no
+# TestClient portal thread in between
+
+@pytest.fixture
+def async_client_with_search_mocks(_async_app_client, mock_search_service, mock_stream_service_instance):
+    """Create async test client with mocked search and stream services."""
+    from app.api.v1.endpoints.music.search import (
+        get_search_service,
+        get_stream_service as _search_get_stream,
+    )
+
+    yield from _make_client(
+        _async_app_client,
+        {
+            get_search_service: lambda: mock_search_service,
+            _search_get_stream: lambda: mock_stream_service_instance,
+        },
+        mock_search_service,
+        mock_stream_service_instance,
+    )
+
+
+@pytest.fixture
+def async_client_with_stream_mocks(_async_app_client, mock_stream_service_instance):
+    """Create async test client with mocked stream service."""
+    from app.api.v1.endpoints.music.stream import get_stream_service as _stream_get_stream
+
+    yield from _make_client(
+        _async_app_client,
+        {_stream_get_stream: lambda: mock_stream_service_instance},
+        mock_stream_service_instance,
+    )
 
 
 @pytest.fixture
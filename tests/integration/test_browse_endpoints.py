@@ -3,13 +3,16 @@ import pytest
 from unittest.mock import patch, MagicMock
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 class TestBrowseHomeEndpoint:
     """Integration tests for browse home endpoint."""
 
     def test_get_home_success(self, test_client_with_browse_mocks, sample_home_content):
         """Test successful get home endpoint."""
         client, mock_browse, _ = test_client_with_browse_mocks
-        mock_browse._get_home_return = sample_home_content
+        mock_browse.get_home.return_value = sample_home_content
         
         response = client.get("/api/v1/browse/home")
         
@@ -20,7 +23,7 @@ class TestBrowseHomeEndpoint:
     def test_get_home_empty(self, test_client_with_browse_mocks):
         """Test get home endpoint with empty content."""
         client, mock_browse, _ = test_client_with_browse_mocks
-        mock_browse._get_home_return = []
+        mock_browse.get_home.return_value = []
         
         response = client.get("/api/v1/browse/home")
         
@@ -30,7 +33,7 @@ class TestBrowseHomeEndpoint:
     def test_get_home_error(self, test_client_with_browse_mocks):
         """Test get home endpoint handles errors."""
         client, mock_browse, _ = test_client_with_browse_mocks
-        mock_browse._get_home_side_effect = Exception("API Error")
+        mock_browse.get_home.side_effect = Exception("API Error")
         
         response = client.get("/api/v1/browse/home")
         
@@ -43,7 +46,7 @@ class TestBrowseArtistEndpoint:
     def test_get_artist_success(self, test_client_with_browse_mocks, sample_artist):
         """Test successful get artist endpoint."""
         client, mock_browse, _ = test_client_with_browse_mocks
-        mock_browse._get_artist_return = sample_artist
+        mock_browse.get_artist.return_value = sample_artist
         
         response = client.get("/api/v1/browse/artist/UC123456789")
         
@@ -54,7 +57,7 @@ class TestBrowseArtistEndpoint:
     def test_get_artist_error(self, test_client_with_browse_mocks):
         """Test get artist endpoint handles errors."""
         client, mock_browse, _ = test_client_with_browse_mocks
-        mock_browse._get_artist_side_effect = Exception("API Error")
+        mock_browse.get_artist.side_effect = Exception("API Error")
         
         response = client.get("/api/v1/browse/artist/UC123456789")
         
@@ -64,7 +67,7 @@ class TestBrowseArtistEndpoint:
         """Test successful get artist albums endpoint."""
         client, mock_browse, _ = test_client_with_browse_mocks
         albums = {"results": [{"title": "Album 1"}]}
-        mock_browse._get_artist_albums_return = albums
+        mock_browse.get_artist_albums.return_value = albums
         
         response = client.get("/api/v1/browse/artist/UC123456789/albums")
         
@@ -77,8 +80,9 @@ class TestBrowseAlbumEndpoint:
     def test_get_album_success(self, test_client_with_browse_mocks, sample_album):
         """Test successful get album endpoint."""
         client, mock_browse, mock_stream = test_client_with_browse_mocks
-        mock_browse._get_album_return = sample_album
-        mock_stream._enrich_items_with_streams_return = sample_album.get("tracks", [])
+        # The endpoint stores the enriched tracks back into the album dict
+        mock_browse.get_album.return_value = dict(sample_album)
+        mock_stream.enrich_items_with_streams.return_value = sample_album.get("tracks", [])
         
         response = client.get("/api/v1/browse/album/MPREb123")
         
@@ -89,7 +93,7 @@ class TestBrowseAlbumEndpoint:
     def test_get_album_without_stream_urls(self, test_client_with_browse_mocks, sample_album):
         """Test get album endpoint without stream URLs."""
         client, mock_browse, _ = test_client_with_browse_mocks
-        mock_browse._get_album_return = sample_album
+        mock_browse.get_album.return_value = sample_album
         
         response = client.get("/api/v1/browse/album/MPREb123?include_stream_urls=false")
         
@@ -98,7 +102,7 @@ class TestBrowseAlbumEndpoint:
     def test_get_album_browse_id_success(self, test_client_with_browse_mocks):
         """Test successful get album browse ID endpoint."""
         client, mock_browse, _ = test_client_with_browse_mocks
-        mock_browse._get_album_browse_id_return = "MPREb123"
+        mock_browse.get_album_browse_id.return_value = "MPREb123"
         
         response = client.get("/api/v1/browse/album/album123/browse-id")
         
@@ -109,7 +113,7 @@ class TestBrowseAlbumEndpoint:
     def test_get_album_error(self, test_client_with_browse_mocks):
         """Test get album endpoint handles errors."""
         client, mock_browse, _ = test_client_with_browse_mocks
-        mock_browse._get_album_side_effect = Exception("API Error")
+        mock_browse.get_album.side_effect = Exception("API Error")
         
         response = client.get("/api/v1/browse/album/MPREb123")
         
@@ -122,7 +126,7 @@ class TestBrowseSongEndpoint:
     def test_get_song_success(self, test_client_with_browse_mocks, sample_song):
         """Test successful get song endpoint."""
         client, mock_browse, _ = test_client_with_browse_mocks
-        mock_browse._get_song_return = sample_song
+        mock_browse.get_song.return_value = sample_song
         
         response = client.get("/api/v1/browse/song/abc123xyz")
         
@@ -134,8 +138,8 @@ class TestBrowseSongEndpoint:
         """Test successful get song related endpoint."""
         client, mock_browse, mock_stream = test_client_with_browse_mocks
         related = [{"videoId": "rel1", "title": "Related Song"}]
-        mock_browse._get_song_related_return = related
-        mock_stream._enrich_items_with_streams_return = related
+        mock_browse.get_song_related.return_value = related
+        mock_stream.enrich_items_with_streams.return_value = related
         
         response = client.get("/api/v1/browse/song/abc123xyz/related")
         
@@ -151,7 +155,7 @@ class TestBrowseLyricsEndpoint:
         """Test successful get lyrics endpoint."""
         client, mock_browse, _ = test_client_with_browse_mocks
         lyrics = {"lyrics": "Test lyrics...", "source": "Musixmatch"}
-        mock_browse._get_lyrics_return = lyrics
+        mock_browse.get_lyrics.return_value = lyrics
         
         response = client.get("/api/v1/browse/lyrics/MPAD123")
         
@@ -162,7 +166,7 @@ class TestBrowseLyricsEndpoint:
     def test_get_lyrics_error(self, test_client_with_browse_mocks):
         """Test get lyrics endpoint handles errors."""
         client, mock_browse, _ = test_client_with_browse_mocks
-        mock_browse._get_lyrics_side_effect = Exception("API Error")
+        mock_browse.get_lyrics.side_effect = Exception("API Error")
         
         response = client.get("/api/v1/browse/lyrics/MPAD123")
         
@@ -1,19 +1,23 @@
 """Integration tests for search endpoints."""
+import asyncio
 import pytest
 from unittest.mock import patch, MagicMock
 from app.core.exceptions import ExternalServiceError
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 class TestSearchEndpoints:
     """Integration tests for search API endpoints."""
 
-    def test_search_endpoint_success(self, test_client_with_search_mocks, sample_search_results):
+    async def test_search_endpoint_success(self, async_client_with_search_mocks, sample_search_results):
         """Test successful search endpoint."""
-        client, mock_search, mock_stream = test_client_with_search_mocks
-        mock_search._search_return = sample_search_results
-        mock_stream._enrich_items_with_streams_return = sample_search_results
+        client, mock_search, mock_stream = async_client_with_search_mocks
+        mock_search.search.return_value = sample_search_results
+        mock_stream.enrich_items_with_streams.return_value = sample_search_results
         
-        response = client.get("/api/v1/search/?q=test query")
+        response = await client.get("/api/v1/search/?q=test query")
         
         assert response.status_code == 200
         data = response.json()
@@ -21,42 +25,42 @@ class TestSearchEndpoints:
         assert "query" in data
         assert data["query"] == "test query"
 
-    def test_search_endpoint_with_filter(self, test_client_with_search_mocks, sample_search_results):
+    async def test_search_endpoint_with_filter(self, async_client_with_search_mocks, sample_search_results):
         """Test search endpoint with filter parameter."""
-        client, mock_search, mock_stream = test_client_with_search_mocks
-        mock_search._search_return = sample_search_results
-        mock_stream._enrich_items_with_streams_return = sample_search_results
+        client, mock_search, mock_stream = async_client_with_search_mocks
+        mock_search.search.return_value = sample_search_results
+        mock_stream.enrich_items_with_streams.return_value = sample_search_results
         
-        response = client.get("/api/v1/search/?q=test&filter=songs")
+        response = await client.get("/api/v1/search/?q=test&filter=songs")
         
         assert response.status_code == 200
 
-    def test_search_endpoint_with_limit(self, test_client_with_search_mocks):
+    async def test_search_endpoint_with_limit(self, async_client_with_search_mocks):
         """Test search endpoint with limit parameter."""
-        client, mock_search, _ = test_client_with_search_mocks
-        mock_search._search_return = []
+        client, mock_search, _ = async_client_with_search_mocks
+        mock_search.search.return_value = []
         
-        response = client.get("/api/v1/search/?q=test&limit=10")
+        response = await client.get("/api/v1/search/?q=test&limit=10")
         
         assert response.status_code == 200
 
-    def test_search_endpoint_missing_query(self, test_client_with_search_mocks):
+    async def test_search_endpoint_missing_query(self, async_client_with_search_mocks):
         """Test search endpoint with missing query parameter."""
-        client, _, _ = test_client_with_search_mocks
+        client, _, _ = async_client_with_search_mocks
         
-        response = client.get("/api/v1/search/")
+        response = await client.get("/api/v1/search/")
         
         assert response.status_code == 422  # Validation error
 
-    def test_search_endpoint_error(self, test_client_with_search_mocks):
+    async def test_search_endpoint_error(self, async_client_with_search_mocks):
         """Test search endpoint handles errors."""
-        client, mock_search, _ = test_client_with_search_mocks
-        mock_search._search_side_effect = ExternalServiceError(
+        client, mock_search, _ = async_client_with_search_mocks
+        mock_search.search.side_effect = ExternalServiceError(
             message="Error en YouTube Music durante búsqueda.",
             details={"operation": "search"}
         )
         
-        response = client.get("/api/v1/search/?q=test")
+        response = await client.get("/api/v1/search/?q=test")
         
         assert response.status_code == 502
 
@@ -64,73 +68,64 @@ class TestSearchEndpoints:
 class TestSearchSuggestionsEndpoints:
     """Integration tests for search suggestions endpoints."""
 
-    def test_get_suggestions_success(self, test_client_with_search_mocks, sample_suggestions):
+    async def test_get_suggestions_success(self, async_client_with_search_mocks, sample_suggestions):
         """Test successful get search suggestions."""
-        client, mock_search, _ = test_client_with_search_mocks
-        mock_search._get_search_suggestions_return = sample_suggestions
+        client, mock_search, _ = async_client_with_search_mocks
+        mock_search.get_search_suggestions.return_value = sample_suggestions
         
-        response = client.get("/api/v1/search/suggestions?q=test")
+        response = await client.get("/api/v1/search/suggestions?q=test")
         
         assert response.status_code == 200
         data = response.json()
         assert "suggestions" in data
         assert len(data["suggestions"]) == 3
 
-    def test_get_suggestions_empty(self, test_client_with_search_mocks):
+    async def test_get_suggestions_empty(self, async_client_with_search_mocks):
         """Test get search suggestions with empty results."""
-        client, mock_search, _ = test_client_with_search_mocks
-        mock_search._get_search_suggestions_return = []
+        client, mock_search, _ = async_client_with_search_mocks
+        mock_search.get_search_suggestions.return_value = []
         
-        response = client.get("/api/v1/search/suggestions?q=nonexistent")
+        response = await client.get("/api/v1/search/suggestions?q=nonexistent")
         
         assert response.status_code == 200
         data = response.json()
         assert data["suggestions"] == []
 
-    def test_remove_suggestions_success(self, test_client_with_search_mocks):
-        """Test successful remove search suggestion."""
-        client, mock_search, _ = test_client_with_search_mocks
-        mock_search._remove_search_suggestions_return = True
-        
-        response = client.delete("/api/v1/search/suggestions?q=test")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
 
-    def test_remove_suggestions_error(self, test_client_with_search_mocks):
-        """Test remove search suggestion handles errors."""
+class TestSearchEndpointsSyncClient:
+    """Smoke test through the synchronous TestClient (portal thread)."""
+
+    def test_get_suggestions_sync_client(self, test_client_with_search_mocks, sample_suggestions):
+        """Test get search suggestions through TestClient."""
         client, mock_search, _ = test_client_with_search_mocks
-        mock_search._remove_search_suggestions_side_effect = ExternalServiceError(
-            message="Error en YouTube Music.",
-            details={"operation": "remove_search_suggestions"}
-        )
+        mock_search.get_search_suggestions.return_value = sample_suggestions
         
-        response = client.delete("/api/v1/search/suggestions?q=test")
+        response = client.get("/api/v1/search/suggestions?q=test")
         
-        assert response.status_code == 502
+        assert response.status_code == 200
+        assert len(response.json()["suggestions"]) == 3
 
 
 class TestSearchEndpointValidation:
     """Test validation for search endpoints."""
 
-    def test_search_limit_validation(self, test_client_with_search_mocks):
+    async def test_search_limit_validation(self, async_client_with_search_mocks):
         """Test search endpoint validates limit parameter."""
-        client, mock_search, _ = test_client_with_search_mocks
-        mock_search._search_return = []
+        client, mock_search, _ = async_client_with_search_mocks
+        mock_search.search.return_value = []
         
-        # Limit too high
-        response = client.get("/api/v1/search/?q=test&limit=100")
-        assert response.status_code == 422
+        too_high, too_low = await asyncio.gather(
+            client.get("/api/v1/search/?q=test&limit=100"),
+            client.get("/api/v1/search/?q=test&limit=0"),
+        )
         
-        # Limit too low
-        response = client.get("/api/v1/search/?q=test&limit=0")
-        assert response.status_code == 422
+        assert too_high.status_code == 422
+        assert too_low.status_code == 422
 
-    def test_search_valid_limit(self, test_client_with_search_mocks):
+    async def test_search_valid_limit(self, async_client_with_search_mocks):
         """Test search endpoint accepts valid limits."""
-        client, mock_search, _ = test_client_with_search_mocks
-        mock_search._search_return = []
+        client, mock_search, _ = async_client_with_search_mocks
+        mock_search.search.return_value = []
         
-        response = client.get("/api/v1/search/?q=test&limit=25")
+        response = await client.get("/api/v1/search/?q=test&limit=25")
         assert response.status_code == 200
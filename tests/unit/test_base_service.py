@@ -2,7 +2,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
-from app.services.base_service import BaseService
+from app.services.base_service import BaseService, ytm_safe
 from app.core.exceptions import (
     YTMusicServiceException,
     AuthenticationError,
@@ -79,10 +79,70 @@ class TestBaseService:
         service._log_operation("test_op", param1="value1", param2=None)
 
 
+@pytest.mark.asyncio
+class TestBaseServiceExecutor:
+    """Test cases for running blocking calls on the shared executor."""
+
+    async def test_run_forwards_args_and_kwargs(self, mock_ytmusic):
+        """Test _run passes positional and keyword arguments through."""
+        mock_ytmusic.search.return_value = ["ok"]
+        service = BaseService(mock_ytmusic)
+
+        result = await service._run(mock_ytmusic.search, "query", filter="songs")
+
+        assert result == ["ok"]
+        mock_ytmusic.search.assert_called_once_with("query", filter="songs")
+
+    async def test_run_uses_ytm_thread_pool(self, mock_ytmusic):
+        """Test _run executes on the shared ytm-prefixed thread pool."""
+        import threading
+        service = BaseService(mock_ytmusic)
+
+        name = await service._run(lambda: threading.current_thread().name)
+
+        assert name.startswith("ytm")
+
+
+class TestYtmSafe:
+    """Test the ytm_safe error translation decorator."""
+
+    class _Service(BaseService):
+        @ytm_safe("obtener cosa {item_id} (limit: {limit})")
+        async def fetch(self, item_id, limit=5, error=None):
+            if error:
+                raise error
+            return item_id
+
+    @pytest.mark.asyncio
+    async def test_returns_result(self, mock_ytmusic):
+        assert await self._Service(mock_ytmusic).fetch("abc") == "abc"
+
+    @pytest.mark.asyncio
+    async def test_translates_errors_with_formatted_operation(self, mock_ytmusic):
+        service = self._Service(mock_ytmusic)
+
+        with pytest.raises(ExternalServiceError) as exc_info:
+            await service.fetch("abc", error=ValueError("boom"))
+
+        assert exc_info.value.details["operation"] == "obtener cosa abc (limit: 5)"
+
+    @pytest.mark.asyncio
+    async def test_service_exceptions_pass_through(self, mock_ytmusic):
+        service = self._Service(mock_ytmusic)
+        original = ResourceNotFoundError(message="missing")
+
+        with pytest.raises(ResourceNotFoundError) as exc_info:
+            await service.fetch(item_id="abc", error=original)
+
+        assert exc_info.value is original
+
+
 class TestBaseServiceErrorHandling:
     """Test error handling for BaseService using custom exceptions."""
 
-    @pytest.mark.parametrize("error_msg,expected_exception", [
+    # Checked in one test: each case is a single cheap call, so separate
+    # parametrized items would spend far more on pytest setup than on the check
+    ERROR_CASES = (
         # Authentication errors
         ("Expecting value: line 1 column 1", AuthenticationError),
         ("JSONDecodeError: Expecting value", AuthenticationError),
@@ -97,20 +157,35 @@ class TestBaseServiceErrorHandling:
         ("not found", ResourceNotFoundError),
         ("does not exist", ResourceNotFoundError),
         ("unable to find resource", ResourceNotFoundError),
-    ])
-    def test_handle_ytmusic_error_returns_correct_exception(
-        self, mock_ytmusic, error_msg, expected_exception
-    ):
+    )
+
+    def test_handle_ytmusic_error_returns_correct_exception(self, mock_ytmusic):
         """Test error handling returns correct exception type."""
         service = BaseService(mock_ytmusic)
-        error = Exception(error_msg)
-        
-        result = service._handle_ytmusic_error(error, "test operation")
         
-        assert isinstance(result, expected_exception)
-        assert isinstance(result, YTMusicServiceException)
-        assert result.status_code == expected_exception.status_code
-        assert result.error_code == expected_exception.error_code
+        for error_msg, expected_exception in self.ERROR_CASES:
+            result = service._handle_ytmusic_error(Exception(error_msg), "test operation")
+            
+            assert isinstance(result, expected_exception), error_msg
+            assert isinstance(result, YTMusicServiceException), error_msg
+            assert result.status_code == expected_exception.status_code, error_msg
+            assert result.error_code == expected_exception.error_code, error_msg
+
+    def test_handle_ytmusic_error_classifies_formatted_message(self, mock_ytmusic):
+        """Test classification reads str(error), not just args[0]."""
+        class StatusError(Exception):
+            def __init__(self, message, status_code):
+                super().__init__(message)
+                self.status_code = status_code
+
+            def __str__(self):
+                return f"{self.args[0]} (HTTP {self.status_code} Too Many Requests)"
+
+        service = BaseService(mock_ytmusic)
+
+        result = service._handle_ytmusic_error(StatusError("Server returned an error", 429), "test")
+
+        assert isinstance(result, RateLimitError)
 
     def test_handle_ytmusic_error_default_to_external_service(self, mock_ytmusic):
         """Test that unknown errors default to ExternalServiceError."""
@@ -218,3 +293,27 @@ class TestBaseServiceErrorScenarios:
         error2 = Exception("Not Found")
         result2 = service._handle_ytmusic_error(error2, "test")
         assert isinstance(result2, ResourceNotFoundError)
+
+    def test_non_string_error_args_are_classified(self, mock_ytmusic):
+        """Test errors whose first arg is not a message fall back to str()."""
+        service = BaseService(mock_ytmusic)
+
+        result = service._handle_ytmusic_error(Exception(404, "not found"), "test")
+
+        assert isinstance(result, ResourceNotFoundError)
+
+    def test_rate_limit_penalizes_current_account(self, mock_ytmusic):
+        """Test rate limit errors put the current browser account on hold."""
+        from app.core.browser_client import current_account_var
+        service = BaseService(mock_ytmusic)
+        account = MagicMock(rate_limited_until=0.0)
+        account.name = "acc1"
+        token = current_account_var.set(account)
+        try:
+            result = service._handle_ytmusic_error(Exception("HTTP 429"), "test")
+        finally:
+            current_account_var.reset(token)
+
+        assert isinstance(result, RateLimitError)
+        assert result.details["account"] == "acc1"
+        assert account.rate_limited_until > 0
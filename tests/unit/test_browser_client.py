@@ -0,0 +1,54 @@
+"""Unit tests for browser client rotation."""
+import contextvars
+from unittest.mock import MagicMock, patch
+
+from app.core import browser_client
+from app.core.browser_client import BrowserAccount, get_ytmusic
+
+
+class TestGetYtmusic:
+    """Test cases for get_ytmusic."""
+
+    def test_client_created_once_per_account(self, tmp_path):
+        """Test repeated requests reuse the account's YTMusic client."""
+        account = BrowserAccount(tmp_path / "acc1.json")
+        manager = MagicMock()
+        manager.get_best_account.return_value = account
+        client = MagicMock()
+
+        with patch.object(browser_client, "get_browser_manager", return_value=manager), \
+                patch.object(browser_client, "_client_cache", {}), \
+                patch.object(browser_client, "_create_client", return_value=client) as mock_create:
+            ctx = contextvars.copy_context()
+            first = ctx.run(get_ytmusic)
+            second = ctx.run(get_ytmusic)
+
+        assert first is client
+        assert second is client
+        mock_create.assert_called_once_with(account)
+
+
+class TestBrowserAccount:
+    """Test cases for BrowserAccount."""
+
+    def test_concurrency_follows_setting(self, tmp_path):
+        """Test the per-account semaphore is sized by YTMUSIC_ACCOUNT_CONCURRENCY."""
+        with patch.object(browser_client.settings, "YTMUSIC_ACCOUNT_CONCURRENCY", 3):
+            account = BrowserAccount(tmp_path / "acc1.json")
+
+        assert account.semaphore._value == 3
+
+
+class TestCreateSession:
+    """Test cases for _create_session."""
+
+    def test_default_timeout_applied(self):
+        """Test requests without a timeout get the default and explicit ones are kept."""
+        session = browser_client._create_session()
+
+        with patch("requests.Session.request") as mock_request:
+            session.get("https://music.youtube.com")
+            session.post("https://music.youtube.com", timeout=5)
+
+        assert mock_request.call_args_list[0].kwargs["timeout"] == 30
+        assert mock_request.call_args_list[1].kwargs["timeout"] == 5
@@ -8,12 +8,14 @@ from app.core.cache import (
     get_cache_stats,
     get_cached_value,
     set_cached_value,
-    get_cached_timestamp,
     has_cached_key,
 )
 from app.core.cache_redis import get_redis_client, clear_cache as redis_clear_cache
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 class TestGetCacheKey:
     def test_get_cache_key_consistent(self):
         key1 = get_cache_key("arg1", "arg2", kwarg1="value1")
@@ -39,6 +41,12 @@ class TestGetCacheKey:
         
         assert key1 == key2
 
+    def test_get_cache_key_set_order_independent(self):
+        key1 = get_cache_key(fields=frozenset(["videoId", "title", "artists"]))
+        key2 = get_cache_key(fields=frozenset(["artists", "title", "videoId"]))
+        
+        assert key1 == key2
+
     def test_get_cache_key_returns_string(self):
         key = get_cache_key("test")
         
@@ -110,6 +118,182 @@ class TestCacheResult:
         
         assert call_count == 2
 
+    async def test_cache_result_coalesces_concurrent_calls(self):
+        call_count = 0
+
+        @cache_result(ttl=60)
+        async def test_func(arg):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.05)
+            return f"result_{arg}"
+
+        results = await asyncio.gather(*(test_func("same") for _ in range(5)))
+
+        assert results == ["result_same"] * 5
+        assert call_count == 1
+
+    async def test_cache_result_key_ignores_instance(self):
+        from unittest.mock import patch
+
+        class Service:
+            @cache_result(ttl=60)
+            async def fetch(self, arg):
+                return arg
+
+        with patch("app.core.cache_redis.get_cached_value", return_value=None) as mock_get, \
+                patch("app.core.cache_redis.set_cached_value"):
+            await Service().fetch("x")
+            await Service().fetch("x")
+
+        first_key, second_key = (c.args[0] for c in mock_get.call_args_list)
+        assert first_key == second_key
+
+    async def test_cache_result_key_same_for_positional_keyword_and_default(self):
+        from unittest.mock import patch
+
+        @cache_result(ttl=60)
+        async def test_func(video_id, limit=25):
+            return video_id
+
+        with patch("app.core.cache_redis.get_cached_value", return_value=None) as mock_get, \
+                patch("app.core.cache_redis.set_cached_value"):
+            await test_func("v1")
+            await test_func("v1", 25)
+            await test_func(video_id="v1", limit=25)
+            await test_func(limit=25, video_id="v1")
+            await test_func("v1", 10)
+
+        keys = [c.args[0] for c in mock_get.call_args_list]
+        assert len(set(keys[:4])) == 1
+        assert keys[4] != keys[0]
+
+    async def test_cache_result_key_normalizers(self):
+        from unittest.mock import patch
+
+        @cache_result(ttl=60, key_normalizers={"item_id": lambda v: v.removeprefix("VL")})
+        async def test_func(item_id):
+            return item_id
+
+        with patch("app.core.cache_redis.get_cached_value", return_value=None) as mock_get, \
+                patch("app.core.cache_redis.set_cached_value"):
+            await test_func("VLPL1")
+            await test_func(item_id="PL1")
+
+        first_key, second_key = (c.args[0] for c in mock_get.call_args_list)
+        assert first_key == second_key
+
+    async def test_cache_result_serves_stale_and_refreshes(self):
+        from unittest.mock import patch
+
+        call_count = 0
+
+        @cache_result(ttl=60, stale_ttl=30)
+        async def test_func():
+            nonlocal call_count
+            call_count += 1
+            return "fresh"
+
+        # Stored for 90s; 20s left means it is 70s old, inside the stale window
+        stale_entry = ("stale", 20)
+        with patch("app.core.cache_redis.get_cached_value_with_ttl", return_value=stale_entry), \
+                patch("app.core.cache_redis.acquire_cache_lock", return_value="token"), \
+                patch("app.core.cache_redis.release_cache_lock"), \
+                patch("app.core.cache_redis.set_cached_value") as mock_set:
+            result = await test_func()
+            await asyncio.sleep(0.01)
+
+        assert result == "stale"
+        assert call_count == 1
+        assert mock_set.call_args.args[1:] == ("fresh", 90)
+
+    async def test_cache_result_fresh_hit_skips_refresh(self):
+        from unittest.mock import patch
+
+        called = False
+
+        @cache_result(ttl=60, stale_ttl=30)
+        async def test_func():
+            nonlocal called
+            called = True
+
+        with patch("app.core.cache_redis.get_cached_value_with_ttl", return_value=("fresh", 50)):
+            result = await test_func()
+
+        assert result == "fresh"
+        assert called is False
+
+    async def test_cache_result_caches_not_found(self):
+        from unittest.mock import patch
+        from app.core.exceptions import ResourceNotFoundError
+
+        @cache_result(ttl=60, not_found_ttl=5)
+        async def test_func():
+            raise ResourceNotFoundError(message="missing", details={"id": "x"})
+
+        with patch("app.core.cache_redis.get_cached_value", return_value=None), \
+                patch("app.core.cache_redis.set_cached_value") as mock_set:
+            with pytest.raises(ResourceNotFoundError):
+                await test_func()
+
+        marker, marker_ttl = mock_set.call_args.args[1:]
+        assert marker_ttl == 5
+
+        called = False
+
+        @cache_result(ttl=60, not_found_ttl=5)
+        async def test_func_hit():
+            nonlocal called
+            called = True
+
+        with patch("app.core.cache_redis.get_cached_value", return_value=marker):
+            with pytest.raises(ResourceNotFoundError, match="missing"):
+                await test_func_hit()
+
+        assert called is False
+
+    async def test_cache_result_waits_for_peer_worker(self):
+        from unittest.mock import patch
+
+        called = False
+
+        @cache_result(ttl=60)
+        async def test_func():
+            nonlocal called
+            called = True
+
+        # Miss on the first lookup; the worker holding the lock then stores the value
+        with patch("app.core.cache_redis.get_cached_value", side_effect=[None, "from_peer"]), \
+                patch("app.core.cache_redis.acquire_cache_lock", return_value=None), \
+                patch("app.core.cache_redis.release_cache_lock"):
+            result = await test_func()
+
+        assert result == "from_peer"
+        assert called is False
+
+    async def test_cache_result_peer_timeout_does_not_release_lock(self):
+        from unittest.mock import patch
+
+        called = False
+
+        @cache_result(ttl=60)
+        async def test_func():
+            nonlocal called
+            called = True
+            return "computed"
+
+        # Another worker holds the lock and never stores a value
+        with patch("app.core.cache_redis.get_cached_value", return_value=None), \
+                patch("app.core.cache_redis.acquire_cache_lock", return_value=None), \
+                patch("app.core.cache_redis._wait_for_peer", return_value=None), \
+                patch("app.core.cache_redis.set_cached_value"), \
+                patch("app.core.cache_redis.release_cache_lock") as mock_release:
+            result = await test_func()
+
+        assert result == "computed"
+        assert called is True
+        mock_release.assert_not_called()
+
     async def test_cache_result_disabled(self):
         from app.core import cache
         
@@ -203,19 +387,29 @@ class TestCacheHelpers:
         
         assert result == '"new_value"'
 
-    async def test_get_cached_timestamp(self):
+    async def test_release_cache_lock_only_for_owner(self):
+        from app.core.cache_redis import acquire_cache_lock, release_cache_lock
+
         client = await get_redis_client()
+        token = await acquire_cache_lock("lock_key")
         
-        await set_cached_value("timestamp_key", "value", ttl=60)
+        assert token is not None
+        assert await acquire_cache_lock("lock_key") is None
         
-        result = await get_cached_timestamp("timestamp_key")
+        # A worker that does not hold the lock cannot delete it
+        await release_cache_lock("lock_key", "not-the-owner")
+        assert await client.get("lock_key:lock") == token
         
-        assert result > 0
+        await release_cache_lock("lock_key", token)
+        assert await client.get("lock_key:lock") is None
 
-    async def test_get_cached_timestamp_not_found(self):
-        result = await get_cached_timestamp("nonexistent")
-        
-        assert result == 0
+    async def test_cache_generation_bump(self):
+        from app.core.cache_redis import bump_cache_generation, get_cache_generation
+
+        assert await get_cache_generation("gen_key") == 0
+        await bump_cache_generation("gen_key")
+        await bump_cache_generation("gen_key")
+        assert await get_cache_generation("gen_key") == 2
 
     async def test_has_cached_key_true(self):
         client = await get_redis_client()
@@ -6,11 +6,14 @@ from fastapi.testclient import TestClient
 
 from app.main import app
 from app.core.exceptions import ResourceNotFoundError, AuthenticationError, ExternalServiceError
-from tests.conftest import MockStreamService
+from tests.conftest import create_mock_stream_service
 from app.api.v1.endpoints.explore import get_explore_service
 from app.core.ytmusic_client import get_ytmusic
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 class MockExploreService:
     """Mock ExploreService for integration tests."""
     
@@ -48,7 +51,7 @@ class MockExploreService:
 
 def _make_client(mock_service):
     """Create test client with mocked explore service."""
-    mock_stream = MockStreamService()
+    mock_stream = create_mock_stream_service()
     app.dependency_overrides[get_explore_service] = lambda: mock_service
     app.dependency_overrides[get_ytmusic] = lambda: mock_stream
     client = TestClient(app)
@@ -2,9 +2,20 @@
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 
+from app.services import explore_service
 from app.services.explore_service import ExploreService
 
 
+pytestmark = pytest.mark.uses_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_moods_index(monkeypatch):
+    """Start each test without a shared moods index."""
+    monkeypatch.setattr(explore_service, "_moods_index", {})
+    monkeypatch.setattr(explore_service, "_moods_index_expires_at", 0.0)
+
+
 @pytest.mark.asyncio
 class TestExploreService:
     """Test cases for ExploreService class."""
@@ -117,9 +128,42 @@ class TestGetGenreNameFromParams:
         service = ExploreService(mock_ytmusic)
         
         result = await service.get_genre_name_from_params("unknown_params")
-        
+
         assert result is None
 
+    async def test_get_genre_name_from_home_moods_index(self, mock_ytmusic, sample_home_content):
+        """Test genre lookups fall back to the flat home moods index."""
+        mock_ytmusic.get_mood_categories.return_value = {}
+        mock_ytmusic.get_home.return_value = sample_home_content
+        service = ExploreService(mock_ytmusic)
+
+        result = await service.get_genre_name_from_params("abc123")
+
+        assert result == "Rock"
+        assert explore_service._get_moods_index()["abc123"] == "Rock"
+
+    async def test_moods_index_shared_across_instances(self, mock_ytmusic, sample_home_content):
+        """Test a later per-request service answers from the index without loading home."""
+        mock_ytmusic.get_mood_categories.return_value = {}
+        mock_ytmusic.get_home.return_value = sample_home_content
+        await ExploreService(mock_ytmusic).get_genre_name_from_params("abc123")
+
+        service = ExploreService(mock_ytmusic)
+        with patch.object(ExploreService, "get_home_with_moods", AsyncMock()) as mock_home:
+            result = await service.get_genre_name_from_params("abc123")
+
+        assert result == "Rock"
+        mock_home.assert_not_awaited()
+
+    async def test_moods_index_expires_with_home_cache(self, mock_ytmusic, sample_home_content):
+        """Test the index is ignored once the home cache TTL has passed."""
+        mock_ytmusic.get_mood_categories.return_value = {}
+        mock_ytmusic.get_home.return_value = sample_home_content
+        await ExploreService(mock_ytmusic).get_genre_name_from_params("abc123")
+
+        with patch.object(explore_service.time, "monotonic", return_value=explore_service._moods_index_expires_at):
+            assert explore_service._get_moods_index() == {}
+
 
 @pytest.mark.asyncio
 class TestFindGenreInStructure:
@@ -314,6 +358,27 @@ class TestGetMoodPlaylistsAlternative:
         playlist_ids = [p.get("playlistId") for p in result]
         assert len(playlist_ids) == len(set(playlist_ids))
 
+    @patch("app.services.search_service.SearchService")
+    async def test_get_mood_playlists_alternative_stops_when_limit_met(
+        self, mock_search_service_class, mock_ytmusic
+    ):
+        """Test later queries are skipped once the first fills the limit."""
+        mock_search_service = MagicMock()
+        mock_search_service.search = AsyncMock(return_value={
+            "items": [
+                {"playlistId": "pl1", "title": "Playlist 1"},
+                {"playlistId": "pl2", "title": "Playlist 2"},
+            ],
+            "pagination": {},
+        })
+        mock_search_service_class.return_value = mock_search_service
+
+        service = ExploreService(mock_ytmusic)
+        result = await service.get_mood_playlists_alternative("Salsa", limit=2)
+
+        assert [p["playlistId"] for p in result] == ["pl1", "pl2"]
+        assert mock_search_service.search.await_count == 1
+
 
 @pytest.mark.asyncio
 class TestExploreServiceCaching:
@@ -12,10 +12,13 @@ from app.core.exceptions import (
     ExternalServiceError,
     CircuitBreakerError,
 )
-from tests.conftest import MockPlaylistService, MockStreamService
+from tests.conftest import create_mock_playlist_service, create_mock_stream_service
 from app.api.v1.endpoints.playlists import get_playlist_service, get_stream_service
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 @pytest.fixture(autouse=True)
 def patch_redis():
     redis_mock = AsyncMock()
@@ -44,82 +47,82 @@ def clear_overrides():
 class TestPlaylistEndpointExceptionPassthrough:
 
     def test_playlist_service_exception_404_not_found(self):
-        mock_service = MockPlaylistService()
-        mock_service._get_playlist_side_effect = ResourceNotFoundError(
+        mock_service = create_mock_playlist_service()
+        mock_service.get_playlist.side_effect = ResourceNotFoundError(
             message="Playlist no encontrada.",
             details={"resource_type": "playlist", "playlist_id": "PLinvalid"}
         )
         app.dependency_overrides[get_playlist_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/playlists/PLinvalid?include_stream_urls=false")
         assert response.status_code == 404
 
     def test_playlist_service_exception_401_auth(self):
-        mock_service = MockPlaylistService()
-        mock_service._get_playlist_side_effect = AuthenticationError(
+        mock_service = create_mock_playlist_service()
+        mock_service.get_playlist.side_effect = AuthenticationError(
             message="Error de autenticación.",
             details={"operation": "get_playlist"}
         )
         app.dependency_overrides[get_playlist_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/playlists/PLtest?include_stream_urls=false")
         assert response.status_code == 401
 
     def test_playlist_service_exception_429_rate_limit(self):
-        mock_service = MockPlaylistService()
-        mock_service._get_playlist_side_effect = RateLimitError(
+        mock_service = create_mock_playlist_service()
+        mock_service.get_playlist.side_effect = RateLimitError(
             message="Rate limit exceeded.",
             details={"retry_after": 300}
         )
         app.dependency_overrides[get_playlist_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/playlists/PLtest?include_stream_urls=false")
         assert response.status_code == 429
 
     def test_playlist_service_exception_502_external(self):
-        mock_service = MockPlaylistService()
-        mock_service._get_playlist_side_effect = ExternalServiceError(
+        mock_service = create_mock_playlist_service()
+        mock_service.get_playlist.side_effect = ExternalServiceError(
             message="Error en YouTube Music.",
             details={"operation": "get_playlist"}
         )
         app.dependency_overrides[get_playlist_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/playlists/PLtest?include_stream_urls=false")
         assert response.status_code == 502
 
     def test_playlist_service_exception_503_circuit_breaker(self):
-        mock_service = MockPlaylistService()
-        mock_service._get_playlist_side_effect = CircuitBreakerError(
+        mock_service = create_mock_playlist_service()
+        mock_service.get_playlist.side_effect = CircuitBreakerError(
             message="Servicio no disponible.",
             details={"retry_after": 60, "state": "OPEN"}
         )
         app.dependency_overrides[get_playlist_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/playlists/PLtest?include_stream_urls=false")
         assert response.status_code == 503
 
     def test_playlist_generic_exception_returns_500(self):
-        mock_service = MockPlaylistService()
-        mock_service._get_playlist_side_effect = RuntimeError("unexpected boom")
+        mock_service = create_mock_playlist_service()
+        mock_service.get_playlist.side_effect = RuntimeError("unexpected boom")
         app.dependency_overrides[get_playlist_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/playlists/PLtest?include_stream_urls=false")
         assert response.status_code == 500
 
     def test_playlist_success_returns_200(self):
-        mock_service = MockPlaylistService()
-        mock_service._get_playlist_return = {
+        mock_service = create_mock_playlist_service()
+        mock_service.get_playlist.return_value = {
             "title": "Test",
             "tracks": [{"videoId": "abc"}]
         }
         app.dependency_overrides[get_playlist_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/playlists/PLtest?include_stream_urls=false")
         assert response.status_code == 200
@@ -1,11 +1,16 @@
 """Unit tests for PlaylistService."""
+import asyncio
+
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.playlist_service import PlaylistService
 from app.core.exceptions import ResourceNotFoundError
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 @pytest.mark.asyncio
 class TestPlaylistService:
     """Test cases for PlaylistService class."""
@@ -114,6 +119,31 @@ class TestGetPlaylist:
         with pytest.raises(Exception):
             await service.get_playlist("PL123")
 
+    async def test_get_playlist_prefetches_next_page(self, mock_ytmusic, sample_playlist):
+        """Test get_playlist caches the page that starts where this one ends."""
+        track = sample_playlist["tracks"][0]
+        sample_playlist["tracks"] = [dict(track, videoId=f"song{i}") for i in range(3)]
+        mock_ytmusic.get_playlist.return_value = sample_playlist
+        service = PlaylistService(mock_ytmusic)
+
+        with patch.object(PlaylistService.get_playlist, "prime", new=AsyncMock()) as mock_prime:
+            result = await service.get_playlist("PL123", limit=2)
+            await asyncio.sleep(0)
+
+        assert len(result["items"]) == 2
+        next_page = mock_prime.call_args.args[0]
+        assert mock_prime.call_args.kwargs["start_index"] == 2
+        assert [t["videoId"] for t in next_page["items"]] == ["song2"]
+
+    async def test_get_playlist_projects_fields(self, mock_ytmusic, sample_playlist):
+        """Test get_playlist keeps only the requested track fields."""
+        mock_ytmusic.get_playlist.return_value = sample_playlist
+        service = PlaylistService(mock_ytmusic)
+
+        result = await service.get_playlist("PL123", fields=frozenset({"videoId", "title"}))
+
+        assert result["items"] == [{"videoId": "song1", "title": "Playlist Song 1"}]
+
     async def test_get_playlist_logs_track_count(self, mock_ytmusic, sample_playlist, caplog):
         """Test get_playlist logs track count."""
         mock_ytmusic.get_playlist.return_value = sample_playlist
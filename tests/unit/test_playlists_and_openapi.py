@@ -12,10 +12,13 @@ from app.core.exceptions import (
     ExternalServiceError,
     YTMusicServiceException
 )
-from tests.conftest import MockPlaylistService, MockStreamService
+from tests.conftest import create_mock_playlist_service, create_mock_stream_service
 from app.api.v1.endpoints.playlists import get_playlist_service, get_stream_service
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 @pytest.fixture(autouse=True)
 def patch_redis():
     """Mock Redis cache for testing."""
@@ -48,13 +51,13 @@ class TestPlaylistsExceptionHandling:
 
     def test_playlist_resource_not_found_returns_404(self):
         """Test that ResourceNotFoundError returns 404 (not 500)."""
-        mock_service = MockPlaylistService()
-        mock_service._get_playlist_side_effect = ResourceNotFoundError(
+        mock_service = create_mock_playlist_service()
+        mock_service.get_playlist.side_effect = ResourceNotFoundError(
             message="Playlist no encontrada.",
             details={"resource_type": "playlist", "playlist_id": "PLinvalid"}
         )
         app.dependency_overrides[get_playlist_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         
         with TestClient(app) as client:
             response = client.get("/api/v1/playlists/PLinvalid?include_stream_urls=false")
@@ -63,13 +66,13 @@ class TestPlaylistsExceptionHandling:
 
     def test_playlist_authentication_error_returns_401(self):
         """Test that AuthenticationError returns 401 (not 500)."""
-        mock_service = MockPlaylistService()
-        mock_service._get_playlist_side_effect = AuthenticationError(
+        mock_service = create_mock_playlist_service()
+        mock_service.get_playlist.side_effect = AuthenticationError(
             message="Error de autenticación.",
             details={"operation": "get_playlist"}
         )
         app.dependency_overrides[get_playlist_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         
         with TestClient(app) as client:
             response = client.get("/api/v1/playlists/PLtest?include_stream_urls=false")
@@ -78,13 +81,13 @@ class TestPlaylistsExceptionHandling:
 
     def test_playlist_external_service_error_returns_502(self):
         """Test that ExternalServiceError returns 502 (not 500)."""
-        mock_service = MockPlaylistService()
-        mock_service._get_playlist_side_effect = ExternalServiceError(
+        mock_service = create_mock_playlist_service()
+        mock_service.get_playlist.side_effect = ExternalServiceError(
             message="Error en YouTube Music.",
             details={"operation": "get_playlist"}
         )
         app.dependency_overrides[get_playlist_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         
         with TestClient(app) as client:
             response = client.get("/api/v1/playlists/PLtest?include_stream_urls=false")
@@ -98,14 +101,14 @@ class TestPlaylistsExceptionHandling:
         cached at the service layer. This test verifies that YTMusicServiceException
         raised by the playlist service is properly handled by the exception handler.
         """
-        mock_service = MockPlaylistService()
-        mock_service._get_playlist_side_effect = YTMusicServiceException(
+        mock_service = create_mock_playlist_service()
+        mock_service.get_playlist.side_effect = YTMusicServiceException(
             message="Service error",
             details={"operation": "get_playlist"}
         )
         
         app.dependency_overrides[get_playlist_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         
         with TestClient(app) as client:
             response = client.get("/api/v1/playlists/PLtest?include_stream_urls=false")
@@ -114,6 +117,36 @@ class TestPlaylistsExceptionHandling:
             assert response.status_code == 500
 
 
+class TestPlaylistFields:
+    """Tests for the fields projection on the playlists endpoint."""
+
+    def test_fields_limits_serialized_track_keys(self):
+        """Test that only the requested track keys reach the JSON response."""
+        from app.services.playlist_service import PlaylistService
+
+        ytmusic = MagicMock()
+        ytmusic.get_playlist.return_value = {
+            "id": "PLtest",
+            "title": "Projected Playlist",
+            "tracks": [
+                {"videoId": "song1", "title": "Song 1", "artists": [{"name": "Artist"}], "duration": "3:30"},
+            ],
+        }
+        app.dependency_overrides[get_playlist_service] = lambda: PlaylistService(ytmusic)
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
+
+        with TestClient(app) as client:
+            response = client.get(
+                "/api/v1/playlists/PLtest?include_stream_urls=false&fields=videoId,title"
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data["tracks"][0]) == {"videoId", "title"}
+        assert data["title"] == "Projected Playlist"
+        assert data["pagination"]["total_results"] == 1
+
+
 class TestOpenAPIYAML:
     """Tests for /openapi.yaml endpoint."""
 
@@ -6,12 +6,15 @@ from fastapi.testclient import TestClient
 
 from app.main import app
 from app.core.exceptions import ResourceNotFoundError, ExternalServiceError
-from tests.conftest import MockBrowseService, MockStreamService
+from tests.conftest import create_mock_browse_service, create_mock_stream_service
 from app.api.v1.endpoints.browse import get_browse_service, get_stream_service
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 def _make_client(mock_service):
-    mock_stream = MockStreamService()
+    mock_stream = create_mock_stream_service()
     app.dependency_overrides[get_browse_service] = lambda: mock_service
     app.dependency_overrides[get_stream_service] = lambda: mock_stream
     client = TestClient(app)
@@ -48,13 +51,13 @@ def clear_overrides():
 class TestSCRUM25_ArtistEndpoint:
 
     def test_artist_not_found_returns_404(self):
-        mock_service = MockBrowseService()
-        mock_service._get_artist_side_effect = ResourceNotFoundError(
+        mock_service = create_mock_browse_service()
+        mock_service.get_artist.side_effect = ResourceNotFoundError(
             message="Artista no encontrado.",
             details={"resource_type": "artist", "channel_id": "UCinvalid1"}
         )
         app.dependency_overrides[get_browse_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         from app.core.ytmusic_client import get_ytmusic_client
         get_ytmusic_client.cache_clear()
         with TestClient(app) as client:
@@ -65,8 +68,8 @@ class TestSCRUM25_ArtistEndpoint:
 class TestSCRUM30_ArtistAlbumsEndpoint:
 
     def test_artist_albums_not_found_returns_404(self):
-        mock_service = MockBrowseService()
-        mock_service._get_artist_albums_side_effect = ResourceNotFoundError(
+        mock_service = create_mock_browse_service()
+        mock_service.get_artist_albums.side_effect = ResourceNotFoundError(
             message="Recurso no encontrado.",
             details={"operation": "obtener álbumes de artista UCinvalid"}
         )
@@ -75,8 +78,8 @@ class TestSCRUM30_ArtistAlbumsEndpoint:
         assert response.status_code == 404
 
     def test_artist_albums_success_returns_200(self):
-        mock_service = MockBrowseService()
-        mock_service._get_artist_albums_return = {
+        mock_service = create_mock_browse_service()
+        mock_service.get_artist_albums.return_value = {
             "data": [{"browseId": "MPREb_test", "title": "Test Album"}]
         }
         client = _make_client(mock_service)
@@ -87,8 +90,8 @@ class TestSCRUM30_ArtistAlbumsEndpoint:
 class TestSCRUM26_AlbumEndpoint:
 
     def test_album_not_found_returns_404(self):
-        mock_service = MockBrowseService()
-        mock_service._get_album_side_effect = ResourceNotFoundError(
+        mock_service = create_mock_browse_service()
+        mock_service.get_album.side_effect = ResourceNotFoundError(
             message="Álbum no encontrado.",
             details={"resource_type": "album", "album_id": "MPREb_invalid"}
         )
@@ -97,8 +100,8 @@ class TestSCRUM26_AlbumEndpoint:
         assert response.status_code == 404
 
     def test_album_success_returns_200(self):
-        mock_service = MockBrowseService()
-        mock_service._get_album_return = {
+        mock_service = create_mock_browse_service()
+        mock_service.get_album.return_value = {
             "title": "Test Album",
             "tracks": [{"videoId": "abc123", "title": "Track 1"}]
         }
@@ -6,11 +6,14 @@ from fastapi.testclient import TestClient
 
 from app.main import app
 from app.core.exceptions import ResourceNotFoundError, ExternalServiceError
-from tests.conftest import MockBrowseService, MockStreamService
+from tests.conftest import create_mock_browse_service, create_mock_stream_service
 from app.api.v1.endpoints.browse import get_browse_service, get_stream_service
 from app.services.explore_service import ExploreService
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -117,23 +120,23 @@ class TestSCRUM28_RelatedSongsEmpty:
     """SCRUM-28: /browse/song/:videoId/related should handle empty results gracefully."""
 
     def test_related_songs_empty_returns_200_empty_list(self):
-        mock_service = MockBrowseService()
-        mock_service._get_song_related_return = []
+        mock_service = create_mock_browse_service()
+        mock_service.get_song_related.return_value = []
         app.dependency_overrides[get_browse_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/browse/song/dQw4w9WgXcQ/related?include_stream_urls=false")
         assert response.status_code == 200
         assert response.json() == []
 
     def test_related_songs_with_results_returns_200(self):
-        mock_service = MockBrowseService()
-        mock_service._get_song_related_return = [
+        mock_service = create_mock_browse_service()
+        mock_service.get_song_related.return_value = [
             {"videoId": "related1", "title": "Related Song 1"},
             {"videoId": "related2", "title": "Related Song 2"},
         ]
         app.dependency_overrides[get_browse_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/browse/song/dQw4w9WgXcQ/related?include_stream_urls=false")
         assert response.status_code == 200
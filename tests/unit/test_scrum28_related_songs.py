@@ -6,12 +6,15 @@ from fastapi.testclient import TestClient
 
 from app.main import app
 from app.core.exceptions import ResourceNotFoundError, ExternalServiceError
-from tests.conftest import MockBrowseService, MockStreamService
+from tests.conftest import create_mock_browse_service, create_mock_stream_service
 from app.api.v1.endpoints.browse import get_browse_service, get_stream_service
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 def _make_client(mock_service):
-    mock_stream = MockStreamService()
+    mock_stream = create_mock_stream_service()
     app.dependency_overrides[get_browse_service] = lambda: mock_service
     app.dependency_overrides[get_stream_service] = lambda: mock_stream
     client = TestClient(app)
@@ -50,9 +53,9 @@ class TestSCRUM28_RelatedSongs:
 
     def test_related_songs_returns_200_with_data_when_available(self):
         """Test that related songs endpoint returns 200 with data when ytmusic returns results."""
-        mock_service = MockBrowseService()
+        mock_service = create_mock_browse_service()
         # Mock data that mimics what ytmusicapi.get_song_related might return
-        mock_service._get_song_related_return = [
+        mock_service.get_song_related.return_value = [
             {
                 "videoId": "related1",
                 "title": "Related Song 1",
@@ -83,8 +86,8 @@ class TestSCRUM28_RelatedSongs:
 
     def test_related_songs_returns_200_empty_list_when_no_data(self):
         """Test that related songs endpoint returns 200 with empty list when ytmusic returns empty results."""
-        mock_service = MockBrowseService()
-        mock_service._get_song_related_return = []
+        mock_service = create_mock_browse_service()
+        mock_service.get_song_related.return_value = []
         client = _make_client(mock_service)
         response = client.get("/api/v1/browse/song/dQw4w9WgXcQ/related?include_stream_urls=false")
         assert response.status_code == 200
@@ -92,8 +95,8 @@ class TestSCRUM28_RelatedSongs:
 
     def test_related_songs_returns_200_empty_list_when_none_returned(self):
         """Test that related songs endpoint returns 200 with empty list when ytmusic returns None."""
-        mock_service = MockBrowseService()
-        mock_service._get_song_related_return = None
+        mock_service = create_mock_browse_service()
+        mock_service.get_song_related.return_value = None
         client = _make_client(mock_service)
         response = client.get("/api/v1/browse/song/dQw4w9WgXcQ/related?include_stream_urls=false")
         assert response.status_code == 200
@@ -101,8 +104,8 @@ class TestSCRUM28_RelatedSongs:
 
     def test_related_songs_with_stream_urls_enrichment(self):
         """Test that related songs endpoint properly enriches with stream URLs when requested."""
-        mock_service = MockBrowseService()
-        mock_service._get_song_related_return = [
+        mock_service = create_mock_browse_service()
+        mock_service.get_song_related.return_value = [
             {
                 "videoId": "related1",
                 "title": "Related Song 1",
@@ -110,9 +113,9 @@ class TestSCRUM28_RelatedSongs:
             }
         ]
         
-        mock_stream = MockStreamService()
+        mock_stream = create_mock_stream_service()
         # Mock the enrichment to return data with stream URLs
-        mock_stream._enrich_items_with_streams_return = [
+        mock_stream.enrich_items_with_streams.return_value = [
             {
                 "videoId": "related1",
                 "title": "Related Song 1",
@@ -144,8 +147,8 @@ class TestSCRUM28_RelatedSongs:
 
     def test_related_songs_handles_youtube_api_exception(self):
         """Test that related songs endpoint handles ytmusic API exceptions properly."""
-        mock_service = MockBrowseService()
-        mock_service._get_song_related_side_effect = Exception("Internal server error from YouTube")
+        mock_service = create_mock_browse_service()
+        mock_service.get_song_related.side_effect = Exception("Internal server error from YouTube")
         client = _make_client(mock_service)
         response = client.get("/api/v1/browse/song/dQw4w9WgXcQ/related?include_stream_urls=false")
         # Should return 502 Bad Gateway for external service errors
@@ -157,8 +160,8 @@ class TestSCRUM28_RelatedSongs:
         
     def test_related_songs_handles_resource_not_found(self):
         """Test that related songs endpoint handles resource not found properly."""
-        mock_service = MockBrowseService()
-        mock_service._get_song_related_side_effect = ResourceNotFoundError(
+        mock_service = create_mock_browse_service()
+        mock_service.get_song_related.side_effect = ResourceNotFoundError(
             message="Video not found",
             details={"resource_type": "video", "video_id": "invalid123"}
         )
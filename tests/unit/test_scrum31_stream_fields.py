@@ -6,10 +6,13 @@ from fastapi.testclient import TestClient
 
 from app.main import app
 from app.core.exceptions import ResourceNotFoundError, ExternalServiceError
-from tests.conftest import MockStreamService
+from tests.conftest import create_mock_stream_service
 from app.api.v1.endpoints.stream import get_stream_service
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 def _make_client(mock_service):
     app.dependency_overrides[get_stream_service] = lambda: mock_service
     client = TestClient(app)
@@ -46,9 +49,9 @@ def clear_overrides():
 class TestSCRUM31_StreamFields:
     def test_stream_url_only_contains_streamurl_field(self):
         """Test that stream endpoint only returns streamUrl field (not url or stream_url)."""
-        mock_service = MockStreamService()
+        mock_service = create_mock_stream_service()
         # Set up mock to return a stream URL
-        mock_service._get_stream_url_return = {
+        mock_service.get_stream_url.return_value = {
             "streamUrl": "https://example.com/stream.m4a",
             "title": "Test Song",
             "artist": "Test Artist",
@@ -82,9 +85,9 @@ class TestSCRUM31_StreamFields:
 
     def test_stream_url_from_cache_also_correct(self):
         """Test that cached stream URL also only has streamUrl field."""
-        mock_service = MockStreamService()
+        mock_service = create_mock_stream_service()
         # Set up mock to return a cached stream URL
-        mock_service._get_stream_url_return = {
+        mock_service.get_stream_url.return_value = {
             "streamUrl": "https://example.com/stream.m4a",
             "title": "Test Song",
             "artist": "Test Artist",
@@ -114,9 +117,9 @@ class TestSCRUM31_StreamFields:
 
     def test_stream_url_handles_errors_correctly(self):
         """Test that error responses don't contain the redundant fields."""
-        mock_service = MockStreamService()
+        mock_service = create_mock_stream_service()
         # Set up mock to raise an exception
-        mock_service._get_stream_url_side_effect = ExternalServiceError(
+        mock_service.get_stream_url.side_effect = ExternalServiceError(
             message="No se pudo obtener el stream de audio. Verifica el ID del video.",
             details={"video_id": "dQw4w9WgXcQ", "operation": "get_stream_url"}
         )
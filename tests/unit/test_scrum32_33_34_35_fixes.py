@@ -14,7 +14,10 @@ from app.core.exceptions import ResourceNotFoundError, ExternalServiceError, Rat
 from app.main import app
 from app.api.v1.endpoints.explore import get_explore_service
 from app.core.ytmusic_client import get_ytmusic
-from tests.conftest import MockStreamService
+from tests.conftest import create_mock_stream_service
+
+
+pytestmark = pytest.mark.uses_cache
 
 
 class MockExploreService:
@@ -32,7 +35,7 @@ class MockExploreService:
 
 def _make_explore_client(mock_service):
     """Create test client with mocked explore service."""
-    mock_stream = MockStreamService()
+    mock_stream = create_mock_stream_service()
     app.dependency_overrides[get_explore_service] = lambda: mock_service
     app.dependency_overrides[get_ytmusic] = lambda: mock_stream
     client = TestClient(app)
@@ -10,6 +10,9 @@ from app.services.browse_service import BrowseService
 from app.core.exceptions import ResourceNotFoundError
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 @pytest.fixture
 def mock_ytmusic():
     mock = MagicMock()
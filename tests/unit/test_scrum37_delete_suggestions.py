@@ -14,6 +14,9 @@ from app.api.v1.endpoints.search import remove_search_suggestions, get_search_se
 from app.services.search_service import SearchService
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 # Minimal app without full startup
 minimal_app = FastAPI()
 minimal_app.add_api_route(
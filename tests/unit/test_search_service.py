@@ -2,10 +2,13 @@
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 
-from app.services.search_service import SearchService
+from app.services.search_service import SearchService, normalize_suggestion_query
 from app.core.exceptions import RateLimitError, AuthenticationError, ExternalServiceError
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 @pytest.fixture
 def mock_ytmusic():
     """Create a mock YTMusic client."""
@@ -153,6 +156,10 @@ class TestSearchSuggestions:
 
         assert result == []
 
+    def test_normalize_suggestion_query(self):
+        """Case and spacing variants share one suggestions cache key."""
+        assert normalize_suggestion_query("  Taylor   Swif ") == "taylor swif"
+
     async def test_get_search_suggestions_handles_error(self, mock_ytmusic):
         """Test get search suggestions handles errors."""
         mock_ytmusic.get_search_suggestions.side_effect = Exception("API Error")
@@ -1,13 +1,23 @@
 """Unit tests for StreamService."""
 import pytest
+import asyncio
 from unittest.mock import MagicMock, patch, AsyncMock
 import time
 
-from app.services.stream_service import StreamService
+from app.services.stream_service import (
+    StreamService,
+    _YDL_CACHE_PER_THREAD,
+    _extract_stream_info,
+    _get_ydl,
+    close_ydl_cache,
+)
 from app.core.circuit_breaker import CircuitState
 from app.core.exceptions import CircuitBreakerError, RateLimitError, ExternalServiceError
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 @pytest.mark.asyncio
 class TestStreamService:
     """Test cases for StreamService class."""
@@ -19,21 +29,13 @@ class TestStreamService:
         assert service.settings is not None
         assert service._ytmusic is None
 
-    def test_metadata_cache_key(self):
-        """Test metadata cache key generation."""
+    def test_stream_cache_key(self):
+        """Test stream hash cache key generation."""
         service = StreamService()
         
-        key = service._get_metadata_cache_key("video123")
+        key = service._get_stream_cache_key("video123")
         
-        assert key == "stream_metadata:video123"
-
-    def test_stream_url_cache_key(self):
-        """Test stream URL cache key generation."""
-        service = StreamService()
-        
-        key = service._get_stream_url_cache_key("video123")
-        
-        assert key == "stream_url:video123"
+        assert key == "music:stream:video123"
 
 
 @pytest.mark.asyncio
@@ -107,6 +109,129 @@ class TestStreamServiceCaching:
         
         mock_cache.set_cached_value.assert_not_called()
 
+    async def test_get_stream_url_full_hit_single_lookup(self):
+        """Test a fully cached response reads metadata and URL in one cache call."""
+        service = StreamService()
+        service.settings.CACHE_ENABLED = True
+        cached = [{
+            "meta": {"title": "Test", "artist": "Artist"},
+            "url": "https://example.com/a.m4a",
+            "url_exp": time.time() + 3600,
+        }]
+
+        with patch(
+            "app.services.stream_service.get_cached_hash_fields",
+            new_callable=AsyncMock,
+            return_value=cached,
+        ) as mock_get:
+            result = await service.get_stream_url("video123")
+
+        assert result["streamUrl"] == "https://example.com/a.m4a"
+        assert result["title"] == "Test"
+        assert result["from_cache"] is True
+        mock_get.assert_awaited_once()
+
+    async def test_hot_entry_served_from_local_cache(self):
+        """Test a fresh entry read once from Redis is then served in-process."""
+        service = StreamService()
+        service.settings.CACHE_ENABLED = True
+        cached = [{"meta": {"title": "Test"}, "url": "https://example.com/a.m4a", "url_exp": time.time() + 3600}]
+
+        with patch(
+            "app.services.stream_service.get_cached_hash_fields",
+            new_callable=AsyncMock,
+            return_value=cached,
+        ) as mock_get:
+            first = await service._try_full_cache("video123")
+            second = await service._try_full_cache("video123")
+
+        assert first == second == ({"title": "Test"}, "https://example.com/a.m4a")
+        mock_get.assert_awaited_once()
+
+    async def test_local_cache_expires_on_monotonic_deadline(self):
+        """Test an in-process entry is dropped once its monotonic deadline passes."""
+        service = StreamService()
+        service._local_put("video123", {"url": "https://example.com/a.m4a", "url_exp": time.time() + 60})
+        assert service._local_get("video123") is not None
+
+        with patch("app.services.stream_service.time.monotonic", return_value=time.monotonic() + 61):
+            assert service._local_get("video123") is None
+
+        assert "video123" not in service._local_entries
+
+    async def test_local_cache_bounded_by_cache_max_size(self):
+        """Test the in-process LRU evicts its least recently used entry past CACHE_MAX_SIZE."""
+        service = StreamService()
+        entry = {"url": "https://example.com/a.m4a", "url_exp": time.time() + 60}
+
+        with patch.object(service.settings, "CACHE_MAX_SIZE", 2):
+            service._local_put("a", entry)
+            service._local_put("b", entry)
+            service._local_get("a")
+            service._local_put("c", entry)
+
+        assert list(service._local_entries) == ["a", "c"]
+
+    async def test_local_cache_dropped_when_another_worker_invalidates(self):
+        """Test a bumped shared generation clears this worker's in-process entries."""
+        service = StreamService()
+        service.settings.CACHE_ENABLED = True
+        cached = [{"meta": {"title": "Test"}, "url": "https://example.com/a.m4a", "url_exp": time.time() + 3600}]
+
+        with patch(
+            "app.services.stream_service.get_cached_hash_fields",
+            new_callable=AsyncMock,
+            return_value=cached,
+        ) as mock_get, patch(
+            "app.services.stream_service.get_cache_generation",
+            new_callable=AsyncMock,
+            side_effect=[0, 0, 1],
+        ):
+            service._local_synced_at = 0.0
+            await service._try_full_cache("video123")
+            service._local_synced_at = 0.0
+            await service._try_full_cache("video123")
+            assert mock_get.await_count == 1
+
+            service._local_synced_at = 0.0
+            await service._try_full_cache("video123")
+
+        assert mock_get.await_count == 2
+
+    async def test_delete_cached_stream_bumps_generation(self):
+        """Test deleting an entry invalidates the in-process caches of every worker."""
+        service = StreamService()
+        service._local_put("video123", {"url": "https://example.com/a.m4a", "url_exp": time.time() + 60})
+
+        with patch(
+            "app.services.stream_service.delete_cached_key", new_callable=AsyncMock, return_value=True
+        ), patch("app.services.stream_service.bump_cache_generation", new_callable=AsyncMock) as mock_bump:
+            assert await service.delete_cached_stream("video123") is True
+
+        assert "video123" not in service._local_entries
+        mock_bump.assert_awaited_once_with(StreamService._LOCAL_GENERATION_KEY)
+
+    async def test_expired_stream_url_is_a_miss(self):
+        """Test a stream URL past its url_exp is not served from cache."""
+        service = StreamService()
+        service.settings.CACHE_ENABLED = True
+        cached = [{
+            "meta": {"title": "Test"},
+            "url": "https://example.com/a.m4a",
+            "url_exp": time.time() - 1,
+        }]
+
+        with patch(
+            "app.services.stream_service.get_cached_hash_fields",
+            new_callable=AsyncMock,
+            return_value=cached,
+        ) as mock_get:
+            metadata, stream_url = await service._try_full_cache("video123")
+
+        assert metadata == {"title": "Test"}
+        assert stream_url is None
+        mock_get.assert_awaited_once_with([service._get_stream_cache_key("video123")], ["meta", "url", "url_exp", "fail_exp"])
+
 
 @pytest.mark.asyncio
 class TestGetStreamUrl:
@@ -145,6 +270,61 @@ class TestGetStreamUrl:
         assert result["artist"] == "Test Artist"
         mock_circuit.record_success.assert_called_once()
 
+    @patch("app.services.stream_service.youtube_stream_circuit")
+    @patch("app.services.stream_service.yt_dlp")
+    async def test_get_stream_url_caches_result_in_one_write(self, mock_ytdlp, mock_circuit):
+        """Test metadata and URL are written together in the background."""
+        mock_circuit.is_open.return_value = False
+
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {
+            "title": "Test Song",
+            "formats": [{"acodec": "opus", "vcodec": "none", "url": "https://example.com/audio.m4a"}],
+        }
+        mock_ytdlp.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+
+        service = StreamService()
+        service.settings.CACHE_ENABLED = True
+        with patch("app.services.stream_service.set_cached_hash_fields", new_callable=AsyncMock) as mock_set, \
+                patch.object(service, "_try_full_cache", AsyncMock(return_value=(None, None))):
+            await service.get_stream_url("video123")
+            await asyncio.gather(*service._pending_writes)
+
+        mock_set.assert_awaited_once()
+        key, fields, ttl = mock_set.await_args.args
+        assert key == service._get_stream_cache_key("video123")
+        assert fields["meta"]["title"] == "Test Song"
+        assert fields["url"] == "https://example.com/audio.m4a"
+        assert ttl == service.METADATA_TTL
+
+    @patch("app.services.stream_service.youtube_stream_circuit")
+    @patch("app.services.stream_service.yt_dlp")
+    async def test_unavailable_video_is_negative_cached(self, mock_ytdlp, mock_circuit):
+        """Test an unavailable video is remembered and not extracted again."""
+        mock_circuit.is_open.return_value = False
+
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.side_effect = Exception("ERROR: [youtube] video123: Video unavailable")
+        mock_ytdlp.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+
+        service = StreamService()
+        service.settings.CACHE_ENABLED = True
+        with patch("app.services.stream_service.get_cached_hash_fields", new_callable=AsyncMock, return_value=[{}]), \
+                patch("app.services.stream_service.set_cached_hash_fields", new_callable=AsyncMock) as mock_set:
+            with pytest.raises(ExternalServiceError):
+                await service.get_stream_url("video123")
+            await asyncio.gather(*service._pending_writes)
+
+        _, fields, _ = mock_set.await_args.args
+        assert fields["fail_exp"] > time.time()
+
+        failed = [{"fail_exp": fields["fail_exp"]}]
+        with patch("app.services.stream_service.get_cached_hash_fields", new_callable=AsyncMock, return_value=failed):
+            with pytest.raises(ExternalServiceError):
+                await service.get_stream_url("video123")
+
+        mock_ydl.extract_info.assert_called_once()
+
     @patch("app.services.stream_service.youtube_stream_circuit")
     async def test_get_stream_url_circuit_open(self, mock_circuit):
         """Test stream URL when circuit breaker is open."""
@@ -227,6 +407,111 @@ class TestGetStreamUrl:
         
         assert result["url"] == "https://example.com/fallback.m4a"
 
+    @patch("app.services.stream_service.youtube_stream_circuit")
+    async def test_get_stream_url_coalesces_concurrent_misses(self, mock_circuit):
+        """Test concurrent misses for one video share a single extraction."""
+        mock_circuit.is_open.return_value = False
+        call_count = 0
+
+        async def fake_fetch(video_id):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.05)
+            return {"streamUrl": f"https://example.com/{video_id}.m4a", "from_cache": False}
+
+        service = StreamService()
+        with patch.object(service, "_try_full_cache", AsyncMock(return_value=(None, None))), \
+                patch.object(service, "_fetch_stream_url", side_effect=fake_fetch):
+            results = await asyncio.gather(*(service.get_stream_url("video123") for _ in range(5)))
+
+        assert call_count == 1
+        assert all(r["streamUrl"] == "https://example.com/video123.m4a" for r in results)
+        assert "video123" not in service._inflight
+
+    @patch("app.services.stream_service.youtube_stream_circuit")
+    @patch("app.services.stream_service.yt_dlp")
+    async def test_get_stream_url_prefers_requested_formats(self, mock_ytdlp, mock_circuit):
+        """Test audio-only requested_formats win over formats and adaptive_formats."""
+        mock_circuit.is_open.return_value = False
+
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {
+            "title": "Test Song",
+            "requested_formats": [
+                {"acodec": "none", "vcodec": "avc1", "url": "https://example.com/video.mp4"},
+                {"acodec": "opus", "vcodec": "none", "url": "https://example.com/requested.webm"},
+            ],
+            "formats": [{"acodec": "mp4a", "vcodec": "none", "url": "https://example.com/format.m4a"}],
+            "adaptive_formats": [{"acodec": "opus", "url": "https://example.com/adaptive.webm"}],
+        }
+        mock_ytdlp.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+
+        service = StreamService()
+        result = await service.get_stream_url("video123", bypass_cache=True)
+
+        assert result["streamUrl"] == "https://example.com/requested.webm"
+
+    @patch("app.services.stream_service.yt_dlp")
+    def test_youtube_dl_reused_for_same_options(self, mock_ytdlp):
+        """Test a YoutubeDL instance is built once per options on a thread."""
+        first = _get_ydl({"format": "bestaudio", "extractor_args": {"youtube": {}}})
+        second = _get_ydl({"extractor_args": {"youtube": {}}, "format": "bestaudio"})
+        _get_ydl({"format": "best"})
+
+        assert first is second
+        assert mock_ytdlp.YoutubeDL.call_count == 2
+
+    @patch("app.services.stream_service.yt_dlp")
+    def test_youtube_dl_cache_bounded_and_closed(self, mock_ytdlp):
+        """Test the least recently used YoutubeDL is closed on eviction and the rest at shutdown."""
+        mock_ytdlp.YoutubeDL.side_effect = lambda opts: MagicMock()
+        instances = [_get_ydl({"format": f"f{i}"}) for i in range(_YDL_CACHE_PER_THREAD + 1)]
+
+        instances[0].__exit__.assert_called_once_with(None, None, None)
+        assert all(not ydl.__exit__.called for ydl in instances[1:])
+
+        close_ydl_cache()
+
+        assert all(ydl.__exit__.call_count == 1 for ydl in instances)
+
+    @patch("app.services.stream_service.yt_dlp")
+    def test_extract_stream_info_keeps_only_used_fields(self, mock_ytdlp):
+        """Test extraction result is trimmed before crossing the process boundary."""
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {
+            "title": "Test Song",
+            "duration": 180,
+            "description": "long text",
+            "formats": [
+                {"acodec": "opus", "url": "https://example.com/a.webm", "http_headers": {"X": "1"}},
+            ],
+        }
+        mock_ytdlp.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+
+        info = _extract_stream_info("https://example.com/watch", {}, 0, 0)
+
+        assert info == {
+            "title": "Test Song",
+            "duration": 180,
+            "formats": [{"acodec": "opus", "url": "https://example.com/a.webm"}],
+        }
+
+    @patch("app.services.stream_service.time.sleep")
+    @patch("app.services.stream_service.yt_dlp")
+    def test_extract_stream_info_retries_transient_errors_only(self, mock_ytdlp, mock_sleep):
+        """Test connection errors are retried with backoff while rate limits fail fast."""
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.side_effect = [Exception("Connection reset"), {"title": "Test"}]
+        mock_ytdlp.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+
+        assert _extract_stream_info("https://example.com/watch", {}, 3, 2) == {"title": "Test"}
+        assert mock_sleep.call_count == 1
+
+        mock_ydl.extract_info.side_effect = Exception("HTTP Error 429: Too Many Requests")
+        with pytest.raises(Exception, match="429"):
+            _extract_stream_info("https://example.com/watch", {}, 3, 2)
+        assert mock_sleep.call_count == 1
+
 
 @pytest.mark.asyncio
 class TestThumbnailExtraction:
@@ -284,6 +569,23 @@ class TestThumbnailExtraction:
 class TestEnrichItems:
     """Test items enrichment with stream URLs."""
 
+    async def test_prefetch_stream_urls_runs_in_background(self):
+        """Test prefetch returns immediately and swallows extraction errors."""
+        service = StreamService()
+        fetched = []
+
+        async def fake_get_stream_url(video_id, bypass_cache=False):
+            fetched.append(video_id)
+            raise ExternalServiceError(message="unavailable")
+
+        with patch.object(service, "get_stream_url", side_effect=fake_get_stream_url):
+            service.prefetch_stream_urls(["a", "b"])
+            assert fetched == []
+            await asyncio.gather(*service._prefetches)
+
+        assert fetched == ["a", "b"]
+        assert not service._prefetches
+
     @patch("app.services.stream_service.youtube_stream_circuit")
     @patch("app.services.stream_service.yt_dlp")
     async def test_enrich_items_with_streams(self, mock_ytdlp, mock_circuit):
@@ -312,6 +614,44 @@ class TestEnrichItems:
         assert result[0]["stream_url"] == "https://audio.m4a"
         assert result[1]["stream_url"] == "https://audio.m4a"
 
+    async def test_enrich_items_fetches_repeated_video_once(self):
+        """Test repeated video IDs share one stream lookup."""
+        service = StreamService()
+        items = [
+            {"videoId": "video1", "title": "Song 1"},
+            {"videoId": "video1", "title": "Song 1 (again)"},
+        ]
+
+        with patch.object(
+            service, "_safe_get_stream_url",
+            new_callable=AsyncMock, return_value={"streamUrl": "https://audio.m4a"},
+        ) as mock_get:
+            result = await service.enrich_items_with_streams(items, bypass_cache=True)
+
+        mock_get.assert_awaited_once_with("video1")
+        assert [r["stream_url"] for r in result] == ["https://audio.m4a"] * 2
+
+    async def test_enrich_items_caps_concurrent_fetches(self):
+        """Test uncached videos are fetched at most ENRICH_CONCURRENCY at a time."""
+        service = StreamService()
+        items = [{"videoId": f"video{i}"} for i in range(6)]
+        running = peak = 0
+
+        async def fake_get(video_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"streamUrl": f"https://{video_id}.m4a"}
+
+        with patch.object(StreamService, "ENRICH_CONCURRENCY", 2), \
+                patch.object(service, "_safe_get_stream_url", side_effect=fake_get):
+            result = await service.enrich_items_with_streams(items, bypass_cache=True)
+
+        assert peak == 2
+        assert [r["stream_url"] for r in result] == [f"https://video{i}.m4a" for i in range(6)]
+
     async def test_enrich_items_without_stream_urls(self):
         """Test enriching items without stream URLs."""
         service = StreamService()
@@ -343,3 +683,24 @@ class TestEnrichItems:
         
         assert len(result) == 1
         assert "stream_url" not in result[0]
+
+
+@pytest.mark.asyncio
+class TestAdminStreamCacheInfo:
+    """Test the admin stream cache info endpoint."""
+
+    async def test_reports_stored_values(self):
+        """Test the info comes from the cached hash, without made-up timestamps."""
+        from app.api.v1.endpoints.admin.cache import get_stream_cache_info
+
+        entry = {"meta": {"title": "Song"}, "url": "https://example.com/a.webm", "url_exp": 1700000000.7}
+        with patch.object(StreamService, "get_cached_stream_entry", AsyncMock(return_value=entry)):
+            result = await get_stream_cache_info("dQw4w9WgXcQ", _verified=None)
+
+        cached = result.model_dump()["cached"]
+        assert cached["metadata"] is True
+        assert cached["metadata_value"] == {"title": "Song"}
+        assert cached["url_value"] == "https://example.com/a.webm"
+        assert cached["url_expires_at"] == 1700000000
+        assert cached["metadata_timestamp"] is None
+        assert cached["url_timestamp"] is None
@@ -13,10 +13,13 @@ from app.core.exceptions import (
     CircuitBreakerError,
     ValidationError,
 )
-from tests.conftest import MockWatchService, MockStreamService
+from tests.conftest import create_mock_watch_service, create_mock_stream_service
 from app.api.v1.endpoints.watch import get_watch_service, get_stream_service
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 @pytest.fixture(autouse=True)
 def patch_redis():
     redis_mock = AsyncMock()
@@ -45,79 +48,79 @@ def clear_overrides():
 class TestWatchEndpointExceptionPassthrough:
 
     def test_watch_service_exception_404_not_found(self):
-        mock_service = MockWatchService()
-        mock_service._get_watch_playlist_side_effect = ResourceNotFoundError(
+        mock_service = create_mock_watch_service()
+        mock_service.get_watch_playlist.side_effect = ResourceNotFoundError(
             message="Video no encontrado.",
             details={"resource_type": "video", "video_id": "invalid"}
         )
         app.dependency_overrides[get_watch_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/watch/?video_id=invalid")
         assert response.status_code == 404
 
     def test_watch_service_exception_401_auth(self):
-        mock_service = MockWatchService()
-        mock_service._get_watch_playlist_side_effect = AuthenticationError(
+        mock_service = create_mock_watch_service()
+        mock_service.get_watch_playlist.side_effect = AuthenticationError(
             message="Error de autenticación.",
             details={"operation": "get_watch_playlist"}
         )
         app.dependency_overrides[get_watch_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/watch/?video_id=abc123")
         assert response.status_code == 401
 
     def test_watch_service_exception_429_rate_limit(self):
-        mock_service = MockWatchService()
-        mock_service._get_watch_playlist_side_effect = RateLimitError(
+        mock_service = create_mock_watch_service()
+        mock_service.get_watch_playlist.side_effect = RateLimitError(
             message="Rate limit exceeded.",
             details={"retry_after": 300}
         )
         app.dependency_overrides[get_watch_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/watch/?video_id=abc123")
         assert response.status_code == 429
 
     def test_watch_service_exception_502_external(self):
-        mock_service = MockWatchService()
-        mock_service._get_watch_playlist_side_effect = ExternalServiceError(
+        mock_service = create_mock_watch_service()
+        mock_service.get_watch_playlist.side_effect = ExternalServiceError(
             message="Error en YouTube Music.",
             details={"operation": "get_watch_playlist"}
         )
         app.dependency_overrides[get_watch_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/watch/?video_id=abc123")
         assert response.status_code == 502
 
     def test_watch_service_exception_503_circuit_breaker(self):
-        mock_service = MockWatchService()
-        mock_service._get_watch_playlist_side_effect = CircuitBreakerError(
+        mock_service = create_mock_watch_service()
+        mock_service.get_watch_playlist.side_effect = CircuitBreakerError(
             message="Servicio no disponible.",
             details={"retry_after": 60, "state": "OPEN"}
         )
         app.dependency_overrides[get_watch_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/watch/?video_id=abc123")
         assert response.status_code == 503
 
     def test_watch_generic_exception_returns_500(self):
-        mock_service = MockWatchService()
-        mock_service._get_watch_playlist_side_effect = RuntimeError("unexpected boom")
+        mock_service = create_mock_watch_service()
+        mock_service.get_watch_playlist.side_effect = RuntimeError("unexpected boom")
         app.dependency_overrides[get_watch_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/watch/?video_id=abc123")
         assert response.status_code == 500
 
     def test_watch_success_returns_200(self):
-        mock_service = MockWatchService()
-        mock_service._get_watch_playlist_return = {"tracks": [{"videoId": "abc"}]}
+        mock_service = create_mock_watch_service()
+        mock_service.get_watch_playlist.return_value = {"tracks": [{"videoId": "abc"}]}
         app.dependency_overrides[get_watch_service] = lambda: mock_service
-        app.dependency_overrides[get_stream_service] = lambda: MockStreamService()
+        app.dependency_overrides[get_stream_service] = lambda: create_mock_stream_service()
         with TestClient(app) as client:
             response = client.get("/api/v1/watch/?video_id=abc123&include_stream_urls=false")
         assert response.status_code == 200
@@ -6,6 +6,9 @@ from app.services.watch_service import WatchService
 from app.core.exceptions import RateLimitError, AuthenticationError
 
 
+pytestmark = pytest.mark.uses_cache
+
+
 @pytest.mark.asyncio
 class TestWatchService:
     """Test cases for WatchService class."""